@@ -0,0 +1 @@
+"""Stand-alone performance benchmarks for the Atrea aMotion integration."""
@@ -0,0 +1,284 @@
+"""Micro-benchmarks for the inbound websocket message path.
+
+Each scenario feeds a raw frame through ``on_message`` so the measurement covers
+``json.loads``, ``_handle_message_on_loop``, ``_process_message``, the matching
+``_apply_*`` handler, ``_refresh_derived_state`` and
+``_build_active_notifications``.
+
+Run ``python -m benchmarks.inbound`` to compare against ``baseline.json`` and
+``python -m benchmarks.inbound --save`` to record a new baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import copy
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.atrea_amotion import AtreaAMotionCoordinator
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+PAYLOADS_PATH = Path(__file__).parent.parent / "tests" / "fixtures" / "amotion_unit.json"
+TRANSLATIONS_PATH = (
+    Path(__file__).parent.parent
+    / "custom_components"
+    / "atrea_amotion"
+    / "translations"
+    / "en.json"
+)
+ACTIVE_STATE_COUNTS = (0, 5, 50)
+DEFAULT_ITERATIONS = 2000
+DEFAULT_REPEATS = 5
+REGRESSION_THRESHOLD = 0.25
+
+
+def load_payloads() -> dict[str, Any]:
+    """Load the recorded unit payloads shared with the simulator."""
+    return json.loads(PAYLOADS_PATH.read_text(encoding="utf-8"))
+
+
+def build_base_states(count: int) -> list[dict[str, Any]]:
+    """Build ``count`` base states using real translated state codes."""
+    codes = sorted(
+        json.loads(TRANSLATIONS_PATH.read_text(encoding="utf-8"))["state_messages"]
+    )
+    return [
+        {
+            "id": index + 1,
+            "purpose": "alarm_sr" if index % 4 == 0 else "notify",
+            "severity": 5 if index % 4 == 0 else 1 + index % 4,
+            "type": codes[index % len(codes)],
+        }
+        for index in range(count)
+    ]
+
+
+def active_states_payload(count: int) -> dict[str, dict[str, Any]]:
+    """Return a ``states.active`` mapping with ``count`` active states."""
+    return {
+        str(index + 1): {"active": True, "name": f"STATE_{index + 1}"}
+        for index in range(count)
+    }
+
+
+def build_coordinator(payloads: dict[str, Any]) -> AtreaAMotionCoordinator:
+    """Create an authorized coordinator primed with recorded metadata and no transport."""
+    hass = SimpleNamespace(
+        config=SimpleNamespace(language="en"),
+        add_job=lambda *args: None,
+    )
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="unknown",
+    )
+    coordinator._login_msg_id = 1
+    coordinator._token_msg_id = 2
+    coordinator._authorized = True
+    coordinator._msg_id = 2
+    scheme = copy.deepcopy(payloads["ui_diagram_scheme"])
+    scheme["baseStates"] = build_base_states(max(ACTIVE_STATE_COUNTS))
+    coordinator._apply_control_scheme(payloads["ui_control_scheme"])
+    coordinator._apply_diagram_scheme(scheme)
+    coordinator._apply_user_config(payloads["user_config_get"])
+    coordinator._apply_moments(payloads["control_admin/config/moments/get"]["get"])
+    coordinator._apply_ui_info(payloads["ui_info"])
+    return coordinator
+
+
+def build_scenarios(
+    payloads: dict[str, Any],
+) -> dict[str, tuple[AtreaAMotionCoordinator, Callable[[], None]]]:
+    """Return named scenarios mapped to a coordinator and a one-message callable."""
+    scenarios: dict[str, tuple[AtreaAMotionCoordinator, Callable[[], None]]] = {}
+
+    for count in ACTIVE_STATE_COUNTS:
+        coordinator = build_coordinator(payloads)
+        ui_info = copy.deepcopy(payloads["ui_info"])
+        ui_info["states"]["active"] = active_states_payload(count)
+        frame = json.dumps({"event": "ui_info", "args": ui_info, "type": "event"})
+        scenarios[f"ui_info_event_active_{count}"] = (
+            coordinator,
+            _frame_feeder(coordinator, frame),
+        )
+
+        coordinator = build_coordinator(payloads)
+        coordinator._apply_ui_info(ui_info)
+        frame_id = 1_000_000
+        frame = json.dumps(
+            {
+                "id": frame_id,
+                "code": "OK",
+                "response": payloads["ui_diagram_data"],
+                "type": "response",
+            }
+        )
+        scenarios[f"ui_diagram_data_response_active_{count}"] = (
+            coordinator,
+            _tracked_frame_feeder(coordinator, frame, frame_id, "ui_diagram_data"),
+        )
+
+        coordinator = build_coordinator(payloads)
+        coordinator._apply_ui_info(ui_info)
+        frame = json.dumps(
+            {
+                "event": "control_panel",
+                "args": payloads["control_panel"]["control_panel"],
+                "type": "event",
+            }
+        )
+        scenarios[f"control_panel_event_active_{count}"] = (
+            coordinator,
+            _frame_feeder(coordinator, frame),
+        )
+
+    return scenarios
+
+
+def _frame_feeder(coordinator: AtreaAMotionCoordinator, frame: str) -> Callable[[], None]:
+    """Return a callable that feeds one event frame."""
+
+    def _feed() -> None:
+        coordinator.on_message(None, frame)
+
+    return _feed
+
+
+def _tracked_frame_feeder(
+    coordinator: AtreaAMotionCoordinator, frame: str, frame_id: int, endpoint: str
+) -> Callable[[], None]:
+    """Return a callable that feeds one response frame for a tracked request."""
+    in_flight = coordinator._in_flight
+
+    def _feed() -> None:
+        in_flight.add(frame_id, endpoint)
+        coordinator.on_message(None, frame)
+
+    return _feed
+
+
+def measure(feed: Callable[[], None], iterations: int, repeats: int) -> dict[str, float]:
+    """Measure per-message time and allocations for one scenario."""
+    for _ in range(min(iterations, 100)):
+        feed()
+
+    timings: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            feed()
+        timings.append((time.perf_counter_ns() - start) / iterations)
+
+    alloc_iterations = max(1, iterations // 10)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    for _ in range(alloc_iterations):
+        feed()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename") if stat.size_diff > 0
+    )
+
+    return {
+        "ns_per_message": round(statistics.median(timings), 1),
+        "ns_per_message_min": round(min(timings), 1),
+        "retained_bytes_per_message": round(allocated / alloc_iterations, 1),
+        "peak_bytes": peak,
+    }
+
+
+def run(iterations: int, repeats: int, only: str | None = None) -> dict[str, dict[str, float]]:
+    """Run every scenario and return the results."""
+    results: dict[str, dict[str, float]] = {}
+    for name, (_, feed) in build_scenarios(load_payloads()).items():
+        if only and only not in name:
+            continue
+        results[name] = measure(feed, iterations, repeats)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> list[str]:
+    """Return human-readable regressions beyond ``threshold``."""
+    regressions: list[str] = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference.get("ns_per_message"):
+            continue
+        ratio = result["ns_per_message"] / reference["ns_per_message"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {result['ns_per_message']:.0f} ns vs "
+                f"{reference['ns_per_message']:.0f} ns baseline ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--only", default=None, help="run scenarios containing this text")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write results as the baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run(args.iterations, args.repeats, args.only)
+    width = max(len(name) for name in results)
+    for name, result in results.items():
+        print(
+            f"{name:<{width}}  {result['ns_per_message']:>10.0f} ns/msg"
+            f"  {result['retained_bytes_per_message']:>8.0f} B/msg retained"
+            f"  {result['peak_bytes']:>9} B peak"
+        )
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "iterations": args.iterations,
+                    "results": results,
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Replay a recorded websocket capture through an offline coordinator.
+
+Record a capture with the ``atrea_amotion.start_capture`` and
+``atrea_amotion.stop_capture`` services, then run
+``python -m benchmarks.replay capture.jsonl`` to feed it as fast as possible or
+``--speed 1`` to keep the captured timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.atrea_amotion import AtreaAMotionCoordinator
+from custom_components.atrea_amotion.capture import (
+    AtreaCapturedFrame,
+    AtreaReplayStats,
+    async_replay,
+    read_capture,
+)
+
+
+def build_offline_coordinator() -> AtreaAMotionCoordinator:
+    """Create a coordinator whose own requests are dropped instead of sent."""
+    hass = SimpleNamespace(
+        config=SimpleNamespace(language="en"),
+        add_job=lambda *args: None,
+    )
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="unknown",
+    )
+
+    async def _discard(payload: dict[str, Any]) -> bool:
+        return True
+
+    coordinator.publish_wss = _discard  # type: ignore[method-assign]
+    return coordinator
+
+
+async def replay(
+    frames: list[AtreaCapturedFrame], speed: float | None = None
+) -> tuple[AtreaAMotionCoordinator, AtreaReplayStats]:
+    """Replay frames into a fresh coordinator and shut it down afterwards."""
+    coordinator = build_offline_coordinator()
+    try:
+        stats = await async_replay(coordinator, frames, speed)
+        await asyncio.sleep(0)
+    finally:
+        await coordinator.async_shutdown()
+    return coordinator, stats
+
+
+def main() -> int:
+    """Replay a capture from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--speed", type=float, default=None, help="scale captured timing")
+    args = parser.parse_args()
+
+    frames = read_capture(args.capture)
+    _, stats = asyncio.run(replay(frames, args.speed))
+    rate = stats.frames_in / stats.elapsed if stats.elapsed else 0.0
+    print(
+        f"{stats.frames_in} inbound / {stats.frames_out} outbound frames"
+        f" ({stats.invalid} invalid) in {stats.elapsed:.3f} s, {rate:.0f} inbound frames/s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
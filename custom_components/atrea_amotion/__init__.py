@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import copy
 import logging
-import threading
+from collections.abc import Callable, Coroutine, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import timedelta
+from pathlib import Path
 from time import monotonic
 from typing import Any
 
-import websocket
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_HOST,
@@ -22,18 +22,88 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import Throttle
 
-from .const import API_TIMEOUT, CONF_DEBUG_LOGGING, DOMAIN, LOGGER
+from .cache import AtreaCapabilityCache, async_get_capability_cache
+from .capture import AtreaCaptureRecorder
+from .codec import (
+    AtreaCodec,
+    AtreaControlPanel,
+    AtreaDiagramData,
+    AtreaMoments,
+    AtreaUiInfo,
+    default_codec,
+)
+from .const import (
+    ALL_FIELDS,
+    API_TIMEOUT,
+    CONF_DEBUG_LOGGING,
+    DISCOVERY_FIELD,
+    DOMAIN,
+    LOGGER,
+    MOMENTS_ENDPOINT,
+)
 from .discovery import async_rediscover_config_entry
-from .state_messages import hass_language, translate_state_message, translation_key_for
+from .flight_recorder import FRAME_IN, FRAME_OUT, AtreaFlightRecorder
+from .inflight import AtreaInFlightStats, AtreaInFlightTracker, next_message_id
+from .optimistic import AtreaOptimisticLedger
+from .services import async_setup_services
+from .state_messages import (
+    async_prepare_state_messages,
+    hass_language,
+    translate_state_message,
+    translation_key_for,
+)
+from .store import AtreaFieldStore
+from .telemetry import TELEMETRY_WINDOW, AtreaRollingStats, AtreaTelemetryHistory
+from .transport import AtreaWebsocketTransport
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=15)
 PERIODIC_REFRESH_INTERVAL = 15
-CONTROL_BURST_REFRESH_INTERVAL = 1
-CONTROL_BURST_REFRESH_CYCLES = 20
+POLL_INTERVAL_MIN = 5
+POLL_INTERVAL_MAX = 60
+POLL_BACKOFF_FACTOR = 1.5
+# Numeric source fields must move this far from the last counted value before
+# the poll interval treats the unit as changing, so sensor jitter is ignored.
+POLL_CHANGE_TOLERANCE = 0.5
+# Seconds before each burst refresh after a control; the last delay repeats up to the cap.
+CONTROL_BURST_BACKOFF = (1, 1, 2, 3, 5, 8)
+CONTROL_BURST_REFRESH_CYCLES = 8
+# Unit modes that mean a control is still being applied even if requests match.
+CONTROL_TRANSIENT_MODES = frozenset({"STARTUP"})
+CONTROL_ECHO_SOURCES = ("ui_info", "control_panel")
+CONTROL_COALESCE_SECONDS = 0.05
 STATE_DISPATCH_DEBOUNCE_SECONDS = 1.0
+HEAT_RECOVERY_MIN_DELTA = 3.0
+FAN_RATED_POWER_W = 100.0
+FAN_ENERGY_MAX_GAP = 600
+FAN_ENERGY_INTEGRATION_INTERVAL = 300
+BOOTSTRAP_TIMEOUT = 10
+OUTBOUND_QUEUE_SIZE = 256
+
+BOOTSTRAP_ENDPOINTS = (
+    "discovery",
+    "ui_control_scheme",
+    "user_config_get",
+    "ui_diagram_scheme",
+    "ui_info",
+    "ui_diagram_data",
+    MOMENTS_ENDPOINT,
+    "modbus",
+    "update",
+    "control_panel",
+)
+CAPABILITY_ENDPOINTS = ("ui_control_scheme", "ui_diagram_scheme")
+# Entity creation depends on capabilities only; everything else fills in afterwards.
+SETUP_ENDPOINTS = ("ui_control_scheme",)
+
+REFRESH_TIMER = "timer"
+REFRESH_CONTROL_BURST = "control_burst"
+MOMENTS_RESET_ENDPOINT = "control_admin/config/moments/reset/filter"
 
 SOCK_CONNECTED = "Open"
 SOCK_DISCONNECTED = "Close"
@@ -51,6 +121,7 @@ PLATFORMS = [
     Platform.SWITCH,
     Platform.TEXT,
 ]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 @dataclass(slots=True)
@@ -94,15 +165,47 @@ class AtreaCapabilities:
         """Return enum values for a variable."""
         return self.enum_values.get(variable, [])
 
+    def as_storage(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy for the capability cache."""
+        return {
+            "requests": sorted(self.requests),
+            "config_fields": sorted(self.config_fields),
+            "unit_fields": sorted(self.unit_fields),
+            "state_fields": sorted(self.state_fields),
+            "enum_values": self.enum_values,
+            "range_types": self.range_types,
+            "diagram_components": self.diagram_components,
+            "base_states": list(self.base_states.values()),
+        }
+
+    @classmethod
+    def from_storage(cls, data: dict[str, Any]) -> AtreaCapabilities:
+        """Rebuild capabilities saved with as_storage without sharing the cached objects."""
+        data = copy.deepcopy(data)
+        return cls(
+            requests=set(data.get("requests", [])),
+            config_fields=set(data.get("config_fields", [])),
+            unit_fields=set(data.get("unit_fields", [])),
+            state_fields=set(data.get("state_fields", [])),
+            enum_values=data.get("enum_values", {}),
+            range_types=data.get("range_types", {}),
+            diagram_components=data.get("diagram_components", {}),
+            base_states={
+                item["id"]: item
+                for item in data.get("base_states", [])
+                if isinstance(item, dict) and isinstance(item.get("id"), int)
+            },
+        )
+
 
 @dataclass(slots=True)
 class AtreaState:
     """Current unit state."""
 
     discovery: dict[str, Any] = field(default_factory=dict)
-    requests: dict[str, Any] = field(default_factory=dict)
-    config: dict[str, Any] = field(default_factory=dict)
-    unit: dict[str, Any] = field(default_factory=dict)
+    requests: AtreaFieldStore = field(default_factory=AtreaFieldStore)
+    config: AtreaFieldStore = field(default_factory=AtreaFieldStore)
+    unit: AtreaFieldStore = field(default_factory=AtreaFieldStore)
     active_states: dict[str, Any] = field(default_factory=dict)
     derived: dict[str, Any] = field(default_factory=dict)
     control_panel: dict[str, Any] = field(default_factory=dict)
@@ -113,11 +216,197 @@ class AtreaState:
     update: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class AtreaNotification:
+    """One active unit state resolved into a localized card notification."""
+
+    id: int | str
+    code: str | None
+    purpose: str | None
+    severity: int | None
+    kind: str
+    prefix: str
+    translation_key: str | None
+    message: str
+    message_code: str
+    full_message: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the attribute payload exposed to entities and cards."""
+        return {
+            "id": self.id,
+            "code": self.code,
+            "purpose": self.purpose,
+            "severity": self.severity,
+            "kind": self.kind,
+            "prefix": self.prefix,
+            "translation_key": self.translation_key,
+            "message": self.message,
+            "message_code": self.message_code,
+            "full_message": self.full_message,
+            "active": True,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaDerivedGroup:
+    """Derived values rebuilt only when one of their source buckets changes.
+
+    Groups listing ``fields`` are also skipped when the caller knows which
+    bucket keys changed and none of them is an input.
+    """
+
+    sources: frozenset[str]
+    builder: str
+    fields: frozenset[str] = frozenset()
+
+
+DERIVED_GROUPS: tuple[AtreaDerivedGroup, ...] = (
+    AtreaDerivedGroup(frozenset({"ui_diagram_data"}), "_derive_diagram"),
+    AtreaDerivedGroup(frozenset({"moments"}), "_derive_moments"),
+    AtreaDerivedGroup(frozenset({"moments", "ui_diagram_data"}), "_derive_motor_roles"),
+    AtreaDerivedGroup(frozenset({"active_states"}), "_derive_active_states"),
+    AtreaDerivedGroup(
+        frozenset({"unit"}),
+        "_derive_heat_recovery",
+        frozenset({"temp_oda", "temp_sup", "temp_eta"}),
+    ),
+    AtreaDerivedGroup(
+        frozenset({"unit", REFRESH_TIMER}),
+        "_derive_fan_energy",
+        frozenset({"fan_sup_factor", "fan_eta_factor"}),
+    ),
+    AtreaDerivedGroup(frozenset({"active_states", "base_states"}), "_derive_notifications"),
+    AtreaDerivedGroup(frozenset({"control_panel"}), "_derive_control_panel"),
+    AtreaDerivedGroup(frozenset({"config"}), "_derive_config"),
+    AtreaDerivedGroup(frozenset({"modbus"}), "_derive_modbus"),
+    AtreaDerivedGroup(frozenset({"update"}), "_derive_update"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaRefreshPolicy:
+    """How and when one read endpoint is refreshed after bootstrap.
+
+    ``ttl`` is the data age in seconds after which the timer polls the endpoint;
+    ``None`` follows the adaptive poll interval. ``triggers`` are ``REFRESH_TIMER``,
+    ``REFRESH_CONTROL_BURST``, pushed event names or write endpoints whose success
+    should refresh this endpoint. Lower priorities are requested first.
+    """
+
+    endpoint: str
+    ttl: float | None
+    triggers: frozenset[str]
+    priority: int
+
+
+REFRESH_POLICIES: tuple[AtreaRefreshPolicy, ...] = (
+    AtreaRefreshPolicy(
+        "ui_info",
+        None,
+        frozenset({REFRESH_TIMER, REFRESH_CONTROL_BURST, "control", MOMENTS_RESET_ENDPOINT}),
+        0,
+    ),
+    AtreaRefreshPolicy(
+        "control_panel", None, frozenset({REFRESH_TIMER, REFRESH_CONTROL_BURST, "control"}), 1
+    ),
+    AtreaRefreshPolicy("ui_diagram_data", None, frozenset({REFRESH_TIMER, REFRESH_CONTROL_BURST}), 2),
+    AtreaRefreshPolicy("user_config_get", 300, frozenset({REFRESH_TIMER, "config"}), 3),
+    AtreaRefreshPolicy(
+        MOMENTS_ENDPOINT, 3600, frozenset({REFRESH_TIMER, MOMENTS_RESET_ENDPOINT}), 4
+    ),
+    AtreaRefreshPolicy("modbus", 3600, frozenset({REFRESH_TIMER, "modbus/set"}), 5),
+    AtreaRefreshPolicy("update", 21600, frozenset({REFRESH_TIMER, "update/set"}), 5),
+    AtreaRefreshPolicy("discovery", 86400, frozenset({REFRESH_TIMER, "unit/set", "unit_config"}), 6),
+    AtreaRefreshPolicy("ui_diagram_scheme", 86400, frozenset({REFRESH_TIMER, "unit_config"}), 6),
+)
+
+REFRESH_TRIGGERS: dict[str, tuple[AtreaRefreshPolicy, ...]] = {
+    trigger: tuple(
+        sorted(
+            (policy for policy in REFRESH_POLICIES if trigger in policy.triggers),
+            key=lambda policy: policy.priority,
+        )
+    )
+    for trigger in set().union(*(policy.triggers for policy in REFRESH_POLICIES))
+}
+
+
+@dataclass(slots=True)
+class AtreaOutboundStats:
+    """Counters for the outbound websocket queue."""
+
+    frames_sent: int = 0
+    frames_failed: int = 0
+    frames_coalesced: int = 0
+    controls_coalesced: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+
+
+CONFIG_APPLIED = "applied"
+CONFIG_INVALID = "invalid"
+CONFIG_REJECTED = "rejected"
+CONFIG_NOT_CONFIRMED = "not_confirmed"
+SEASON_CONFIG_KEYS = ("season_request", "season_switch_temp", "temp_oda_mean_interval")
+AUTO_SEASON_REQUESTS = frozenset({"AUTO_TODA", "AUTO_TODA_RATIO"})
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaConfigWriteResult:
+    """Outcome of one key in a config write."""
+
+    status: str
+    detail: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == CONFIG_APPLIED
+
+
+@dataclass(slots=True)
+class AtreaPollStats:
+    """Counters for the adaptive polling scheduler."""
+
+    interval: float = PERIODIC_REFRESH_INTERVAL
+    requests: dict[str, int] = field(default_factory=dict)
+    polled: dict[str, int] = field(default_factory=dict)
+    skipped: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def skip_ratio(self) -> float:
+        """Return the share of scheduled polls answered by recent pushes."""
+        skipped = sum(self.skipped.values())
+        total = skipped + sum(self.polled.values())
+        return skipped / total if total else 0.0
+
+
+@dataclass(slots=True)
+class _OutboundFrame:
+    """One queued websocket request awaiting the writer task."""
+
+    message_id: int
+    endpoint: str
+    payload: dict[str, Any]
+    future: asyncio.Future[bool]
+    coalescable: bool
+    queued_at: float
+    followers: list[_OutboundFrame] = field(default_factory=list)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the integration services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from a config entry."""
     try:
         _apply_logger_options(entry)
-        atrea = await _async_build_coordinator(hass, entry.data)
+        atrea = await _async_build_coordinator(hass, entry.data, entry.entry_id)
         await atrea.async_initialize()
     except Exception as err:
         rediscovered = await async_rediscover_config_entry(hass, entry.data)
@@ -144,7 +433,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
         try:
-            atrea = await _async_build_coordinator(hass, updated_data)
+            atrea = await _async_build_coordinator(hass, updated_data, entry.entry_id)
             await atrea.async_initialize()
         except Exception as rediscovery_err:
             raise ConfigEntryNotReady from rediscovery_err
@@ -187,6 +476,7 @@ def _apply_logger_options(entry: ConfigEntry) -> None:
 async def _async_build_coordinator(
     hass: HomeAssistant,
     entry_data: dict[str, Any],
+    entry_id: str | None = None,
 ) -> "AtreaAMotionCoordinator":
     """Create a coordinator from config entry data."""
     return AtreaAMotionCoordinator(
@@ -197,6 +487,9 @@ async def _async_build_coordinator(
         password=entry_data[CONF_PASSWORD],
         model=entry_data.get("model", "aMotion"),
         version=entry_data.get("version", "unknown"),
+        board_number=entry_data.get("board_number"),
+        capability_cache=async_get_capability_cache(hass),
+        entry_id=entry_id,
     )
 
 
@@ -212,8 +505,21 @@ class AtreaAMotionCoordinator:
         password: str,
         model: str,
         version: str,
+        codec: AtreaCodec | None = None,
+        board_number: str | None = None,
+        capability_cache: AtreaCapabilityCache | None = None,
+        entry_id: str | None = None,
     ) -> None:
         self.hass = hass
+        self.entry_id = entry_id
+        self.codec = codec or default_codec()
+        self.board_number = board_number
+        self._capability_cache = capability_cache
+        self._capabilities_version: str | None = None
+        self._capabilities_unsaved = False
+        self._restored_capabilities: dict[str, Any] | None = None
+        self._background_tasks: set[asyncio.Task[Any]] = set()
+        self._initialized = False
         self.name = name
         self.host = host
         self.username = username
@@ -234,22 +540,56 @@ class AtreaAMotionCoordinator:
         self._user_config_ready = asyncio.Event()
         self._diagram_ready = asyncio.Event()
         self._moments_ready = asyncio.Event()
+        self._bootstrap_events = {
+            "discovery": self._discovery_ready,
+            "ui_control_scheme": self._control_scheme_ready,
+            "ui_info": self._ui_info_ready,
+            "user_config_get": self._user_config_ready,
+            "ui_diagram_data": self._diagram_ready,
+            MOMENTS_ENDPOINT: self._moments_ready,
+        }
+        self._endpoint_ready = {
+            endpoint: self._bootstrap_events.get(endpoint) or asyncio.Event()
+            for endpoint in BOOTSTRAP_ENDPOINTS
+        }
         self._shutdown = False
-        self._thread: threading.Thread | None = None
         self._refresh_task: asyncio.Task | None = None
         self._control_burst_task: asyncio.Task | None = None
+        self._control_targets: dict[str, Any] = {}
+        self._echo_counts = dict.fromkeys(CONTROL_ECHO_SOURCES, 0)
+        self._control_echo_marks = dict(self._echo_counts)
+        self._control_batch: tuple[dict[str, Any], asyncio.Future[bool]] | None = None
+        self._control_flush_task: asyncio.Task | None = None
+        self.optimistic = AtreaOptimisticLedger()
+        self._optimistic_handle: asyncio.TimerHandle | None = None
         self._dispatch_pending = False
-        self._dispatch_lock = threading.Lock()
         self._dispatch_handle: asyncio.TimerHandle | None = None
-        self.ws: websocket.WebSocketApp | None = None
+        self._pending_changes: set[str] = set()
+        self._field_listeners: dict[str, set[Callable[[], None]]] = {}
+        self.ws: AtreaWebsocketTransport | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._lock = asyncio.Lock()
-        self._pending_requests: dict[int, str] = {}
+        self._outbound: asyncio.Queue[_OutboundFrame] = asyncio.Queue(OUTBOUND_QUEUE_SIZE)
+        self._writer_task: asyncio.Task | None = None
+        self.outbound_stats = AtreaOutboundStats()
+        self.poll_stats = AtreaPollStats()
+        self._last_fresh: dict[str, float] = {}
+        self._last_change_at = 0.0
+        self._last_poll_at = 0.0
+        self._poll_baseline: dict[tuple[str, str], Any] = {}
+        self._in_flight = AtreaInFlightTracker()
+        self.flight_recorder = AtreaFlightRecorder()
+        self.capture: AtreaCaptureRecorder | None = None
         self._response_waiters: dict[int, asyncio.Future[dict[str, Any]]] = {}
         self._last_message_at = monotonic()
 
+        self.telemetry = AtreaTelemetryHistory()
+        self._fan_energy_wh = 0.0
+        self._fan_power_sample: tuple[float, float] | None = None
+        self._base_states_version = 0
+        self._notifications_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
         self.capabilities = AtreaCapabilities()
         self.state = AtreaState(discovery={"type": model, "version": version, "name": name})
+        self._refresh_derived_state()
 
     @property
     def model(self) -> str:
@@ -267,29 +607,169 @@ class AtreaAMotionCoordinator:
     def update_signal(self) -> str:
         return f"{DOMAIN}_{self.host}_update"
 
+    @property
+    def in_flight_stats(self) -> AtreaInFlightStats:
+        return self._in_flight.stats
+
+    def async_add_field_listener(
+        self, keys: Iterable[str], listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call listener when any of the given state keys change; return an unsubscribe.
+
+        Keys are the names passed to value()/requested_value(), ``DISCOVERY_FIELD``
+        for unit metadata or ``ALL_FIELDS`` for every change.
+        """
+        watched = tuple(dict.fromkeys(keys))
+        for key in watched:
+            self._field_listeners.setdefault(key, set()).add(listener)
+
+        def _unsubscribe() -> None:
+            for key in watched:
+                listeners = self._field_listeners.get(key)
+                if listeners is None:
+                    continue
+                listeners.discard(listener)
+                if not listeners:
+                    del self._field_listeners[key]
+
+        return _unsubscribe
+
     async def async_initialize(self) -> None:
         """Open websocket, authenticate, and load initial metadata."""
         self._loop = asyncio.get_running_loop()
+        await async_prepare_state_messages(self.hass)
+        await self._async_restore_capabilities()
         if not await self.connect_wss():
             raise ConfigEntryNotReady("Unable to connect to websocket")
 
-        await self.async_request("discovery")
-        await self.async_request("ui_control_scheme")
-        await self.async_request("user_config_get")
-        await self.async_request("ui_diagram_scheme")
-        await self.async_request("ui_info")
-        await self.async_request("ui_diagram_data")
-        await self.async_request("control_admin/config/moments/get")
-        await self.async_request("modbus")
-        await self.async_request("update")
-        await self.async_request("control_panel")
-        await asyncio.wait_for(self._discovery_ready.wait(), timeout=10)
-        await asyncio.wait_for(self._control_scheme_ready.wait(), timeout=10)
-        await asyncio.wait_for(self._ui_info_ready.wait(), timeout=10)
-        await asyncio.wait_for(self._user_config_ready.wait(), timeout=10)
-        await asyncio.wait_for(self._diagram_ready.wait(), timeout=10)
-        await asyncio.wait_for(self._moments_ready.wait(), timeout=10)
+        missing = await self.async_bootstrap(required=SETUP_ENDPOINTS)
+        if missing:
+            raise ConfigEntryNotReady(
+                f"No response from {self.host} for: {', '.join(missing)}"
+            )
         self._ensure_refresh_task()
+        self._initialized = True
+        if self._restored_capabilities is not None:
+            self._create_background_task(self._async_check_restored_capabilities())
+
+    async def async_bootstrap(
+        self, timeout: float = BOOTSTRAP_TIMEOUT, required: Iterable[str] | None = None
+    ) -> list[str]:
+        """Queue all metadata requests in one burst and await readiness under one deadline.
+
+        Only the required endpoints (every readiness endpoint by default) are awaited;
+        the others keep filling in afterwards. Returns the ones that did not answer in time.
+        """
+        skipped = CAPABILITY_ENDPOINTS if self._capabilities_version is not None else ()
+        results = await self._async_send_requests(
+            [(endpoint, None) for endpoint in BOOTSTRAP_ENDPOINTS if endpoint not in skipped]
+        )
+        for message_id, success in results:
+            if not success:
+                self._in_flight.discard(message_id)
+
+        missing = await self.async_wait_ready(
+            self._bootstrap_events if required is None else required, timeout
+        )
+        if missing:
+            LOGGER.warning("Bootstrap of %s missing responses for: %s", self.host, ", ".join(missing))
+        return missing
+
+    def endpoints_ready(self, endpoints: Iterable[str]) -> bool:
+        """Return whether every given endpoint has delivered data at least once."""
+        return all(self._endpoint_ready[endpoint].is_set() for endpoint in endpoints)
+
+    async def async_wait_ready(
+        self, endpoints: Iterable[str], timeout: float = BOOTSTRAP_TIMEOUT
+    ) -> list[str]:
+        """Wait until the given endpoints delivered data and return those that did not."""
+        events = {endpoint: self._endpoint_ready[endpoint] for endpoint in endpoints}
+        waiters = [asyncio.create_task(event.wait()) for event in events.values() if not event.is_set()]
+        if waiters:
+            _, pending = await asyncio.wait(waiters, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return [endpoint for endpoint, event in events.items() if not event.is_set()]
+
+    async def _async_restore_capabilities(self) -> None:
+        """Load capabilities cached for this board so setup can skip the schemes.
+
+        The entry's firmware version is not updated after upgrades, so the cached
+        version is kept and checked against the live discovery response instead.
+        """
+        if self._capability_cache is None or not self.board_number:
+            return
+        cached = await self._capability_cache.async_get_latest(self.board_number)
+        if cached is None:
+            return
+        version, capabilities = cached
+        self.capabilities = AtreaCapabilities.from_storage(capabilities)
+        self._reserve_state_fields()
+        self._base_states_version += 1
+        self._capabilities_version = version
+        self._restored_capabilities = self.capabilities.as_storage()
+        self._control_scheme_ready.set()
+        restored_at = monotonic()
+        for endpoint in CAPABILITY_ENDPOINTS:
+            self._last_fresh[endpoint] = restored_at
+            self._endpoint_ready[endpoint].set()
+        LOGGER.debug("Restored capabilities of %s for firmware %s", self.host, version)
+        self._notify_state_changed({ALL_FIELDS} | self._refresh_derived_state("base_states"))
+
+    async def _async_check_restored_capabilities(self) -> None:
+        """Refetch the schemes skipped at setup once the remaining bootstrap has answered."""
+        await self.async_wait_ready(self._bootstrap_events)
+        results = await self._async_send_requests(
+            [(endpoint, None) for endpoint in CAPABILITY_ENDPOINTS]
+        )
+        for message_id, success in results:
+            if not success:
+                self._in_flight.discard(message_id)
+
+    def _compare_restored_capabilities(self) -> None:
+        """Reload the entry when refetched schemes differ from the cached ones.
+
+        Entities were created from the restored capabilities, so only a reload
+        picks up added or removed fields. Before setup finished nothing was built yet.
+        """
+        restored = self._restored_capabilities
+        if restored is None or self.capabilities.as_storage() == restored:
+            return
+        self._restored_capabilities = None
+        if not self._initialized or self.entry_id is None:
+            return
+        LOGGER.info("Capabilities of %s changed since they were cached, reloading", self.host)
+        self.hass.config_entries.async_schedule_reload(self.entry_id)
+
+    def _cache_capabilities(self) -> None:
+        """Persist the current capabilities for the firmware they were fetched from.
+
+        The firmware version comes from discovery, so saving waits until it answered.
+        """
+        self._compare_restored_capabilities()
+        if not self._discovery_ready.is_set():
+            self._capabilities_unsaved = True
+            return
+        self._capabilities_unsaved = False
+        self._capabilities_version = self.version
+        if self._capability_cache is None or not self.board_number:
+            return
+        self._capability_cache.async_set(
+            self.board_number, self.version, self.capabilities.as_storage()
+        )
+
+    def start_capture(self) -> AtreaCaptureRecorder:
+        """Start recording websocket traffic for offline replay."""
+        self.capture = AtreaCaptureRecorder()
+        return self.capture
+
+    async def async_stop_capture(self, path: str) -> int:
+        """Stop recording, write the capture to path and return its frame count."""
+        capture, self.capture = self.capture, None
+        if capture is None:
+            return 0
+        return await self.hass.async_add_executor_job(capture.write, Path(path))
 
     async def async_shutdown(self) -> None:
         """Stop the websocket connection."""
@@ -297,11 +777,26 @@ class AtreaAMotionCoordinator:
         if self._refresh_task is not None:
             self._refresh_task.cancel()
             self._refresh_task = None
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_tasks.clear()
         if self._control_burst_task is not None:
             self._control_burst_task.cancel()
             self._control_burst_task = None
+        if self._control_flush_task is not None:
+            self._control_flush_task.cancel()
+            self._control_flush_task = None
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._optimistic_handle is not None:
+            self._optimistic_handle.cancel()
+            self._optimistic_handle = None
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
         if self.ws is not None:
-            await self.hass.async_add_executor_job(self.ws.close)
+            await self.ws.async_close()
 
     def async_state(self) -> AtreaState:
         """Return the current state snapshot."""
@@ -323,6 +818,36 @@ class AtreaAMotionCoordinator:
         """Return a measured unit value."""
         return self.state.unit.get(key)
 
+    def request_slot(self, key: str) -> int:
+        """Return the stable slot of a request field for requested_value_at."""
+        return self.state.requests.slot(key)
+
+    def config_slot(self, key: str) -> int:
+        """Return the stable slot of a config field for config_value_at."""
+        return self.state.config.slot(key)
+
+    def unit_slot(self, key: str) -> int:
+        """Return the stable slot of a unit field for unit_value_at."""
+        return self.state.unit.slot(key)
+
+    def requested_value_at(self, slot: int) -> Any:
+        """Return a requested value by the slot from request_slot."""
+        return self.state.requests.at(slot)
+
+    def config_value_at(self, slot: int) -> Any:
+        """Return a configuration value by the slot from config_slot."""
+        return self.state.config.at(slot)
+
+    def unit_value_at(self, slot: int) -> Any:
+        """Return a measured unit value by the slot from unit_slot."""
+        return self.state.unit.at(slot)
+
+    def telemetry_stats(
+        self, key: str, window: float = TELEMETRY_WINDOW
+    ) -> AtreaRollingStats | None:
+        """Return rolling statistics for a numeric unit field over the last window seconds."""
+        return self.telemetry.stats(key, window)
+
     def value(self, key: str) -> Any:
         """Return a flattened value from the known state buckets."""
         if key in self.state.derived:
@@ -338,16 +863,13 @@ class AtreaAMotionCoordinator:
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def async_update(self) -> None:
         """Refresh the current unit state."""
-        await self.async_request("ui_info")
-        await self.async_request("user_config_get")
-        await self.async_request("ui_diagram_data")
-        await self.async_request("control_admin/config/moments/get")
+        await self._async_poll_stale()
 
     async def async_request(self, endpoint: str, args: Any = None) -> bool:
         """Send a websocket request."""
         message_id, success = await self._async_send_request(endpoint, args)
         if not success:
-            self._pending_requests.pop(message_id, None)
+            self._in_flight.discard(message_id)
         return success
 
     async def _async_request_message(
@@ -356,7 +878,7 @@ class AtreaAMotionCoordinator:
         """Send a websocket request and await its direct response."""
         message_id, success = await self._async_send_request(endpoint, args, expect_response=True)
         if not success:
-            self._pending_requests.pop(message_id, None)
+            self._in_flight.discard(message_id)
             self._response_waiters.pop(message_id, None)
             return None
 
@@ -365,7 +887,7 @@ class AtreaAMotionCoordinator:
             return await asyncio.wait_for(waiter, timeout=timeout)
         except TimeoutError:
             LOGGER.warning("Timed out waiting for %s response", endpoint)
-            self._pending_requests.pop(message_id, None)
+            self._in_flight.expire(message_id)
             return None
         finally:
             self._response_waiters.pop(message_id, None)
@@ -373,19 +895,164 @@ class AtreaAMotionCoordinator:
     async def _async_send_request(
         self, endpoint: str, args: Any = None, expect_response: bool = False
     ) -> tuple[int, bool]:
-        """Allocate an id, enqueue response tracking, and publish the request."""
-        async with self._lock:
-            self._msg_id += 1
-            message_id = self._msg_id
-            payload = {"endpoint": endpoint, "id": message_id, "args": args}
-            self._pending_requests[message_id] = endpoint
-            if expect_response:
-                self._response_waiters[message_id] = asyncio.get_running_loop().create_future()
-            success = await self.publish_wss(payload)
-        return message_id, success
+        """Queue one request and wait until the writer has published it."""
+        message_id, future = self._enqueue_request(endpoint, args, expect_response)
+        return message_id, await future
+
+    async def _async_send_requests(
+        self, requests: list[tuple[str, Any]], expect_response: bool = False
+    ) -> list[tuple[int, bool]]:
+        """Queue several requests at once and wait until the writer has sent them."""
+        queued = [
+            self._enqueue_request(endpoint, args, expect_response)
+            for endpoint, args in requests
+        ]
+        results = await asyncio.gather(*(future for _, future in queued))
+        return [(message_id, success) for (message_id, _), success in zip(queued, results)]
+
+    def _enqueue_request(
+        self, endpoint: str, args: Any = None, expect_response: bool = False
+    ) -> tuple[int, asyncio.Future[bool]]:
+        """Allocate an id and queue a request; the future resolves once it is sent."""
+        loop = asyncio.get_running_loop()
+        self._msg_id = next_message_id(self._msg_id)
+        message_id = self._msg_id
+        frame = _OutboundFrame(
+            message_id=message_id,
+            endpoint=endpoint,
+            payload={"endpoint": endpoint, "id": message_id, "args": args},
+            future=loop.create_future(),
+            coalescable=args is None and not expect_response,
+            queued_at=monotonic(),
+        )
+        try:
+            self._outbound.put_nowait(frame)
+        except asyncio.QueueFull:
+            LOGGER.warning("Outbound queue full, dropping %s request", endpoint)
+            self.outbound_stats.frames_failed += 1
+            frame.future.set_result(False)
+            return message_id, frame.future
+
+        self._in_flight.add(message_id, endpoint, frame.queued_at)
+        if args is None:
+            self._last_fresh[endpoint] = frame.queued_at
+        requests = self.poll_stats.requests
+        requests[endpoint] = requests.get(endpoint, 0) + 1
+        if expect_response:
+            self._response_waiters[message_id] = loop.create_future()
+        stats = self.outbound_stats
+        stats.queue_depth = self._outbound.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        self._ensure_writer_task()
+        return message_id, frame.future
+
+    def _ensure_writer_task(self) -> None:
+        """Start the outbound writer task if it is not already draining the queue."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._outbound_writer_loop())
+
+    async def _outbound_writer_loop(self) -> None:
+        """Drain queued frames, sending each burst back-to-back."""
+        batch: list[_OutboundFrame] = []
+        try:
+            while not self._outbound.empty() and not self._shutdown:
+                batch = []
+                while not self._outbound.empty():
+                    batch.append(self._outbound.get_nowait())
+                self.outbound_stats.queue_depth = 0
+                for frame in self._coalesce_frames(batch):
+                    await self._async_write_frame(frame)
+                batch = []
+        finally:
+            self._fail_frames(batch)
+            if self._shutdown:
+                while not self._outbound.empty():
+                    self._fail_frames([self._outbound.get_nowait()])
+
+    def _coalesce_frames(self, batch: list[_OutboundFrame]) -> list[_OutboundFrame]:
+        """Fold repeated read-only requests into the earlier identical frame.
+
+        Only runs of coalescable frames are merged, so a readback queued after a
+        write is never moved in front of it.
+        """
+        frames: list[_OutboundFrame] = []
+        primaries: dict[str, _OutboundFrame] = {}
+        for frame in batch:
+            if not frame.coalescable:
+                primaries.clear()
+                frames.append(frame)
+                continue
+            primary = primaries.get(frame.endpoint)
+            if primary is None:
+                primaries[frame.endpoint] = frame
+                frames.append(frame)
+                continue
+            primary.followers.append(frame)
+            self._in_flight.discard(frame.message_id)
+            self.outbound_stats.frames_coalesced += 1
+        return frames
+
+    async def _async_write_frame(self, frame: _OutboundFrame) -> None:
+        """Send one frame and resolve its future and those coalesced into it."""
+        stats = self.outbound_stats
+        stats.last_queue_wait = monotonic() - frame.queued_at
+        stats.max_queue_wait = max(stats.max_queue_wait, stats.last_queue_wait)
+        success = await self.publish_wss(frame.payload)
+        if success:
+            stats.frames_sent += 1
+        else:
+            stats.frames_failed += 1
+        for item in (frame, *frame.followers):
+            if not item.future.done():
+                item.future.set_result(success)
+        frame.followers.clear()
+
+    def _fail_frames(self, frames: list[_OutboundFrame]) -> None:
+        """Resolve unsent frames as failed."""
+        for frame in frames:
+            for item in (frame, *frame.followers):
+                if not item.future.done():
+                    item.future.set_result(False)
 
     async def async_control(self, variables: dict[str, Any]) -> bool:
-        """Send control variables to the unit."""
+        """Send control variables to the unit, merged with concurrent calls.
+
+        Calls within CONTROL_COALESCE_SECONDS of the first one share a single
+        control message, later values winning per variable, and all resolve
+        from its reply.
+        """
+        if self._control_batch is None:
+            batch: dict[str, Any] = {}
+            future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+            self._control_batch = (batch, future)
+            self._control_flush_task = asyncio.create_task(
+                self._async_flush_control(batch, future)
+            )
+        else:
+            batch, future = self._control_batch
+            self.outbound_stats.controls_coalesced += 1
+        batch.update(variables)
+        return await asyncio.shield(future)
+
+    async def _async_flush_control(
+        self, variables: dict[str, Any], future: asyncio.Future[bool]
+    ) -> None:
+        """Close the batch after the coalescing window and send it."""
+        try:
+            await asyncio.sleep(CONTROL_COALESCE_SECONDS)
+            self._control_batch = None
+            future.set_result(await self._async_send_control(variables))
+        except Exception as err:  # noqa: BLE001 - handed to every waiting caller
+            if not future.done():
+                future.set_exception(err)
+        finally:
+            if self._control_batch is not None and self._control_batch[1] is future:
+                self._control_batch = None
+            if not future.done():
+                future.set_result(False)
+
+    async def _async_send_control(self, variables: dict[str, Any]) -> bool:
+        """Send one control message and refresh state after it was accepted."""
         response = await self._async_request_message("control", {"variables": variables})
         if response is not None and response.get("code") == "UNAUTHORIZED":
             LOGGER.warning("Control rejected as unauthorized, reauthorizing websocket session")
@@ -400,17 +1067,15 @@ class AtreaAMotionCoordinator:
             return False
 
         self._apply_optimistic_control(variables)
-        await self.async_request("control_panel")
-        await self.async_request("ui_info")
-        self._schedule_control_burst_refresh()
+        await self._async_refresh_triggered("control")
+        self._schedule_control_burst_refresh(variables)
         return True
 
     async def async_reset_filter_interval(self) -> bool:
         """Confirm filter replacement on the unit."""
-        success = await self.async_request("control_admin/config/moments/reset/filter")
+        success = await self.async_request(MOMENTS_RESET_ENDPOINT)
         if success:
-            await self.async_request("control_admin/config/moments/get")
-            await self.async_request("ui_info")
+            await self._async_refresh_triggered(MOMENTS_RESET_ENDPOINT)
         return success
 
     async def async_set_unit_name(self, name: str) -> bool:
@@ -421,87 +1086,200 @@ class AtreaAMotionCoordinator:
 
         success = await self.async_request("unit/set", {"name": cleaned_name})
         if success:
-            await self.async_request("discovery")
+            await self._async_refresh_triggered("unit/set")
         return success
 
     async def async_set_modbus_enabled(self, enabled: bool) -> bool:
         """Enable or disable Modbus TCP."""
         success = await self.async_request("modbus/set", {"enable": enabled})
         if success:
-            await self.async_request("modbus")
+            await self._async_refresh_triggered("modbus/set")
         return success
 
     async def async_set_autoupdate_enabled(self, enabled: bool) -> bool:
         """Enable or disable firmware auto update."""
         success = await self.async_request("update/set", {"autoupdate": enabled})
         if success:
-            await self.async_request("update")
+            await self._async_refresh_triggered("update/set")
         return success
 
     async def async_set_config(self, key: str, value: Any) -> bool:
         """Set a persistent unit configuration value and confirm via readback."""
-        variables = self._config_variables_for_write(key, value)
+        results = await self.async_set_config_values({key: value})
+        return results[key].ok
+
+    async def async_set_config_values(
+        self, values: dict[str, Any]
+    ) -> dict[str, AtreaConfigWriteResult]:
+        """Validate and write several config values in one message, confirmed by one readback.
+
+        Invalid values are reported and left out; the rest share one config
+        message and one user_config_get.
+        """
+        results: dict[str, AtreaConfigWriteResult] = {}
+        valid: dict[str, Any] = {}
+        for key, value in values.items():
+            error = self._config_value_error(key, value)
+            if error is None:
+                valid[key] = value
+            else:
+                results[key] = AtreaConfigWriteResult(CONFIG_INVALID, error)
+        if not valid:
+            return results
+
+        variables = self._config_variables_for_batch(valid)
         response = await self._async_request_message("config", {"variables": variables})
 
         if response is not None and response.get("code") == "UNAUTHORIZED":
             LOGGER.warning("Config write rejected as unauthorized, reauthorizing websocket session")
-            if not await self._async_reauthorize_session():
-                return False
-            response = await self._async_request_message("config", {"variables": variables})
+            if await self._async_reauthorize_session():
+                response = await self._async_request_message("config", {"variables": variables})
+            else:
+                response = {"code": "UNAUTHORIZED"}
 
         if response is not None and response.get("code") != "OK":
             LOGGER.warning("Config request failed with code %s", response.get("code"))
-            return False
-
-        await self.async_request("user_config_get")
-        return self.state.config.get(key) == value
+            rejected = AtreaConfigWriteResult(CONFIG_REJECTED, response.get("code"))
+            return results | dict.fromkeys(valid, rejected)
+
+        await self._async_refresh_triggered("config")
+        for key, value in valid.items():
+            current = self.state.config.get(key)
+            results[key] = (
+                AtreaConfigWriteResult(CONFIG_APPLIED)
+                if current == value
+                else AtreaConfigWriteResult(CONFIG_NOT_CONFIRMED, f"unit reports {current!r}")
+            )
+        return results
 
     async def async_reboot(self) -> bool:
         """Request a unit reboot."""
         return await self.async_request("reboot")
 
+    def _create_background_task(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a fire-and-forget coroutine, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _ensure_refresh_task(self) -> None:
         """Start the periodic refresh task if needed."""
         if self._refresh_task is None or self._refresh_task.done():
+            self._last_poll_at = monotonic()
             self._refresh_task = asyncio.create_task(self._periodic_refresh_loop())
 
     async def _periodic_refresh_loop(self) -> None:
         """Keep state fresh even when the unit does not emit push events."""
         try:
             while not self._shutdown:
-                await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
+                await asyncio.sleep(self.poll_stats.interval)
                 if self._shutdown:
                     break
-                await self.async_update()
-                await self.async_request("control_panel")
+                await self._async_poll_cycle()
         except asyncio.CancelledError:
             return
 
-    def _schedule_control_burst_refresh(self) -> None:
-        """Refresh rapidly for a short period after a control change."""
+    async def _async_poll_cycle(self) -> None:
+        """Run one scheduled poll and adapt the interval to how the values moved.
+
+        The interval used by live endpoints halves while values keep changing and
+        backs off while they are stable, bounded by POLL_INTERVAL_MIN and
+        POLL_INTERVAL_MAX. Only the periodic loop adapts it, so extra polls such as
+        async_update do not skew the cadence.
+        """
+        now = monotonic()
+        await self._async_poll_stale()
+        stats = self.poll_stats
+        if self._last_change_at > self._last_poll_at:
+            stats.interval = max(POLL_INTERVAL_MIN, stats.interval / 2)
+        else:
+            stats.interval = min(POLL_INTERVAL_MAX, stats.interval * POLL_BACKOFF_FACTOR)
+        self._last_poll_at = now
+
+    async def _async_poll_stale(self) -> None:
+        """Poll timer endpoints whose data outlived their TTL.
+
+        Pushes and earlier requests both count as fresh data.
+        """
+        stats = self.poll_stats
+        now = monotonic()
+        self._in_flight.evict(now)
+        for policy in REFRESH_TRIGGERS[REFRESH_TIMER]:
+            endpoint = policy.endpoint
+            ttl = stats.interval if policy.ttl is None else policy.ttl
+            fresh_at = self._last_fresh.get(endpoint)
+            if fresh_at is not None and now - fresh_at < ttl:
+                stats.skipped[endpoint] = stats.skipped.get(endpoint, 0) + 1
+                continue
+            stats.polled[endpoint] = stats.polled.get(endpoint, 0) + 1
+            await self.async_request(endpoint)
+
+        self._notify_state_changed(self._refresh_derived_state(REFRESH_TIMER))
+
+    async def _async_refresh_triggered(self, trigger: str) -> None:
+        """Request every endpoint whose refresh policy lists the trigger."""
+        for policy in REFRESH_TRIGGERS.get(trigger, ()):
+            await self.async_request(policy.endpoint)
+
+    def _schedule_control_burst_refresh(self, variables: dict[str, Any]) -> None:
+        """Refresh until the unit echoes the control targets, backing off between polls."""
         if self._control_burst_task is not None and not self._control_burst_task.done():
             self._control_burst_task.cancel()
+        else:
+            self._control_targets = {}
+        self._control_targets.update(variables)
+        self._control_echo_marks = dict(self._echo_counts)
         self._control_burst_task = asyncio.create_task(self._control_burst_refresh_loop())
 
     async def _control_burst_refresh_loop(self) -> None:
-        """Poll frequently after control changes to capture delayed transitions."""
+        """Poll after control changes until the targets settle or the cycle cap is hit."""
         try:
-            for _ in range(CONTROL_BURST_REFRESH_CYCLES):
+            for cycle in range(CONTROL_BURST_REFRESH_CYCLES):
                 if self._shutdown:
                     break
-                await asyncio.sleep(CONTROL_BURST_REFRESH_INTERVAL)
-                await self.async_request("ui_diagram_data")
-                await self.async_request("ui_info")
-                await self.async_request("control_panel")
+                backoff = CONTROL_BURST_BACKOFF[min(cycle, len(CONTROL_BURST_BACKOFF) - 1)]
+                await asyncio.sleep(backoff)
+                pending = self._pending_control_variables()
+                if not pending:
+                    LOGGER.debug("Control settled on %s after %s burst refreshes", self.host, cycle)
+                    break
+                await self._async_refresh_triggered(REFRESH_CONTROL_BURST)
+            else:
+                LOGGER.debug("Control burst on %s capped with pending %s", self.host, pending)
         except asyncio.CancelledError:
             return
+        self._control_targets = {}
+
+    def _pending_control_variables(self) -> set[str]:
+        """Return control targets the unit has not echoed back yet.
+
+        A target settles once a ui_info and a control_panel received after the
+        control both carry it and the unit is not in a transient mode.
+        """
+        targets = self._control_targets
+        if any(
+            self._echo_counts[source] <= self._control_echo_marks[source]
+            for source in CONTROL_ECHO_SOURCES
+        ):
+            return set(targets)
+        stored = self.state.control_panel.get("stored", {})
+        pending = {
+            key
+            for key, target in targets.items()
+            if self.state.requests.get(key) != target or stored.get(key, target) != target
+        }
+        # Echoes of unconfirmed values are masked, so the stores alone can look settled.
+        pending |= self.optimistic.pending & targets.keys()
+        if self.state.unit.get("mode_current") in CONTROL_TRANSIENT_MODES:
+            pending.add("mode_current")
+        return pending
 
     async def connect_wss(self) -> bool:
         """Connect and authorize the websocket session."""
         if self.socket_state == SOCK_CONNECTED and self._authorized:
             return True
 
-        if not await self.open_wss_thread():
+        if not await self.open_wss():
             return False
 
         for attempt in range(WS_RETRY):
@@ -516,29 +1294,23 @@ class AtreaAMotionCoordinator:
             await asyncio.sleep(1)
         return False
 
-    async def open_wss_thread(self) -> bool:
-        """Open the websocket and run it in a background thread."""
+    async def open_wss(self) -> bool:
+        """Open the websocket on the event loop."""
         LOGGER.debug("Opening websocket to %s", self.host)
-        try:
-            self.ws = websocket.WebSocketApp(
-                f"ws://{self.host}/api/ws",
-                header={
-                    "Connection": "keep-alive, Upgrade",
-                    "handshakeTimeout": "10000",
-                },
-                on_message=self.on_message,
-                on_close=self.on_close,
-                on_open=self.on_open,
-                on_error=self.on_error,
-                on_pong=self.on_pong,
-            )
-            self._thread = threading.Thread(target=self.ws.run_forever, daemon=True)
-            self._thread.start()
-            return True
-        except websocket.WebSocketException as err:
+        if self.ws is not None:
+            await self.ws.async_close()
+        self.ws = AtreaWebsocketTransport(
+            async_get_clientsession(self.hass),
+            f"ws://{self.host}/api/ws",
+            on_open=self.on_open,
+            on_message=self.on_message,
+            on_close=self.on_close,
+            on_error=self.on_error,
+        )
+        if not await self.ws.async_connect():
             self.socket_state = SOCK_ERROR
-            LOGGER.debug("Error while opening websocket: %s", err)
             return False
+        return True
 
     async def authenticate_with_server(self) -> None:
         """Authenticate the websocket session."""
@@ -546,7 +1318,7 @@ class AtreaAMotionCoordinator:
             LOGGER.error("Too many login attempts")
             return
 
-        self._msg_id += 1
+        self._msg_id = next_message_id(self._msg_id)
         if self._token is None:
             self._login_retry += 1
             self._login_msg_id = self._msg_id
@@ -602,12 +1374,7 @@ class AtreaAMotionCoordinator:
         LOGGER.debug("Websocket closed: %s %s", close_status_code, close_msg)
         self.socket_state = SOCK_DISCONNECTED
         self._authorized = False
-        if self._loop is not None:
-            self._loop.call_soon_threadsafe(self._ready.clear)
-
-    def on_pong(self, ws, message) -> None:
-        """Socket pong event."""
-        LOGGER.debug("Websocket pong received")
+        self._ready.clear()
 
     def on_open(self, ws) -> None:
         """Socket open event."""
@@ -615,22 +1382,31 @@ class AtreaAMotionCoordinator:
         self.socket_state = SOCK_CONNECTED
         self.sent_counter = 0
         self._last_message_at = monotonic()
-        if self._loop is not None:
-            asyncio.run_coroutine_threadsafe(self.authenticate_with_server(), self._loop)
+        self._create_background_task(self.authenticate_with_server())
 
-    def on_message(self, ws, msg: str) -> None:
+    def on_message(self, ws, msg: str | bytes) -> None:
         """Socket message event."""
         self.sent_counter = 0
         self._last_message_at = monotonic()
-        LOGGER.debug("Received websocket message: %s", msg)
         try:
-            message = json.loads(msg)
-        except json.JSONDecodeError:
+            message = self.codec.loads(msg)
+        except ValueError:
+            self.flight_recorder.record(FRAME_IN, msg)
+            if self.capture is not None:
+                self.capture.record(FRAME_IN, msg)
             LOGGER.debug("Ignoring invalid JSON payload")
             return
 
-        if self._loop is not None:
-            self._loop.call_soon_threadsafe(self._handle_message_on_loop, message)
+        message_id = message.get("id") if isinstance(message, dict) else None
+        self.flight_recorder.record(
+            FRAME_IN, msg, message_id, sensitive=message_id == self._login_msg_id
+        )
+        if self.capture is not None and message_id not in (
+            self._login_msg_id,
+            self._token_msg_id,
+        ):
+            self.capture.record(FRAME_IN, msg)
+        self._handle_message_on_loop(message)
 
     def _handle_message_on_loop(self, message: dict[str, Any]) -> None:
         """Handle websocket messages on the HA event loop."""
@@ -638,7 +1414,7 @@ class AtreaAMotionCoordinator:
         if message_id == self._login_msg_id and message.get("code") == "OK":
             self._token = message.get("response")
             self._resolve_response_waiter(message)
-            asyncio.create_task(self.authenticate_with_server())
+            self._create_background_task(self.authenticate_with_server())
             return
 
         if message_id == self._token_msg_id:
@@ -667,21 +1443,22 @@ class AtreaAMotionCoordinator:
         event = message.get("event")
         response = message.get("response")
         payload = message.get("args")
+        if event is not None:
+            self._last_fresh[event] = monotonic()
+            if event in REFRESH_TRIGGERS:
+                self._create_background_task(self._async_refresh_triggered(event))
 
         if event == "ui_info":
             self._apply_ui_info(payload or {})
         elif event == "control_panel":
             self._apply_control_panel(payload or {})
-            self._notify_state_changed()
-        elif event == "unit_config":
-            self._notify_state_changed()
-            asyncio.create_task(self.async_request("discovery"))
         elif event == "control_invoked":
-            self.state.control_panel.setdefault("invoked", payload or {})
-            self._notify_state_changed()
+            if "invoked" not in self.state.control_panel:
+                self.state.control_panel["invoked"] = payload or {}
+                self._notify_state_changed({"invoked"})
         elif event == "disposable_plan":
             self.state.disposable_plan = payload or {}
-            self._notify_state_changed()
+            self._notify_state_changed({"disposable_plan"})
         elif response is not None:
             endpoint = self._endpoint_from_response(message)
             if endpoint == "discovery":
@@ -696,21 +1473,22 @@ class AtreaAMotionCoordinator:
                 self._apply_ui_info(response)
             elif endpoint == "ui_diagram_data":
                 self._apply_ui_diagram_data(response)
-            elif endpoint == "control_admin/config/moments/get":
-                self._apply_moments(response.get("get", response))
+            elif endpoint == MOMENTS_ENDPOINT:
+                self._apply_moments(response)
             elif endpoint == "modbus":
                 self._apply_modbus(response)
             elif endpoint == "update":
                 self._apply_update(response)
             elif endpoint == "control_panel":
-                self._apply_control_panel(response.get("control_panel", response))
-                self._notify_state_changed()
+                self._apply_control_panel(response)
+        elif isinstance(message.get("id"), int):
+            self._in_flight.pop(message["id"])
 
     def _endpoint_from_response(self, message: dict[str, Any]) -> str | None:
-        """Best-effort endpoint detection for responses."""
+        """Return the tracked endpoint for a response, guessing from its shape if the id is lost."""
         message_id = message.get("id")
         if isinstance(message_id, int):
-            endpoint = self._pending_requests.pop(message_id, None)
+            endpoint = self._in_flight.pop(message_id)
             if endpoint is not None:
                 return endpoint
 
@@ -743,7 +1521,7 @@ class AtreaAMotionCoordinator:
             "uv_lamp_service_life",
             "get",
         }.intersection(response):
-            return "control_admin/config/moments/get"
+            return MOMENTS_ENDPOINT
         if {"active", "enable", "clients", "port"}.intersection(response):
             return "modbus"
         if {"autoupdate", "check", "status"}.intersection(response):
@@ -754,9 +1532,24 @@ class AtreaAMotionCoordinator:
 
     def _apply_discovery(self, response: dict[str, Any]) -> None:
         """Store discovery metadata."""
+        previous = dict(self.state.discovery)
         self.state.discovery.update(response)
-        self._discovery_ready.set()
-        self._notify_state_changed()
+        ready = self._mark_ready("discovery")
+        if self._capabilities_unsaved:
+            self._cache_capabilities()
+        elif self._capabilities_version not in (None, self.version):
+            LOGGER.info(
+                "Firmware of %s changed from %s to %s, refreshing capabilities",
+                self.host,
+                self._capabilities_version,
+                self.version,
+            )
+            self._capabilities_version = None
+            for endpoint in CAPABILITY_ENDPOINTS:
+                self._enqueue_request(endpoint)
+        if self._changed_keys(previous, self.state.discovery):
+            ready.add(DISCOVERY_FIELD)
+        self._notify_state_changed(ready)
 
     def _apply_control_scheme(self, response: dict[str, Any]) -> None:
         """Store capabilities from ui_control_scheme."""
@@ -774,8 +1567,10 @@ class AtreaAMotionCoordinator:
             for key, value in response.get("types", {}).items()
             if value.get("type") == "range"
         }
+        self._reserve_state_fields()
         self._control_scheme_ready.set()
-        self._notify_state_changed()
+        self._cache_capabilities()
+        self._notify_state_changed({ALL_FIELDS})
 
     def _apply_diagram_scheme(self, response: dict[str, Any]) -> None:
         """Store supplemental diagram metadata."""
@@ -785,69 +1580,155 @@ class AtreaAMotionCoordinator:
             for item in response.get("baseStates", [])
             if isinstance(item, dict) and isinstance(item.get("id"), int)
         }
-        self._notify_state_changed()
+        self._base_states_version += 1
+        ready = self._mark_ready("ui_diagram_scheme")
+        self._cache_capabilities()
+        self._notify_state_changed(ready | self._refresh_derived_state("base_states"))
 
     def _apply_user_config(self, response: dict[str, Any]) -> None:
         """Store persistent user configuration values."""
         variables = response.get("variables", response)
-        self.state.config = variables if isinstance(variables, dict) else {}
-        self._refresh_derived_state()
-        self._user_config_ready.set()
-        self._notify_state_changed()
+        changes = self.state.config.replace(variables if isinstance(variables, dict) else {})
+        changes |= self._refresh_derived_state("config")
+        changes |= self._mark_ready("user_config_get")
+        self._notify_state_changed(changes)
 
-    def _apply_ui_info(self, response: dict[str, Any]) -> None:
+    def _apply_ui_info(self, response: Any) -> None:
         """Store current unit data."""
-        self.state.requests = self._as_dict(response.get("requests"))
-        self.state.unit = self._as_dict(response.get("unit"))
-        states = self._as_dict(response.get("states"))
-        self.state.active_states = self._as_dict(states.get("active"))
-        self._refresh_derived_state()
-        self._ui_info_ready.set()
-        self._notify_state_changed()
-
-    def _apply_ui_diagram_data(self, response: dict[str, Any]) -> None:
+        ui_info = AtreaUiInfo.decode(response)
+        requests = ui_info.requests
+        if self.optimistic.pending:
+            requests = self.optimistic.mask("requests", requests, monotonic())
+        changes = self.state.requests.replace(requests)
+        self._track_source_changes("requests", changes, requests)
+        unit_changes = self.state.unit.replace(ui_info.unit)
+        self._track_source_changes("unit", unit_changes, ui_info.unit)
+        changes |= unit_changes
+        self.telemetry.record(self.state.unit)
+        if ui_info.active_states != self.state.active_states:
+            changes.add("active_states")
+        self.state.active_states = ui_info.active_states
+        changes |= self._refresh_derived_state("active_states", "unit", changed=changes)
+        self._echo_counts["ui_info"] += 1
+        changes |= self._mark_ready("ui_info")
+        self._notify_state_changed(changes)
+
+    def _apply_ui_diagram_data(self, response: Any) -> None:
         """Store live diagram values."""
-        diagram_data = response.get("ui_diagram_data", response)
-        self.state.ui_diagram_data = (
-            diagram_data if isinstance(diagram_data, dict) else {}
-        )
-        self._refresh_derived_state()
-        self._diagram_ready.set()
-        self._notify_state_changed()
+        self.state.ui_diagram_data = AtreaDiagramData.decode(response).values
+        changes = self._refresh_derived_state("ui_diagram_data")
+        changes |= self._mark_ready("ui_diagram_data")
+        self._notify_state_changed(changes)
 
-    def _apply_moments(self, response: dict[str, Any]) -> None:
+    def _apply_moments(self, response: Any) -> None:
         """Store maintenance and filter counters."""
-        self.state.moments = self._as_dict(response)
-        self._refresh_derived_state()
-        self._moments_ready.set()
-        self._notify_state_changed()
+        self.state.moments = AtreaMoments.decode(response).values
+        changes = self._refresh_derived_state("moments")
+        changes |= self._mark_ready(MOMENTS_ENDPOINT)
+        self._notify_state_changed(changes)
 
-    def _apply_control_panel(self, response: dict[str, Any]) -> None:
+    def _apply_control_panel(self, response: Any) -> None:
         """Store transient control panel values."""
-        self.state.control_panel = self._as_dict(response)
-        self._refresh_derived_state()
+        previous = self.state.control_panel
+        values = AtreaControlPanel.decode(response).values
+        if self.optimistic.pending:
+            now = monotonic()
+            values = dict(values)
+            for view in ("stored", "current"):
+                if view in values:
+                    values[view] = self.optimistic.mask(view, values[view], now)
+        self.state.control_panel = values
+        changes = self._changed_keys(previous, self.state.control_panel)
+        self._track_source_changes("control_panel", changes, self.state.control_panel)
+        changes |= self._refresh_derived_state("control_panel")
+        self._echo_counts["control_panel"] += 1
+        changes |= self._mark_ready("control_panel")
+        self._notify_state_changed(changes)
 
     def _apply_optimistic_control(self, variables: dict[str, Any]) -> None:
-        """Apply a local optimistic update until the unit echoes fresh state."""
-        self.state.requests.update(variables)
+        """Apply a local optimistic update and hold it until the unit confirms it."""
         stored = self.state.control_panel.setdefault("stored", {})
         current = self.state.control_panel.setdefault("current", {})
+        self.optimistic.track(
+            variables,
+            {"requests": self.state.requests, "stored": stored, "current": current},
+            monotonic(),
+        )
+        changes = self.state.requests.update(variables)
         stored.update(variables)
         current.update(variables)
-        self._refresh_derived_state()
-        self._notify_state_changed()
+        changes |= {"stored", "current"}
+        changes |= self._refresh_derived_state("control_panel")
+        self._schedule_optimistic_expiry()
+        self._notify_state_changed(changes)
+
+    def _schedule_optimistic_expiry(self) -> None:
+        """Arm the timer for the earliest optimistic deadline."""
+        if self._optimistic_handle is not None:
+            self._optimistic_handle.cancel()
+            self._optimistic_handle = None
+        deadline = self.optimistic.next_deadline
+        if deadline is not None and not self._shutdown:
+            self._optimistic_handle = asyncio.get_running_loop().call_later(
+                max(deadline - monotonic(), 0), self._expire_optimistic
+            )
+
+    def _expire_optimistic(self) -> None:
+        """Roll back the real values of optimistic entries the unit never confirmed."""
+        self._optimistic_handle = None
+        restore, drop = self.optimistic.expire(monotonic())
+        if restore or drop:
+            LOGGER.debug(
+                "Optimistic control values on %s expired, restoring %s and dropping %s",
+                self.host,
+                restore,
+                drop,
+            )
+            requests = self.state.requests
+            changes = requests.update(restore.get("requests", {}))
+            changes |= {key for key in drop.get("requests", ()) if requests.discard(key)}
+            for view in ("stored", "current"):
+                if not restore.get(view) and not drop.get(view):
+                    continue
+                values = self.state.control_panel.setdefault(view, {})
+                values.update(restore.get(view, {}))
+                for key in drop.get(view, ()):
+                    values.pop(key, None)
+                changes.add(view)
+            changes |= self._refresh_derived_state("control_panel")
+            self._notify_state_changed(changes)
+        self._schedule_optimistic_expiry()
 
     def _apply_modbus(self, response: dict[str, Any]) -> None:
         """Store Modbus TCP state."""
         self.state.modbus = self._as_dict(response)
-        self._refresh_derived_state()
-        self._notify_state_changed()
+        ready = self._mark_ready("modbus")
+        self._notify_state_changed(ready | self._refresh_derived_state("modbus"))
 
     def _apply_update(self, response: dict[str, Any]) -> None:
         """Store firmware update settings."""
         self.state.update = self._as_dict(response)
-        self._refresh_derived_state()
-        self._notify_state_changed()
+        ready = self._mark_ready("update")
+        self._notify_state_changed(ready | self._refresh_derived_state("update"))
+
+    def _mark_ready(self, endpoint: str) -> set[str]:
+        """Mark an endpoint as delivered and return ALL_FIELDS the first time.
+
+        Entities gate availability on readiness, so the first response has to
+        reach them even when none of the values they read changed.
+        """
+        event = self._endpoint_ready[endpoint]
+        if event.is_set():
+            return set()
+        event.set()
+        return {ALL_FIELDS}
+
+    @staticmethod
+    def _as_number(value: Any) -> float | None:
+        """Return real numbers as float, excluding booleans."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return None
 
     @staticmethod
     def _as_int(value: Any) -> int | None:
@@ -863,6 +1744,50 @@ class AtreaAMotionCoordinator:
                 return None
         return None
 
+    def _track_source_changes(
+        self, source: str, keys: Iterable[str], values: Mapping[str, Any]
+    ) -> None:
+        """Mark live data as changing when a polled source field really moved.
+
+        Only raw ui_info and control_panel fields count; derived and accumulated
+        values never do. Numbers are compared with the last counted value, so
+        slow drift still counts once it exceeds POLL_CHANGE_TOLERANCE.
+        """
+        baseline = self._poll_baseline
+        moved = False
+        for key in keys:
+            value = values.get(key)
+            slot = (source, key)
+            if slot in baseline:
+                previous = self._as_number(baseline[slot])
+                number = self._as_number(value)
+                if previous is not None and number is not None:
+                    if abs(number - previous) < POLL_CHANGE_TOLERANCE:
+                        continue
+                elif baseline[slot] == value:
+                    continue
+            baseline[slot] = value
+            moved = True
+        if moved:
+            self._last_change_at = monotonic()
+
+    def _reserve_state_fields(self) -> None:
+        """Give every field of the control scheme its store slot before values arrive."""
+        self.state.requests.reserve(sorted(self.capabilities.requests))
+        self.state.config.reserve(sorted(self.capabilities.config_fields))
+        self.state.unit.reserve(sorted(self.capabilities.unit_fields))
+
+    @staticmethod
+    def _changed_keys(previous: dict[str, Any], current: dict[str, Any]) -> set[str]:
+        """Return keys whose values differ between two snapshots of a bucket."""
+        if previous is current:
+            return set()
+        return {
+            key
+            for key in previous.keys() | current.keys()
+            if key not in previous or key not in current or previous[key] != current[key]
+        }
+
     @staticmethod
     def _as_dict(value: Any) -> dict[str, Any]:
         """Return dictionaries as-is and coerce null-like payloads to an empty mapping."""
@@ -909,83 +1834,217 @@ class AtreaAMotionCoordinator:
             return "ambiguous"
         return "ambiguous"
 
-    def _refresh_derived_state(self) -> None:
-        """Flatten cross-endpoint values that entities can consume directly."""
-        active_states = self.state.active_states
+    def _refresh_derived_state(
+        self, *sources: str, changed: set[str] | None = None
+    ) -> set[str]:
+        """Rebuild derived values that depend on the changed source buckets.
+
+        Without sources every group is rebuilt. ``changed`` lists the bucket keys
+        that changed, letting groups with declared input fields skip the rebuild.
+        Returns the derived keys whose values actually changed.
+        """
+        updated: set[str] = set()
+        derived = self.state.derived
+        for group in DERIVED_GROUPS:
+            if sources and group.sources.isdisjoint(sources):
+                continue
+            if changed is not None and group.fields and group.fields.isdisjoint(changed):
+                continue
+            for key, value in getattr(self, group.builder)().items():
+                if key not in derived or derived[key] != value:
+                    updated.add(key)
+                derived[key] = value
+        return updated
+
+    def _derive_diagram(self) -> dict[str, Any]:
+        """Flatten live diagram values."""
         diagram = self.state.ui_diagram_data
-        moments = self.state.moments
-        filters = moments.get("filters") if isinstance(moments, dict) else None
-        last_filter_reset = moments.get("lastFilterReset") if isinstance(moments, dict) else None
-        stored = self.state.control_panel.get("stored", {})
-        config = self.state.config
-        modbus = self.state.modbus
-        update = self.state.update
-        notifications = self._build_active_notifications(active_states)
-        warning_notifications = [item for item in notifications if item["kind"] == "warning"]
-        fault_notifications = [item for item in notifications if item["kind"] == "fault"]
-        highest_severity = max(
-            (item["severity"] for item in notifications if isinstance(item.get("severity"), int)),
-            default=None,
-        )
-
-        self.state.derived = {
+        return {
             "bypass_estim": diagram.get("bypass_estim"),
             "damper_io_state": diagram.get("damper_io_state"),
             "fan_eta_operating_time": diagram.get("fan_eta_operating_time"),
             "fan_sup_operating_time": diagram.get("fan_sup_operating_time"),
+        }
+
+    def _derive_moments(self) -> dict[str, Any]:
+        """Flatten filter and maintenance counters."""
+        moments = self.state.moments
+        filters = moments.get("filters")
+        last_filter_reset = moments.get("lastFilterReset")
+        return {
             "filters": filters,
             "filter_due_date": filters,
             "lastFilterReset": last_filter_reset,
             "last_filter_reset": last_filter_reset,
             "m1_register": moments.get("m1_register"),
             "m2_register": moments.get("m2_register"),
+            "uv_lamp_register": moments.get("uv_lamp_register"),
+            "uv_lamp_service_life": moments.get("uv_lamp_service_life"),
+        }
+
+    def _derive_motor_roles(self) -> dict[str, Any]:
+        """Infer the motor role mapping from motor and fan counters."""
+        moments = self.state.moments
+        diagram = self.state.ui_diagram_data
+        return {
             "motor_role_mapping": self._infer_motor_role_mapping(
                 moments.get("m1_register"),
                 moments.get("m2_register"),
                 diagram.get("fan_sup_operating_time"),
                 diagram.get("fan_eta_operating_time"),
             ),
-            "uv_lamp_register": moments.get("uv_lamp_register"),
-            "uv_lamp_service_life": moments.get("uv_lamp_service_life"),
+        }
+
+    def _derive_active_states(self) -> dict[str, Any]:
+        """Summarize raw active states."""
+        active_states = self.state.active_states
+        return {
             "active_state_count": len(active_states),
-            "active_states": active_states,
             "active_state_names": [
-                state.get("name")
-                for state in active_states.values()
-                if isinstance(state, dict) and state.get("name")
+                state["name"] for state in active_states.values() if state.get("name")
             ],
-            "notifications": notifications,
-            "notification_count": len(notifications),
-            "warning_count": len(warning_notifications),
-            "fault_count": len(fault_notifications),
-            "has_warning": bool(warning_notifications),
-            "has_fault": bool(fault_notifications),
-            "highest_severity": highest_severity,
-            "primary_message": notifications[0]["full_message"] if notifications else None,
-            "warning": bool(warning_notifications),
-            "fault": bool(fault_notifications),
             "filter_interval_active": any(
-                isinstance(state, dict) and state.get("name") == "FILTER_INTERVAL"
-                for state in active_states.values()
+                state.get("name") == "FILTER_INTERVAL" for state in active_states.values()
             ),
+        }
+
+    def _derive_heat_recovery(self) -> dict[str, Any]:
+        """Compute sensible heat-recovery efficiency from the supply-side temperatures.
+
+        Readings are skipped when outdoor and extract air are too close to give a
+        stable ratio or when heating, cooling or bypass push the ratio outside 0-100 %.
+        """
+        unit = self.state.unit
+        temp_oda = self._as_number(unit.get("temp_oda"))
+        temp_sup = self._as_number(unit.get("temp_sup"))
+        temp_eta = self._as_number(unit.get("temp_eta"))
+        efficiency = None
+        if (
+            temp_oda is not None
+            and temp_sup is not None
+            and temp_eta is not None
+            and abs(temp_eta - temp_oda) >= HEAT_RECOVERY_MIN_DELTA
+        ):
+            ratio = (temp_sup - temp_oda) / (temp_eta - temp_oda) * 100
+            efficiency = round(ratio, 1) if 0 <= ratio <= 100 else None
+        return {"heat_recovery_efficiency": efficiency}
+
+    def _derive_fan_energy(self) -> dict[str, Any]:
+        """Estimate fan power and integrate it into energy when power changes.
+
+        Power follows the fan affinity law, FAN_RATED_POWER_W per fan at 100 %, and
+        is held until it changes. The poll timer closes the step after
+        FAN_ENERGY_INTEGRATION_INTERVAL, so fan_energy moves then instead of on
+        every update. Time after ui_info went stale for FAN_ENERGY_MAX_GAP is not
+        integrated.
+        """
+        factors = [
+            factor
+            for factor in (
+                self._as_number(self.state.unit.get("fan_sup_factor")),
+                self._as_number(self.state.unit.get("fan_eta_factor")),
+            )
+            if factor is not None
+        ]
+        power = (
+            sum(FAN_RATED_POWER_W * (factor / 100) ** 3 for factor in factors)
+            if factors
+            else None
+        )
+        now = monotonic()
+        fresh_at = self._last_fresh.get("ui_info", now)
+        sample = self._fan_power_sample
+        if sample is None or power is None:
+            self._fan_power_sample = (now, power) if power is not None else None
+        elif now - fresh_at > FAN_ENERGY_MAX_GAP:
+            self._fan_energy_wh += sample[1] * max(fresh_at - sample[0], 0) / 3600
+            self._fan_power_sample = (now, power)
+        elif power != sample[1] or now - sample[0] >= FAN_ENERGY_INTEGRATION_INTERVAL:
+            self._fan_energy_wh += sample[1] * (now - sample[0]) / 3600
+            self._fan_power_sample = (now, power)
+        return {
+            "fan_power": round(power, 1) if power is not None else None,
+            "fan_energy": round(self._fan_energy_wh / 1000, 4),
+        }
+
+    def _derive_notifications(self) -> dict[str, Any]:
+        """Build the card-ready notification payload, reusing it while its inputs are unchanged."""
+        active_states = self.state.active_states
+        fingerprint = (
+            self._base_states_version,
+            hass_language(self.hass),
+            tuple(
+                (state_id, bool(state.get("active")), state.get("name"))
+                for state_id, state in active_states.items()
+            ),
+        )
+        cached = self._notifications_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        notifications = self._build_active_notifications(active_states)
+        warning_count = sum(1 for item in notifications if item.kind == "warning")
+        fault_count = sum(1 for item in notifications if item.kind == "fault")
+        highest_severity = max(
+            (item.severity for item in notifications if item.severity is not None),
+            default=None,
+        )
+        derived = {
+            "notifications": [item.as_dict() for item in notifications],
+            "notification_count": len(notifications),
+            "warning_count": warning_count,
+            "fault_count": fault_count,
+            "has_warning": bool(warning_count),
+            "has_fault": bool(fault_count),
+            "highest_severity": highest_severity,
+            "primary_message": notifications[0].full_message if notifications else None,
+            "warning": bool(warning_count),
+            "fault": bool(fault_count),
+        }
+        self._notifications_cache = (fingerprint, derived)
+        return derived
+
+    def _derive_control_panel(self) -> dict[str, Any]:
+        """Flatten stored control panel requests."""
+        control_panel = self.state.control_panel
+        stored = control_panel.get("stored", {})
+        return {
             "stored_bypass_control_req": stored.get("bypass_control_req"),
             "stored_fan_power_req": stored.get("fan_power_req"),
             "stored_fan_power_req_eta": stored.get("fan_power_req_eta"),
             "stored_fan_power_req_sup": stored.get("fan_power_req_sup"),
             "stored_temp_request": stored.get("temp_request"),
             "stored_work_regime": stored.get("work_regime"),
+            "control_panel_visible": control_panel.get("visible"),
+            "control_panel_remaining": control_panel.get("remaining"),
+        }
+
+    def _derive_config(self) -> dict[str, Any]:
+        """Flatten persistent configuration values."""
+        config = self.state.config
+        return {
             "season_request": config.get("season_request"),
             "season_switch_temp": config.get("season_switch_temp"),
             "temp_oda_mean_interval": config.get("temp_oda_mean_interval"),
             "temp_ida_heater_hyst": config.get("temp_ida_heater_hyst"),
             "temp_ida_cooler_hyst": config.get("temp_ida_cooler_hyst"),
             "temp_cool_active_offset": config.get("temp_cool_active_offset"),
-            "control_panel_visible": self.state.control_panel.get("visible"),
-            "control_panel_remaining": self.state.control_panel.get("remaining"),
+        }
+
+    def _derive_modbus(self) -> dict[str, Any]:
+        """Flatten Modbus TCP state."""
+        modbus = self.state.modbus
+        return {
             "modbus_active": modbus.get("active"),
             "modbus_enabled": modbus.get("enable"),
             "modbus_port": modbus.get("port"),
             "modbus_clients": modbus.get("clients"),
+        }
+
+    def _derive_update(self) -> dict[str, Any]:
+        """Flatten firmware update settings."""
+        update = self.state.update
+        return {
             "autoupdate_enabled": update.get("autoupdate"),
             "update_check_enabled": update.get("check"),
             "update_status": update.get("status"),
@@ -993,39 +2052,73 @@ class AtreaAMotionCoordinator:
 
     def _config_variables_for_write(self, key: str, value: Any) -> dict[str, Any]:
         """Build a config payload, grouping related season settings when needed."""
-        if key not in {
-            "season_request",
-            "season_switch_temp",
-            "temp_oda_mean_interval",
-        }:
-            return {key: value}
-
-        current = dict(self.state.config)
-        current[key] = value
-        season_request = current.get("season_request")
-        if key == "season_request" and value not in {"AUTO_TODA", "AUTO_TODA_RATIO"}:
-            return {"season_request": value}
-        if season_request not in {"AUTO_TODA", "AUTO_TODA_RATIO"}:
-            return {key: value}
-
-        variables: dict[str, Any] = {
-            "season_request": season_request,
-            "season_switch_temp": current.get("season_switch_temp"),
-            "temp_oda_mean_interval": current.get("temp_oda_mean_interval"),
+        return self._config_variables_for_batch({key: value})
+
+    def _config_variables_for_batch(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Build one config payload for several values, grouping season settings in auto modes."""
+        current = {**self.state.config, **values}
+        if (
+            not any(key in values for key in SEASON_CONFIG_KEYS)
+            or current.get("season_request") not in AUTO_SEASON_REQUESTS
+        ):
+            return dict(values)
+
+        grouped = {
+            name: current[name] for name in SEASON_CONFIG_KEYS if current.get(name) is not None
         }
-        return {
-            name: current_value
-            for name, current_value in variables.items()
-            if current_value is not None
+        return {**grouped, **values}
+
+    def control_errors(self, variables: Mapping[str, Any]) -> dict[str, str]:
+        """Return why control variables do not fit the unit's control scheme, by key."""
+        errors = {
+            key: self._scheme_value_error(
+                key, value, self.capabilities.requests, "unknown control variable"
+            )
+            for key, value in variables.items()
         }
+        return {key: error for key, error in errors.items() if error is not None}
+
+    def _config_value_error(self, key: str, value: Any) -> str | None:
+        """Return why a value does not fit the config field's scheme type, or None."""
+        return self._scheme_value_error(
+            key, value, self.capabilities.config_fields, "unknown config field"
+        )
 
-    def _build_active_notifications(self, active_states: dict[str, Any]) -> list[dict[str, Any]]:
-        """Normalize raw active states into UI-ready notifications."""
-        notifications: list[dict[str, Any]] = []
+    def _scheme_value_error(
+        self, key: str, value: Any, fields: set[str], unknown: str
+    ) -> str | None:
+        """Return why a value does not fit its field's scheme type, or None."""
+        capabilities = self.capabilities
+        if fields and key not in fields:
+            return unknown
+        allowed = capabilities.enum_for(key)
+        if allowed and value not in allowed:
+            return f"expected one of {', '.join(map(str, allowed))}"
+        range_meta = capabilities.range_for(key)
+        if not range_meta:
+            return None
+        number = self._as_number(value)
+        if number is None:
+            return "expected a number"
+        minimum = self._as_number(range_meta.get("min"))
+        maximum = self._as_number(range_meta.get("max"))
+        if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+            return f"expected a value between {minimum} and {maximum}"
+        step = self._as_number(range_meta.get("step"))
+        offset = number - (minimum or 0.0)
+        if step and abs(round(offset / step) * step - offset) > 1e-6:
+            return f"expected a multiple of {step}"
+        return None
+
+    def _build_active_notifications(
+        self, active_states: dict[str, Any]
+    ) -> tuple[AtreaNotification, ...]:
+        """Normalize raw active states into sorted UI-ready notifications."""
+        notifications: list[AtreaNotification] = []
         language = hass_language(self.hass)
 
         for state_id, state in active_states.items():
-            if not isinstance(state, dict) or not state.get("active"):
+            if not state.get("active"):
                 continue
 
             base_state = self.capabilities.base_states.get(int(state_id), {}) if str(state_id).isdigit() else {}
@@ -1038,29 +2131,30 @@ class AtreaAMotionCoordinator:
             message_code = f"{prefix} {state_id}" if str(state_id) else prefix
 
             notifications.append(
-                {
-                    "id": int(state_id) if str(state_id).isdigit() else state_id,
-                    "code": code,
-                    "purpose": purpose,
-                    "severity": severity,
-                    "kind": kind,
-                    "prefix": prefix,
-                    "translation_key": translation_key_for(code),
-                    "message": message,
-                    "message_code": message_code,
-                    "full_message": f"{message_code} - {message}" if message else message_code,
-                    "active": True,
-                }
+                AtreaNotification(
+                    id=int(state_id) if str(state_id).isdigit() else state_id,
+                    code=code,
+                    purpose=purpose,
+                    severity=severity,
+                    kind=kind,
+                    prefix=prefix,
+                    translation_key=translation_key_for(code),
+                    message=message,
+                    message_code=message_code,
+                    full_message=f"{message_code} - {message}" if message else message_code,
+                )
             )
 
-        return sorted(
-            notifications,
-            key=lambda item: (
-                0 if item["kind"] == "fault" else 1,
-                -(item["severity"] or 0),
-                int(item["id"]) if isinstance(item["id"], int) else 999999,
-                item["code"] or "",
-            ),
+        return tuple(
+            sorted(
+                notifications,
+                key=lambda item: (
+                    0 if item.kind == "fault" else 1,
+                    -(item.severity or 0),
+                    item.id if isinstance(item.id, int) else 999999,
+                    item.code or "",
+                ),
+            )
         )
 
     @staticmethod
@@ -1094,17 +2188,17 @@ class AtreaAMotionCoordinator:
             return "fault"
         return "warning"
 
-    def _notify_state_changed(self) -> None:
+    def _notify_state_changed(self, changes: Iterable[str] = (ALL_FIELDS,)) -> None:
         """Broadcast updated state, coalescing bursts into one dispatcher tick."""
-        with self._dispatch_lock:
-            if self._dispatch_pending:
-                return
-            self._dispatch_pending = True
+        self._pending_changes |= set(changes)
+        if not self._pending_changes or self._dispatch_pending:
+            return
+        self._dispatch_pending = True
 
-        if self._loop is not None:
-            self._loop.call_soon_threadsafe(self._schedule_dispatch_on_loop)
+        if self._loop is None:
+            self.hass.add_job(self._dispatch_state_changed)
             return
-        self.hass.add_job(self._dispatch_state_changed)
+        self._schedule_dispatch_on_loop()
 
     def _schedule_dispatch_on_loop(self) -> None:
         """Debounce bursts of websocket updates before dispatching to entities."""
@@ -1123,14 +2217,29 @@ class AtreaAMotionCoordinator:
     def _dispatch_state_changed(self) -> None:
         """Dispatch a single pending state-change notification."""
         self._dispatch_handle = None
-        with self._dispatch_lock:
-            self._dispatch_pending = False
+        self._dispatch_pending = False
+        changes = self._pending_changes
+        self._pending_changes = set()
+        if not changes:
+            return
+
+        if ALL_FIELDS in changes:
+            listeners = set().union(*self._field_listeners.values())
+        else:
+            listeners = set().union(
+                *(self._field_listeners.get(key, ()) for key in changes),
+                self._field_listeners.get(ALL_FIELDS, ()),
+            )
+        for listener in listeners:
+            listener()
         async_dispatcher_send(self.hass, self.update_signal)
 
     async def publish_wss(self, payload: dict[str, Any]) -> bool:
         """Publish JSON over websocket."""
-        json_message = json.dumps(payload)
-        LOGGER.debug("Publishing websocket message: %s", json_message)
+        json_message = self.codec.dumps(payload)
+        self.flight_recorder.record(FRAME_OUT, json_message, payload.get("id"))
+        if self.capture is not None and payload.get("endpoint") != "login":
+            self.capture.record(FRAME_OUT, json_message)
 
         if (
             self.sent_counter >= 5
@@ -1139,16 +2248,16 @@ class AtreaAMotionCoordinator:
         ):
             LOGGER.warning("Websocket stopped answering, reconnecting")
             self.sent_counter = 0
-            self.ws.close()
+            await self.ws.async_close()
             self.socket_state = SOCK_DISCONNECTED
 
         for attempt in range(N_RETRY):
             if self.socket_state == SOCK_CONNECTED and self.ws is not None:
                 try:
-                    await self.hass.async_add_executor_job(self.ws.send, json_message)
+                    await self.ws.async_send(json_message)
                     self.sent_counter += 1
                     return True
-                except websocket.WebSocketConnectionClosedException as err:
+                except ConnectionError as err:
                     self.socket_state = SOCK_DISCONNECTED
                     LOGGER.debug("Websocket send error: %s", err)
             else:
@@ -7,11 +7,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, MOMENTS_ENDPOINT
 
 
 async def async_setup_entry(
@@ -22,10 +21,12 @@ async def async_setup_entry(
     """Set up button entities from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["atrea"]
     sensor_name = entry.data.get(CONF_NAME) or "atrea"
-    entities: list[ButtonEntity] = [AtreaRebootButton(coordinator, entry, sensor_name)]
-    if coordinator.value("filters") is not None or coordinator.value("last_filter_reset") is not None:
-        entities.append(AtreaFilterResetButton(coordinator, entry, sensor_name))
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            AtreaRebootButton(coordinator, entry, sensor_name),
+            AtreaFilterResetButton(coordinator, entry, sensor_name),
+        ]
+    )
 
 
 class AtreaFilterResetButton(ButtonEntity):
@@ -51,12 +52,12 @@ class AtreaFilterResetButton(ButtonEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            ("filters", "last_filter_reset"), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -64,6 +65,14 @@ class AtreaFilterResetButton(ButtonEntity):
         """Update entity state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether moments arrived and report filter tracking."""
+        return self.coordinator.endpoints_ready((MOMENTS_ENDPOINT,)) and (
+            self.coordinator.value("filters") is not None
+            or self.coordinator.value("last_filter_reset") is not None
+        )
+
     async def async_press(self) -> None:
         """Confirm filter replacement."""
         await self.coordinator.async_reset_filter_interval()
@@ -95,12 +104,12 @@ class AtreaRebootButton(ButtonEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -0,0 +1,66 @@
+"""Persistent per-board cache of parsed unit capabilities."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+CAPABILITY_STORAGE_KEY = f"{DOMAIN}.capabilities"
+CAPABILITY_STORAGE_VERSION = 1
+CAPABILITY_SAVE_DELAY = 10
+
+_DATA_CAPABILITY_CACHE = f"{DOMAIN}_capability_cache"
+
+
+class AtreaCapabilityCache:
+    """Capabilities per board number, valid only for the firmware version they came from.
+
+    One instance is shared by every config entry so concurrent setups read
+    and write a single storage file.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, CAPABILITY_STORAGE_VERSION, CAPABILITY_STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    async def async_get_latest(self, board_number: str) -> tuple[str, dict[str, Any]] | None:
+        """Return the firmware version and capabilities last cached for the board."""
+        await self._async_load()
+        entry = self._data.get(board_number) or {}
+        version = entry.get("version")
+        capabilities = entry.get("capabilities")
+        if not isinstance(version, str) or not isinstance(capabilities, dict):
+            return None
+        return version, capabilities
+
+    def async_set(self, board_number: str, version: str, capabilities: dict[str, Any]) -> None:
+        """Replace the board's entry and schedule a save."""
+        self._data[board_number] = {"version": version, "capabilities": capabilities}
+        self._store.async_delay_save(lambda: self._data, CAPABILITY_SAVE_DELAY)
+
+    async def _async_load(self) -> None:
+        """Read the storage file once; entries written before the load win."""
+        async with self._lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load()
+            if isinstance(stored, dict):
+                self._data = {**stored, **self._data}
+            self._loaded = True
+
+
+def async_get_capability_cache(hass: HomeAssistant) -> AtreaCapabilityCache:
+    """Return the cache shared by every config entry."""
+    cache = hass.data.get(_DATA_CAPABILITY_CACHE)
+    if cache is None:
+        cache = hass.data[_DATA_CAPABILITY_CACHE] = AtreaCapabilityCache(hass)
+    return cache
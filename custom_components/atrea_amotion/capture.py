@@ -0,0 +1,164 @@
+r"""Record websocket sessions to JSONL captures and replay them offline.
+
+A capture starts with a header line followed by one line per frame::
+
+    {"format": "atrea-capture", "version": 1}
+    {"t": 0.0123, "d": "out", "f": "{\"endpoint\": \"ui_info\", \"id\": 3, ...}"}
+    {"t": 0.0481, "d": "in", "f": "{\"id\": 3, \"code\": \"OK\", ...}"}
+
+``t`` is seconds since the capture started on the monotonic clock and ``f`` is
+the frame as sent or received, with the diagnostics TO_REDACT keys redacted
+when it is written out. Login frames are never captured.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from .flight_recorder import FRAME_IN, FRAME_OUT
+
+if TYPE_CHECKING:
+    from . import AtreaAMotionCoordinator
+
+CAPTURE_FORMAT = "atrea-capture"
+CAPTURE_VERSION = 1
+CAPTURE_MAX_FRAMES = 100_000
+# Ids the replaying coordinator allocates itself start here so they never
+# collide with the captured session's ids in the in-flight table.
+REPLAY_MESSAGE_ID_BASE = 2**30
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaCapturedFrame:
+    """One captured websocket frame."""
+
+    at: float
+    direction: str
+    frame: str
+
+
+@dataclass(slots=True)
+class AtreaReplayStats:
+    """Outcome of one replay run."""
+
+    frames_in: int = 0
+    frames_out: int = 0
+    # Undecodable outbound frames; inbound ones reach on_message as they did live.
+    invalid: int = 0
+    elapsed: float = 0.0
+
+
+class AtreaCaptureRecorder:
+    """Collect frames in memory until the capture is written out."""
+
+    def __init__(self, max_frames: int = CAPTURE_MAX_FRAMES) -> None:
+        self.max_frames = max_frames
+        self.frames: list[AtreaCapturedFrame] = []
+        self.dropped = 0
+        self._started_at = monotonic()
+
+    def record(self, direction: str, frame: str | bytes) -> None:
+        """Append a frame, counting it as dropped once the capture is full."""
+        if len(self.frames) >= self.max_frames:
+            self.dropped += 1
+            return
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8", "replace")
+        self.frames.append(AtreaCapturedFrame(monotonic() - self._started_at, direction, frame))
+
+    def write(self, path: Path) -> int:
+        """Write the redacted capture as JSONL and return the number of frames; blocking."""
+        write_capture(path, map(redact_frame, self.frames))
+        return len(self.frames)
+
+
+def redact_frame(item: AtreaCapturedFrame) -> AtreaCapturedFrame:
+    """Return the frame with TO_REDACT keys redacted, as diagnostics do for the flight recorder."""
+    # Only needed when a capture is written out, so loading the coordinator stays light.
+    from homeassistant.components.diagnostics import async_redact_data
+
+    from .diagnostics import TO_REDACT
+
+    try:
+        message = json.loads(item.frame)
+    except ValueError:
+        return item
+    redacted = async_redact_data(message, TO_REDACT)
+    if redacted == message:
+        return item
+    return AtreaCapturedFrame(item.at, item.direction, json.dumps(redacted))
+
+
+def write_capture(path: Path, frames: Iterable[AtreaCapturedFrame]) -> None:
+    """Write frames to a JSONL capture file; blocking."""
+    with Path(path).open("w", encoding="utf-8") as file:
+        file.write(json.dumps({"format": CAPTURE_FORMAT, "version": CAPTURE_VERSION}) + "\n")
+        for item in frames:
+            file.write(
+                json.dumps({"t": round(item.at, 6), "d": item.direction, "f": item.frame})
+                + "\n"
+            )
+
+
+def read_capture(path: Path) -> list[AtreaCapturedFrame]:
+    """Read a JSONL capture file; blocking. Raises ValueError for other formats."""
+    with Path(path).open(encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("format") != CAPTURE_FORMAT or header.get("version") != CAPTURE_VERSION:
+            raise ValueError(f"{path} is not an {CAPTURE_FORMAT} v{CAPTURE_VERSION} file")
+        return [
+            AtreaCapturedFrame(float(line["t"]), line["d"], line["f"])
+            for line in map(json.loads, filter(str.strip, file))
+        ]
+
+
+async def async_replay(
+    coordinator: AtreaAMotionCoordinator,
+    frames: Iterable[AtreaCapturedFrame],
+    speed: float | None = None,
+) -> AtreaReplayStats:
+    """Feed captured frames into a coordinator without any network.
+
+    Outbound frames only register their id and endpoint as in flight, so replies
+    resolve the same way they did live; the coordinator's own ids move to
+    REPLAY_MESSAGE_ID_BASE and up so they never collide with the captured ones. Inbound frames go through
+    ``on_message`` like live traffic. With ``speed`` unset frames are fed as fast
+    as possible; otherwise the captured timing is kept, scaled by ``speed``.
+    Requests the coordinator makes on its own still go to ``publish_wss``, so
+    callers should replace it when the coordinator has a transport.
+    """
+    stats = AtreaReplayStats()
+    codec = coordinator.codec
+    coordinator._msg_id = max(coordinator._msg_id, REPLAY_MESSAGE_ID_BASE)
+    started = perf_counter()
+    origin: float | None = None
+    for item in frames:
+        if speed:
+            origin = item.at if origin is None else origin
+            delay = (item.at - origin) / speed - (perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if item.direction == FRAME_IN:
+            stats.frames_in += 1
+            coordinator.on_message(None, item.frame)
+            continue
+        try:
+            message = codec.loads(item.frame)
+        except ValueError:
+            stats.invalid += 1
+            continue
+        if not isinstance(message, dict):
+            stats.invalid += 1
+            continue
+        if item.direction == FRAME_OUT:
+            stats.frames_out += 1
+            if isinstance(message.get("id"), int) and message.get("endpoint"):
+                coordinator._in_flight.add(message["id"], message["endpoint"])
+    stats.elapsed = perf_counter() - started
+    return stats
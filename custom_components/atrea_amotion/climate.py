@@ -11,9 +11,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, CONF_HOST, CONF_NAME, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import DISCOVERY_FIELD, DOMAIN
 
 
 def _coerce_temperature(value: object) -> float | None:
@@ -77,6 +76,41 @@ WORK_REGIME_TO_PRESET = {
     "DISBALANCE": "Disbalance",
 }
 
+CLIMATE_STATE_KEYS = (
+    DISCOVERY_FIELD,
+    "temp_ida",
+    "temp_oda",
+    "temp_eta",
+    "temp_sup",
+    "temp_eha",
+    "temp_request",
+    "stored_temp_request",
+    "work_regime",
+    "stored_work_regime",
+    "fan_power_req",
+    "fan_power_req_sup",
+    "fan_power_req_eta",
+    "stored_fan_power_req",
+    "stored_fan_power_req_sup",
+    "stored_fan_power_req_eta",
+    "mode_current",
+    "season_current",
+    "fan_sup_factor",
+    "fan_eta_factor",
+    "bypass_estim",
+    "damper_io_state",
+    "filter_due_date",
+    "notifications",
+    "warning_count",
+    "fault_count",
+    "highest_severity",
+    "primary_message",
+    "has_warning",
+    "has_fault",
+    "warning",
+    "fault",
+)
+
 
 def _available_presets(available_work_regimes: list[str]) -> list[str]:
     """Map exposed unit work regimes to climate presets."""
@@ -132,12 +166,12 @@ class AtreaAMotionClimate(ClimateEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            CLIMATE_STATE_KEYS, self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -145,6 +179,11 @@ class AtreaAMotionClimate(ClimateEntity):
         """Update entity state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether requests and capabilities have arrived."""
+        return self.coordinator.endpoints_ready(("ui_control_scheme", "ui_info"))
+
     @property
     def temperature_unit(self) -> str:
         """Return temperature unit."""
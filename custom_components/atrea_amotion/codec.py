@@ -0,0 +1,225 @@
+"""Wire codecs and typed payload decoding for Atrea aMotion frames."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import json
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+class AtreaCodec(Protocol):
+    """Serialize websocket frames; loads raises ValueError on malformed input."""
+
+    name: str
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode one frame."""
+
+    def dumps(self, obj: Any) -> str:
+        """Encode one frame."""
+
+
+class StdlibJsonCodec:
+    """Codec backed by the standard library json module."""
+
+    name = "json"
+
+    @staticmethod
+    def loads(data: str | bytes) -> Any:
+        """Decode one frame."""
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any) -> str:
+        """Encode one frame."""
+        return json.dumps(obj)
+
+
+class OrjsonCodec:
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    @staticmethod
+    def loads(data: str | bytes) -> Any:
+        """Decode one frame."""
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any) -> str:
+        """Encode one frame."""
+        return orjson.dumps(obj).decode()
+
+
+def default_codec() -> AtreaCodec:
+    """Return the fastest available codec."""
+    return OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    """Return dictionaries as-is and coerce null-like payloads to an empty mapping."""
+    return value if isinstance(value, dict) else {}
+
+
+def _unwrap(value: Any, key: str) -> dict[str, Any]:
+    """Return a payload that may arrive nested under its endpoint name."""
+    value = _as_dict(value)
+    return _as_dict(value[key]) if key in value else value
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaUiInfo:
+    """Validated ui_info payload."""
+
+    requests: dict[str, Any] = field(default_factory=dict)
+    unit: dict[str, Any] = field(default_factory=dict)
+    active_states: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def decode(cls, raw: Any) -> AtreaUiInfo:
+        """Build from a raw payload, dropping malformed active state entries."""
+        raw = _as_dict(raw)
+        active = _as_dict(_as_dict(raw.get("states")).get("active"))
+        return cls(
+            requests=_as_dict(raw.get("requests")),
+            unit=_as_dict(raw.get("unit")),
+            active_states={
+                str(state_id): state
+                for state_id, state in active.items()
+                if isinstance(state, dict)
+            },
+        )
+
+
+_NUMBER = (int, float)
+
+
+def _checked(
+    values: dict[str, Any],
+    fields: dict[str, tuple[type | tuple[type, ...], Callable[[], Any] | None]],
+) -> dict[str, Any]:
+    """Return values with known members of the wrong type replaced by their fallback.
+
+    A fallback of None clears the member and nulls are kept as is. The payload
+    is only copied when a member is rejected; booleans do not count as numbers.
+    """
+    checked = values
+    for key, (types, fallback) in fields.items():
+        if key not in values:
+            continue
+        value = values[key]
+        if (value is None and fallback is None) or (
+            isinstance(value, types) and (type(value) is not bool or types is bool)
+        ):
+            continue
+        if checked is values:
+            checked = dict(values)
+        checked[key] = None if fallback is None else fallback()
+    return checked
+
+
+_DIAGRAM_FIELDS = {
+    "bypass_estim": (_NUMBER, None),
+    "damper_io_state": (bool, None),
+    "fan_eta_operating_time": (_NUMBER, None),
+    "fan_sup_operating_time": (_NUMBER, None),
+}
+_CONTROL_PANEL_FIELDS = {
+    "stored": (dict, dict),
+    "current": (dict, dict),
+    "visible": (bool, None),
+    "remaining": (_NUMBER, None),
+}
+_MOMENTS_FIELDS = {
+    "filters": (dict, None),
+    "lastFilterReset": (dict, None),
+    "m1_register": (_NUMBER, None),
+    "m2_register": (_NUMBER, None),
+    "uv_lamp_register": (_NUMBER, None),
+    "uv_lamp_service_life": (_NUMBER, None),
+}
+
+
+# The payload structs below are rebuilt for every frame; unlike AtreaUiInfo they
+# are not frozen, which keeps construction off object.__setattr__.
+@dataclass(slots=True)
+class AtreaDiagramData:
+    """Validated ui_diagram_data payload; ``values`` is the checked payload with every member."""
+
+    bypass_estim: int | float | None = None
+    damper_io_state: bool | None = None
+    fan_eta_operating_time: int | float | None = None
+    fan_sup_operating_time: int | float | None = None
+    values: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def decode(cls, raw: Any) -> AtreaDiagramData:
+        """Build from a flat or nested payload."""
+        values = _checked(_unwrap(raw, "ui_diagram_data"), _DIAGRAM_FIELDS)
+        return cls(
+            values.get("bypass_estim"),
+            values.get("damper_io_state"),
+            values.get("fan_eta_operating_time"),
+            values.get("fan_sup_operating_time"),
+            values,
+        )
+
+
+@dataclass(slots=True)
+class AtreaControlPanel:
+    """Validated control_panel payload; ``values`` is the checked payload with every member."""
+
+    stored: dict[str, Any] = field(default_factory=dict)
+    current: dict[str, Any] = field(default_factory=dict)
+    visible: bool | None = None
+    remaining: int | float | None = None
+    values: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def decode(cls, raw: Any) -> AtreaControlPanel:
+        """Build from a flat or nested payload with dict-valued request maps."""
+        values = _checked(_unwrap(raw, "control_panel"), _CONTROL_PANEL_FIELDS)
+        return cls(
+            values.get("stored") or {},
+            values.get("current") or {},
+            values.get("visible"),
+            values.get("remaining"),
+            values,
+        )
+
+
+@dataclass(slots=True)
+class AtreaMoments:
+    """Validated control_admin/config/moments/get payload.
+
+    Filter dates stay date-part mappings; ``values`` is the checked payload
+    with every member.
+    """
+
+    filters: dict[str, Any] | None = None
+    last_filter_reset: dict[str, Any] | None = None
+    m1_register: int | float | None = None
+    m2_register: int | float | None = None
+    uv_lamp_register: int | float | None = None
+    uv_lamp_service_life: int | float | None = None
+    values: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def decode(cls, raw: Any) -> AtreaMoments:
+        """Build from a flat payload or one wrapped in ``get``."""
+        values = _checked(_unwrap(raw, "get"), _MOMENTS_FIELDS)
+        return cls(
+            values.get("filters"),
+            values.get("lastFilterReset"),
+            values.get("m1_register"),
+            values.get("m2_register"),
+            values.get("uv_lamp_register"),
+            values.get("uv_lamp_service_life"),
+            values,
+        )
@@ -11,3 +11,9 @@ LOGGER = logging.getLogger(__name__)
 API_TIMEOUT = 10
 
 DEFAULT_NAME = "Atrea aMotion"
+
+MOMENTS_ENDPOINT = "control_admin/config/moments/get"
+
+# Field listener keys for changes that are not a single value() key.
+ALL_FIELDS = "*"
+DISCOVERY_FIELD = "discovery"
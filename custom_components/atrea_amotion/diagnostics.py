@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -45,8 +46,8 @@ async def async_get_config_entry_diagnostics(
         },
         "state": {
             "discovery": coordinator.async_state().discovery,
-            "requests": coordinator.async_state().requests,
-            "unit": coordinator.async_state().unit,
+            "requests": dict(coordinator.async_state().requests),
+            "unit": dict(coordinator.async_state().unit),
             "active_states": coordinator.async_state().active_states,
             "derived": coordinator.async_state().derived,
             "control_panel": coordinator.async_state().control_panel,
@@ -60,7 +61,16 @@ async def async_get_config_entry_diagnostics(
             "model": coordinator.model,
             "version": coordinator.version,
             "board_type": coordinator.board_type,
+            "codec": coordinator.codec.name,
+            "outbound": asdict(coordinator.outbound_stats),
+            "in_flight": asdict(coordinator.in_flight_stats),
+            "optimistic": asdict(coordinator.optimistic.stats),
+            "polling": {
+                **asdict(coordinator.poll_stats),
+                "skip_ratio": coordinator.poll_stats.skip_ratio,
+            },
         },
+        "flight_recorder": coordinator.flight_recorder.dump(),
     }
 
     return async_redact_data(diagnostics, TO_REDACT)
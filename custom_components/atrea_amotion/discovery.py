@@ -44,6 +44,18 @@ class _InterfaceTarget:
     broadcast: str
 
 
+class _LazyHex:
+    """Format bytes as hex only if a log record is actually emitted."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: bytes) -> None:
+        self._payload = payload
+
+    def __str__(self) -> str:
+        return self._payload.hex(" ")
+
+
 class _DiscoveryProtocol(asyncio.DatagramProtocol):
     """Collect UDP responses for the discovery window."""
 
@@ -318,7 +330,7 @@ async def async_discover_devices(
                 "Atrea UDP discovery request sent target=%s:%s raw=%s",
                 target.broadcast,
                 DISCOVERY_PORT,
-                payload.hex(" "),
+                _LazyHex(payload),
             )
 
         await asyncio.sleep(timeout)
@@ -331,7 +343,7 @@ async def async_discover_devices(
             "Atrea UDP discovery raw response source=%s:%s raw=%s",
             source[0],
             source[1],
-            payload.hex(" "),
+            _LazyHex(payload),
         )
         parsed = parse_discovery_response(payload, source, seen)
         if parsed is None:
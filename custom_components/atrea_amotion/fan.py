@@ -9,7 +9,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
@@ -60,6 +59,8 @@ class AtreaAMotionFan(FanEntity):
         self.coordinator = coordinator
         self.request_key = request_key
         self.factor_key = request_key.replace("power_req", "factor")
+        self._request_slot = coordinator.request_slot(request_key)
+        self._factor_slot = coordinator.unit_slot(self.factor_key)
         self._attr_unique_id = f"{sensor_name}-{entry.data.get(CONF_HOST)}-{request_key}"
         self._attr_name = label
         self._device_unique_id = f"{sensor_name}-{entry.data.get(CONF_HOST)}"
@@ -74,12 +75,12 @@ class AtreaAMotionFan(FanEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (self.request_key, f"stored_{self.request_key}", self.factor_key), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -87,6 +88,11 @@ class AtreaAMotionFan(FanEntity):
         """Write updated state to Home Assistant."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether fan requests have arrived."""
+        return self.coordinator.endpoints_ready(("ui_info",))
+
     @staticmethod
     def _coerce_percentage(value: Any) -> int | None:
         """Convert supported percentage values to int."""
@@ -106,7 +112,7 @@ class AtreaAMotionFan(FanEntity):
         """Return the requested percentage."""
         value = self.coordinator.value(f"stored_{self.request_key}")
         if value is None:
-            value = self.coordinator.value(self.request_key)
+            value = self.coordinator.requested_value_at(self._request_slot)
         return self._coerce_percentage(value)
 
     @property
@@ -124,7 +130,7 @@ class AtreaAMotionFan(FanEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return supplemental measured fan data."""
         attributes: dict[str, Any] = {"request_key": self.request_key}
-        factor = self.coordinator.unit_value(self.factor_key)
+        factor = self.coordinator.unit_value_at(self._factor_slot)
         if factor is not None and self.request_key != "fan_power_req":
             attributes["actual_factor"] = round(factor, 1) if isinstance(factor, float) else factor
         stored_value = self.coordinator.value(f"stored_{self.request_key}")
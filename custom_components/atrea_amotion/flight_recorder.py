@@ -0,0 +1,68 @@
+"""Bounded record of recent websocket traffic for diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import UTC, datetime
+import json
+from time import time
+from typing import Any
+
+FLIGHT_RECORDER_SIZE = 200
+FRAME_IN = "in"
+FRAME_OUT = "out"
+REDACTED_FRAME = "**REDACTED**"
+
+
+class AtreaFlightRecorder:
+    """Keep the last frames exactly as sent or received.
+
+    Binary frames stay raw bytes. Text frames are kept as the str the websocket
+    library already decoded, since encoding them back would copy every frame.
+    Recording only appends a tuple; frames are parsed and formatted when
+    dumped. Frames whose body is a secret without a redactable key, such as
+    the login reply carrying the session token, are marked sensitive and
+    dumped as a placeholder.
+    """
+
+    __slots__ = ("_frames",)
+
+    def __init__(self, size: int = FLIGHT_RECORDER_SIZE) -> None:
+        self._frames: deque[tuple[float, str, int | None, str | bytes, bool]] = deque(
+            maxlen=size
+        )
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def record(
+        self,
+        direction: str,
+        frame: str | bytes,
+        message_id: int | None = None,
+        sensitive: bool = False,
+    ) -> None:
+        """Append one frame, dropping the oldest once full."""
+        self._frames.append((time(), direction, message_id, frame, sensitive))
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Return the recorded frames oldest first, decoding JSON bodies where possible."""
+        return [
+            {
+                "at": datetime.fromtimestamp(at, UTC).isoformat(),
+                "direction": direction,
+                "id": message_id,
+                "frame": REDACTED_FRAME if sensitive else _decode(frame),
+            }
+            for at, direction, message_id, frame, sensitive in self._frames
+        ]
+
+
+def _decode(frame: str | bytes) -> Any:
+    """Parse a frame so diagnostics redaction can reach its keys."""
+    try:
+        return json.loads(frame)
+    except ValueError:
+        if isinstance(frame, bytes):
+            return frame.decode("utf-8", "replace")
+        return frame
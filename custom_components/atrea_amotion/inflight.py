@@ -0,0 +1,110 @@
+"""Bounded tracking of websocket requests awaiting a response."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import monotonic
+
+REQUEST_TTL = 30.0
+MAX_IN_FLIGHT = 256
+MAX_MESSAGE_ID = 2**31 - 1
+
+
+@dataclass(slots=True)
+class AtreaInFlightStats:
+    """Counters for tracked websocket requests."""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+    completed: int = 0
+    timed_out: int = 0
+    overflowed: int = 0
+    late_replies: int = 0
+    orphaned_replies: int = 0
+
+
+class AtreaInFlightTracker:
+    """Map message ids to endpoints with a deadline per entry.
+
+    Entries are evicted once their deadline passes or when the table is full.
+    Evicted ids are remembered in a bounded tombstone table so a late reply can
+    still be matched to its endpoint. Only ids missing from both tables count
+    as orphaned.
+    """
+
+    def __init__(self, ttl: float = REQUEST_TTL, max_size: int = MAX_IN_FLIGHT) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats = AtreaInFlightStats()
+        self._entries: dict[int, tuple[str, float]] = {}
+        self._expired: dict[int, str] = {}
+
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, message_id: int, endpoint: str, now: float | None = None) -> None:
+        """Track a sent request until its response or deadline."""
+        now = monotonic() if now is None else now
+        self.evict(now)
+        if len(self._entries) >= self.max_size:
+            oldest = next(iter(self._entries))
+            self._expire(oldest)
+            self.stats.overflowed += 1
+        self._entries[message_id] = (endpoint, now + self.ttl)
+        self.stats.in_flight = len(self._entries)
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+
+    def discard(self, message_id: int) -> None:
+        """Forget a request that will never be answered, such as a failed send."""
+        self._entries.pop(message_id, None)
+        self.stats.in_flight = len(self._entries)
+
+    def expire(self, message_id: int) -> None:
+        """Give up on a request whose caller stopped waiting, keeping it for a late reply."""
+        if message_id in self._entries:
+            self._expire(message_id)
+            self.stats.timed_out += 1
+
+    def pop(self, message_id: int) -> str | None:
+        """Return the endpoint for a reply, matching late replies to expired requests."""
+        entry = self._entries.pop(message_id, None)
+        if entry is not None:
+            self.stats.completed += 1
+            self.stats.in_flight = len(self._entries)
+            return entry[0]
+        endpoint = self._expired.pop(message_id, None)
+        if endpoint is not None:
+            self.stats.late_replies += 1
+            return endpoint
+        self.stats.orphaned_replies += 1
+        return None
+
+    def evict(self, now: float | None = None) -> int:
+        """Expire every entry past its deadline and return how many were removed."""
+        now = monotonic() if now is None else now
+        evicted = 0
+        # Entries share one TTL, so insertion order is deadline order.
+        while self._entries:
+            message_id = next(iter(self._entries))
+            if self._entries[message_id][1] > now:
+                break
+            self._expire(message_id)
+            self.stats.timed_out += 1
+            evicted += 1
+        return evicted
+
+    def _expire(self, message_id: int) -> None:
+        """Move an entry to the bounded tombstone table."""
+        endpoint, _ = self._entries.pop(message_id)
+        self._expired[message_id] = endpoint
+        if len(self._expired) > self.max_size:
+            del self._expired[next(iter(self._expired))]
+        self.stats.in_flight = len(self._entries)
+
+
+def next_message_id(message_id: int) -> int:
+    """Return the id after message_id, wrapping before it outgrows a signed 32-bit int."""
+    return 1 if message_id >= MAX_MESSAGE_ID else message_id + 1
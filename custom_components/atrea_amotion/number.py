@@ -6,7 +6,6 @@ from homeassistant.components.number import NumberDeviceClass, NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, UnitOfTemperature
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -52,6 +51,7 @@ class AtreaConfigNumber(NumberEntity):
     ) -> None:
         self.coordinator = coordinator
         self._key = key
+        self._slot = coordinator.config_slot(key)
         range_meta = coordinator.async_capabilities().range_for(key)
         self._attr_unique_id = f"{sensor_name}-{entry.data.get(CONF_HOST)}-{key}"
         self._attr_name = name
@@ -70,12 +70,12 @@ class AtreaConfigNumber(NumberEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (self._key,), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -83,10 +83,15 @@ class AtreaConfigNumber(NumberEntity):
         """Update state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether the unit configuration has arrived."""
+        return self.coordinator.endpoints_ready(("user_config_get",))
+
     @property
     def native_value(self) -> float | None:
         """Return current config value."""
-        value = self.coordinator.config_value(self._key)
+        value = self.coordinator.config_value_at(self._slot)
         if value is None:
             return None
         return float(value)
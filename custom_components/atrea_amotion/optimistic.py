@@ -0,0 +1,124 @@
+"""Ledger of optimistic control values awaiting confirmation from the unit."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+OPTIMISTIC_DEADLINE = 15.0
+# Mode changes pass through STARTUP before the unit reports the new regime.
+OPTIMISTIC_DEADLINES = {"work_regime": 30.0}
+# State views that carry control variables: ui_info requests and the
+# stored/current maps of control_panel.
+OPTIMISTIC_VIEWS = ("requests", "stored", "current")
+
+
+@dataclass(slots=True)
+class AtreaOptimisticStats:
+    """Counters for optimistic control values."""
+
+    tracked: int = 0
+    confirmed: int = 0
+    expired: int = 0
+    masked_echoes: int = 0
+    last_confirm_latency: float | None = None
+    max_confirm_latency: float = 0.0
+
+
+@dataclass(slots=True)
+class _OptimisticEntry:
+    value: Any
+    started_at: float
+    deadline: float
+    # Last value each view really reported, restored when the deadline passes;
+    # views that never reported one drop the variable instead.
+    actual: dict[str, Any]
+    pending_views: set[str] = field(default_factory=lambda: set(OPTIMISTIC_VIEWS))
+
+
+class AtreaOptimisticLedger:
+    """Hold sent control values over stale echoes until each view confirms them.
+
+    A view confirms a variable by echoing the sent value or by not carrying
+    the variable in an echo of that view; payloads without the view confirm
+    nothing. Until then its echoes report the optimistic value instead. Past
+    the deadline echoes are no longer masked and ``expire`` returns the last
+    real values so the caller can roll them back in.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _OptimisticEntry] = {}
+        self.stats = AtreaOptimisticStats()
+
+    @property
+    def pending(self) -> set[str]:
+        return set(self._entries)
+
+    @property
+    def next_deadline(self) -> float | None:
+        return min((entry.deadline for entry in self._entries.values()), default=None)
+
+    def track(
+        self,
+        variables: Mapping[str, Any],
+        views: Mapping[str, Mapping[str, Any]],
+        now: float,
+    ) -> None:
+        """Start or restart the deadline for each sent variable."""
+        for key, value in variables.items():
+            previous = self._entries.get(key)
+            actual = (
+                previous.actual
+                if previous is not None
+                else {view: values[key] for view, values in views.items() if key in values}
+            )
+            deadline = now + OPTIMISTIC_DEADLINES.get(key, OPTIMISTIC_DEADLINE)
+            self._entries[key] = _OptimisticEntry(value, now, deadline, actual)
+            self.stats.tracked += 1
+
+    def mask(self, view: str, echo: Mapping[str, Any], now: float) -> dict[str, Any]:
+        """Return the echo with unconfirmed variables replaced by their optimistic values."""
+        masked = dict(echo)
+        for key, entry in list(self._entries.items()):
+            if view not in entry.pending_views:
+                continue
+            if key not in echo or echo[key] == entry.value:
+                entry.pending_views.discard(view)
+                if not entry.pending_views:
+                    self._confirm(key, entry, now)
+                continue
+            entry.actual[view] = echo[key]
+            if entry.deadline <= now:
+                continue
+            masked[key] = entry.value
+            self.stats.masked_echoes += 1
+        return masked
+
+    def expire(
+        self, now: float
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, set[str]]]:
+        """Drop entries past their deadline.
+
+        Returns the real values to restore per view and, per view, the variables
+        it never really reported, which the caller should remove again.
+        """
+        expired = [key for key, entry in self._entries.items() if entry.deadline <= now]
+        restore: dict[str, dict[str, Any]] = {}
+        drop: dict[str, set[str]] = {}
+        for key in expired:
+            entry = self._entries.pop(key)
+            self.stats.expired += 1
+            for view in entry.pending_views:
+                if view in entry.actual:
+                    restore.setdefault(view, {})[key] = entry.actual[view]
+                else:
+                    drop.setdefault(view, set()).add(key)
+        return restore, drop
+
+    def _confirm(self, key: str, entry: _OptimisticEntry, now: float) -> None:
+        del self._entries[key]
+        latency = now - entry.started_at
+        self.stats.confirmed += 1
+        self.stats.last_confirm_latency = latency
+        self.stats.max_confirm_latency = max(self.stats.max_confirm_latency, latency)
@@ -6,7 +6,6 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -106,12 +105,12 @@ class AtreaBypassSelect(SelectEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            ("bypass_control_req", "stored_bypass_control_req"), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -119,6 +118,11 @@ class AtreaBypassSelect(SelectEntity):
         """Update state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether bypass requests have arrived."""
+        return self.coordinator.endpoints_ready(("ui_info",))
+
     @property
     def current_option(self) -> str | None:
         """Return selected bypass mode."""
@@ -153,6 +157,7 @@ class AtreaConfigSelect(SelectEntity):
     ) -> None:
         self.coordinator = coordinator
         self._key = key
+        self._slot = coordinator.config_slot(key)
         self._labels = labels
         self._raw_options = coordinator.async_capabilities().enum_for(key)
         self._attr_unique_id = f"{sensor_name}-{entry.data.get(CONF_HOST)}-{key}"
@@ -170,12 +175,12 @@ class AtreaConfigSelect(SelectEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (self._key,), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -183,10 +188,15 @@ class AtreaConfigSelect(SelectEntity):
         """Update state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether the unit configuration has arrived."""
+        return self.coordinator.endpoints_ready(("user_config_get",))
+
     @property
     def current_option(self) -> str | None:
         """Return selected config option."""
-        option = self.coordinator.config_value(self._key)
+        option = self.coordinator.config_value_at(self._slot)
         if option is None:
             return None
         return _label_for_option(option, self._labels)
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import date, datetime
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,12 +14,25 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, PERCENTAGE, UnitOfTemperature
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    PERCENTAGE,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, MOMENTS_ENDPOINT
+from .telemetry import TELEMETRY_FIELDS, TELEMETRY_STATISTICS, TELEMETRY_WINDOW
 
-from .const import DOMAIN
+# Rolling statistics move as samples enter and leave the window, not only when
+# the source value changes, so their sensors refresh on a timer instead.
+TELEMETRY_REFRESH_INTERVAL = timedelta(minutes=1)
 
 
 def _date_from_parts(value: Any) -> date | None:
@@ -72,6 +85,10 @@ class AtreaSensorDescription(SensorEntityDescription):
 
     value_key: str = ""
     request_key: str | None = None
+    attribute_keys: tuple[str, ...] = ()
+    statistic: str | None = None
+    unit_keys: tuple[str, ...] = ()
+    endpoints: tuple[str, ...] = ("ui_info",)
 
 
 ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
@@ -136,6 +153,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_key="stored_fan_power_req_eta",
+        endpoints=("control_panel",),
         request_key="fan_power_req_eta",
     ),
     AtreaSensorDescription(
@@ -145,6 +163,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_key="stored_fan_power_req_sup",
+        endpoints=("control_panel",),
         request_key="fan_power_req_sup",
     ),
     AtreaSensorDescription(
@@ -154,6 +173,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_key="stored_fan_power_req",
+        endpoints=("control_panel",),
         request_key="fan_power_req",
     ),
     AtreaSensorDescription(
@@ -172,6 +192,36 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_key="fan_sup_factor",
     ),
+    AtreaSensorDescription(
+        key="heat_recovery_efficiency",
+        name="Heat recovery efficiency",
+        icon="mdi:heat-wave",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_key="heat_recovery_efficiency",
+        unit_keys=("temp_oda", "temp_sup", "temp_eta"),
+    ),
+    AtreaSensorDescription(
+        key="fan_power",
+        name="Estimated fan power",
+        icon="mdi:flash",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_key="fan_power",
+        unit_keys=("fan_sup_factor", "fan_eta_factor"),
+    ),
+    AtreaSensorDescription(
+        key="fan_energy",
+        name="Estimated fan energy",
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_key="fan_energy",
+        unit_keys=("fan_sup_factor", "fan_eta_factor"),
+    ),
     AtreaSensorDescription(
         key="bypass_estim",
         name="Bypass estimation",
@@ -179,12 +229,14 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_key="bypass_estim",
+        endpoints=("ui_diagram_data",),
     ),
     AtreaSensorDescription(
         key="damper_io_state",
         name="Damper state",
         icon="mdi:door-sliding",
         value_key="damper_io_state",
+        endpoints=("ui_diagram_data",),
     ),
     AtreaSensorDescription(
         key="fan_eta_operating_time",
@@ -193,6 +245,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement="h",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_key="fan_eta_operating_time",
+        endpoints=("ui_diagram_data",),
     ),
     AtreaSensorDescription(
         key="fan_sup_operating_time",
@@ -201,6 +254,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement="h",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_key="fan_sup_operating_time",
+        endpoints=("ui_diagram_data",),
     ),
     AtreaSensorDescription(
         key="season_current",
@@ -218,6 +272,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:alert-outline",
         state_class=SensorStateClass.MEASUREMENT,
         value_key="active_state_count",
+        attribute_keys=("active_state_names", "active_states"),
     ),
     AtreaSensorDescription(
         key="active_notifications",
@@ -225,6 +280,15 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:message-alert-outline",
         state_class=SensorStateClass.MEASUREMENT,
         value_key="notification_count",
+        attribute_keys=(
+            "notifications",
+            "warning_count",
+            "fault_count",
+            "highest_severity",
+            "primary_message",
+            "has_warning",
+            "has_fault",
+        ),
     ),
     AtreaSensorDescription(
         key="filter_interval_active",
@@ -238,6 +302,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:calendar-alert",
         device_class=SensorDeviceClass.DATE,
         value_key="filter_due_date",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="last_filter_reset",
@@ -245,6 +310,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:calendar-check",
         device_class=SensorDeviceClass.DATE,
         value_key="last_filter_reset",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="filter_service_days_remaining",
@@ -252,6 +318,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:calendar-clock",
         state_class=SensorStateClass.MEASUREMENT,
         value_key="filter_due_date",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="m1_register",
@@ -262,6 +329,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement="h",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_key="m1_register",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="m2_register",
@@ -272,6 +340,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement="h",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_key="m2_register",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="motor_role_mapping",
@@ -280,6 +349,13 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         value_key="motor_role_mapping",
+        endpoints=(MOMENTS_ENDPOINT, "ui_diagram_data"),
+        attribute_keys=(
+            "m1_register",
+            "m2_register",
+            "fan_sup_operating_time",
+            "fan_eta_operating_time",
+        ),
     ),
     AtreaSensorDescription(
         key="uv_lamp_register",
@@ -287,6 +363,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         icon="mdi:lightbulb",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_key="uv_lamp_register",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
     AtreaSensorDescription(
         key="uv_lamp_service_life",
@@ -295,6 +372,7 @@ ATREA_SENSORS: tuple[AtreaSensorDescription, ...] = (
         native_unit_of_measurement="h",
         state_class=SensorStateClass.MEASUREMENT,
         value_key="uv_lamp_service_life",
+        endpoints=(MOMENTS_ENDPOINT,),
     ),
 )
 
@@ -312,6 +390,33 @@ UNIT_SENSOR_KEYS = {
 }
 
 
+def _telemetry_description(
+    description: AtreaSensorDescription, statistic: str
+) -> AtreaSensorDescription:
+    """Derive a disabled-by-default rolling statistic sensor from a telemetry sensor."""
+    unit = description.native_unit_of_measurement
+    is_slope = statistic == "slope"
+    return replace(
+        description,
+        key=f"{description.key}_{statistic}",
+        name=f"{description.name} {statistic} ({TELEMETRY_WINDOW // 60} min)",
+        device_class=None if is_slope else description.device_class,
+        native_unit_of_measurement=f"{unit}/h" if is_slope else unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        statistic=statistic,
+    )
+
+
+ATREA_TELEMETRY_SENSORS: tuple[AtreaSensorDescription, ...] = tuple(
+    _telemetry_description(description, statistic)
+    for description in ATREA_SENSORS
+    if description.value_key in TELEMETRY_FIELDS
+    for statistic in TELEMETRY_STATISTICS
+)
+
+
 async def async_setup_entry(
     hass,
     entry: ConfigEntry,
@@ -323,7 +428,7 @@ async def async_setup_entry(
     async_add_entities(
         [
             AtreaAMotionSensor(coordinator, entry, description, sensor_name)
-            for description in ATREA_SENSORS
+            for description in (*ATREA_SENSORS, *ATREA_TELEMETRY_SENSORS)
             if _is_supported_sensor(coordinator, description)
         ]
     )
@@ -335,6 +440,8 @@ def _is_supported_sensor(coordinator, description: AtreaSensorDescription) -> bo
         return description.request_key in coordinator.async_capabilities().requests
     if description.value_key in UNIT_SENSOR_KEYS:
         return description.value_key in coordinator.async_capabilities().unit_fields
+    if description.unit_keys:
+        return coordinator.async_capabilities().unit_fields.issuperset(description.unit_keys)
     return True
 
 
@@ -359,13 +466,19 @@ class AtreaAMotionSensor(SensorEntity):
         self._unsubscribe = None
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        """Subscribe to coordinator updates, or to a timer for rolling statistics."""
+        if self.entity_description.statistic is not None:
+            self._unsubscribe = async_track_time_interval(
+                self.hass, self._handle_statistic_refresh, TELEMETRY_REFRESH_INTERVAL
+            )
+            return
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (self.entity_description.value_key, *self.entity_description.attribute_keys),
+            self._handle_coordinator_update,
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -373,10 +486,24 @@ class AtreaAMotionSensor(SensorEntity):
         """Update HA state from coordinator."""
         self.schedule_update_ha_state()
 
+    @callback
+    def _handle_statistic_refresh(self, now: datetime) -> None:
+        """Write the current rolling statistic."""
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return whether the endpoints backing this sensor have answered."""
+        return self.coordinator.endpoints_ready(self.entity_description.endpoints)
+
     @property
     def native_value(self) -> float | int | str | date | None:
         """Return sensor value."""
         key = self.entity_description.key
+        if self.entity_description.statistic is not None:
+            stats = self.coordinator.telemetry_stats(self.entity_description.value_key)
+            value = getattr(stats, self.entity_description.statistic, None)
+            return round(value, 2) if value is not None else None
         raw_value = self.coordinator.value(self.entity_description.value_key)
 
         if key == "filter_due_date":
@@ -394,7 +521,7 @@ class AtreaAMotionSensor(SensorEntity):
             if isinstance(raw_value, (int, float)):
                 return int(raw_value // 3600)
             return None
-        if key == "motor_role_mapping":
+        if key in {"motor_role_mapping", "fan_energy"}:
             return raw_value
 
         if isinstance(raw_value, float):
@@ -404,10 +531,16 @@ class AtreaAMotionSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes for composite sensors."""
+        if self.entity_description.statistic is not None:
+            stats = self.coordinator.telemetry_stats(self.entity_description.value_key)
+            return {
+                "samples": stats.samples if stats is not None else 0,
+                "window_seconds": TELEMETRY_WINDOW,
+            }
         if self.entity_description.key == "active_state_count":
             return {
                 "active_state_names": self.coordinator.value("active_state_names") or [],
-                "active_states": self.coordinator.value("active_states") or {},
+                "active_states": self.coordinator.async_state().active_states,
             }
         if self.entity_description.key == "active_notifications":
             return {
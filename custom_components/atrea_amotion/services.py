@@ -0,0 +1,186 @@
+"""Integration-wide services acting on several units at once."""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from . import AtreaAMotionCoordinator
+
+SERVICE_APPLY_PROFILE = "apply_profile"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
+ATTR_CONFIG = "config"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DEVICE_ID = "device_id"
+
+PROFILE_CONTROL_KEYS = (
+    "work_regime",
+    "fan_power_req",
+    "fan_power_req_sup",
+    "fan_power_req_eta",
+    "temp_request",
+    "bypass_control_req",
+)
+
+TARGET_SCHEMA = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+}
+
+CAPTURE_SCHEMA = vol.Schema(TARGET_SCHEMA)
+
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Optional("work_regime"): cv.string,
+        vol.Optional("fan_power_req"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional("fan_power_req_sup"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional("fan_power_req_eta"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional("temp_request"): vol.Coerce(float),
+        vol.Optional("bypass_control_req"): cv.string,
+        vol.Optional(ATTR_CONFIG): vol.Schema({cv.string: object}),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        control = {key: call.data[key] for key in PROFILE_CONTROL_KEYS if key in call.data}
+        config = dict(call.data.get(ATTR_CONFIG, {}))
+        if not control and not config:
+            raise ServiceValidationError("The profile does not set any value")
+
+        coordinators = _resolve_targets(hass, call)
+        if not coordinators:
+            raise ServiceValidationError("No loaded Atrea aMotion unit matches the targets")
+
+        results = await asyncio.gather(
+            *(
+                _async_apply_to_unit(coordinator, control, config)
+                for coordinator in coordinators.values()
+            )
+        )
+        units = dict(zip(coordinators, results))
+        failed = [entry_id for entry_id, result in units.items() if not result["success"]]
+        if failed:
+            LOGGER.warning("Profile not fully applied to %s", ", ".join(failed))
+        return {"units": units}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_start_capture(call: ServiceCall) -> None:
+        coordinators = _resolve_targets(hass, call)
+        if not coordinators:
+            raise ServiceValidationError("No loaded Atrea aMotion unit matches the targets")
+        for coordinator in coordinators.values():
+            coordinator.start_capture()
+
+    async def async_stop_capture(call: ServiceCall) -> ServiceResponse:
+        coordinators = _resolve_targets(hass, call)
+        units: dict[str, Any] = {}
+        for entry_id, coordinator in coordinators.items():
+            if coordinator.capture is None:
+                continue
+            path = hass.config.path(f"{DOMAIN}_capture_{entry_id}.jsonl")
+            frames = await coordinator.async_stop_capture(path)
+            LOGGER.info("Wrote %s captured frames of %s to %s", frames, coordinator.name, path)
+            units[entry_id] = {"name": coordinator.name, "path": path, "frames": frames}
+        if not units:
+            raise ServiceValidationError("No targeted Atrea aMotion unit is capturing")
+        return {"units": units}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_CAPTURE, async_start_capture, schema=CAPTURE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        async_stop_capture,
+        schema=CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _resolve_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, AtreaAMotionCoordinator]:
+    """Map targeted config entry ids to their coordinators; no target means every unit."""
+    loaded: dict[str, Any] = hass.data.get(DOMAIN, {})
+    entry_ids = set(call.data.get(ATTR_CONFIG_ENTRY_ID, []))
+    device_ids = call.data.get(ATTR_DEVICE_ID, [])
+    if device_ids:
+        registry = dr.async_get(hass)
+        for device_id in device_ids:
+            device = registry.async_get(device_id)
+            if device is None:
+                raise ServiceValidationError(f"Unknown device {device_id}")
+            entry_ids.update(device.config_entries)
+    if not entry_ids and not device_ids:
+        entry_ids = set(loaded)
+    return {
+        entry_id: loaded[entry_id]["atrea"]
+        for entry_id in sorted(entry_ids)
+        if entry_id in loaded
+    }
+
+
+async def _async_apply_to_unit(
+    coordinator: AtreaAMotionCoordinator,
+    control: dict[str, Any],
+    config: dict[str, Any],
+) -> dict[str, Any]:
+    """Send the profile to one unit as one control and one config message.
+
+    Control values the unit's scheme does not accept are reported and left out,
+    as config values are by async_set_config_values.
+    """
+    started = perf_counter()
+    result: dict[str, Any] = {"name": coordinator.name, "success": False}
+    invalid = coordinator.control_errors(control)
+    if invalid:
+        result["invalid"] = invalid
+        control = {key: value for key, value in control.items() if key not in invalid}
+    try:
+        writes = []
+        if control:
+            writes.append(coordinator.async_control(control))
+        if config:
+            writes.append(coordinator.async_set_config_values(config))
+        outcomes = await asyncio.gather(*writes)
+    except Exception as err:  # noqa: BLE001 - reported per unit instead of failing the call
+        result["error"] = str(err) or type(err).__name__
+    else:
+        success = not invalid
+        if control:
+            result["control"] = outcomes[0]
+            success = success and bool(outcomes[0])
+        if config:
+            statuses = outcomes[-1]
+            result["config"] = {
+                key: {"status": status.status, "detail": status.detail}
+                for key, status in statuses.items()
+            }
+            success = success and all(status.ok for status in statuses.values())
+        result["success"] = success
+    result["latency"] = round(perf_counter() - started, 3)
+    return result
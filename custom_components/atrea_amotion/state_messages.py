@@ -49,16 +49,26 @@ def load_state_messages(language: str) -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=None)
+def state_message_index(language: str | None) -> dict[str, str]:
+    """Return every known state message for a language with its fallback chain merged in.
+
+    Reads translation files on first use per language, so call it from an
+    executor before the event loop needs it.
+    """
+    index: dict[str, str] = {}
+    for candidate in reversed(language_candidates(language)):
+        index.update(
+            (code, message) for code, message in load_state_messages(candidate).items() if message
+        )
+    return index
+
+
 def translate_state_message(language: str | None, code: str | None) -> str | None:
     """Return a localized message for a websocket state code."""
     if not code:
         return None
-
-    for candidate in language_candidates(language):
-        message = load_state_messages(candidate).get(code)
-        if message:
-            return message
-    return None
+    return state_message_index(language).get(code)
 
 
 def translation_key_for(code: str | None) -> str | None:
@@ -73,3 +83,8 @@ def hass_language(hass: Any) -> str | None:
     config = getattr(hass, "config", None)
     language = getattr(config, "language", None)
     return language if isinstance(language, str) and language else None
+
+
+async def async_prepare_state_messages(hass: Any) -> dict[str, str]:
+    """Build the state message index for the Home Assistant language in an executor."""
+    return await hass.async_add_executor_job(state_message_index, hass_language(hass))
@@ -0,0 +1,187 @@
+"""Compact slot-backed storage for the unit, request and config buckets."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+# Slot kinds; numbers live in the typed array, everything else in a side table.
+_EMPTY = 0
+_FLOAT = 1
+_INT = 2
+_OBJECT = 3
+# Larger integers would lose precision as doubles.
+_MAX_EXACT_INT = 2**53
+
+
+class AtreaFieldIndex:
+    """Stable, append-only mapping of field names to slot numbers.
+
+    Fields are reserved from ``ui_control_scheme``; fields the scheme did not
+    list get a slot on first write. Slots never move, so callers
+    can resolve a field once and keep the number.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, fields: Iterable[str] = ()) -> None:
+        self._slots: dict[str, int] = {}
+        self.reserve(fields)
+
+    def reserve(self, fields: Iterable[str]) -> None:
+        """Give fields that do not have a slot yet the next free ones."""
+        slots = self._slots
+        for key in fields:
+            if key not in slots:
+                slots[key] = len(slots)
+
+    def slot(self, key: str) -> int:
+        """Return the slot of a field, reserving one if needed."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._slots)
+        return slot
+
+    def get(self, key: str) -> int | None:
+        return self._slots.get(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class AtreaFieldStore(Mapping[str, Any]):
+    """Mapping over the slots of a field index, written through update and replace.
+
+    Numbers are kept in a typed ``array('d')`` and only enum strings and other
+    objects in a side table, so a refresh writes into existing slots instead of
+    keeping another dict with its own key strings. ``update`` and ``replace``
+    return the fields that changed, which makes a separate diff unnecessary.
+    """
+
+    __slots__ = ("index", "_numbers", "_kinds", "_objects", "_size")
+
+    def __init__(self, fields: Iterable[str] = ()) -> None:
+        self.index = AtreaFieldIndex()
+        self._numbers = array("d")
+        self._kinds = bytearray()
+        self._objects: dict[int, Any] = {}
+        self._size = 0
+        self.reserve(fields)
+
+    def reserve(self, fields: Iterable[str]) -> None:
+        """Allocate empty slots for fields that do not have one yet."""
+        self.index.reserve(fields)
+        self._grow()
+
+    def slot(self, key: str) -> int:
+        """Return the stable slot of a field for later ``at`` reads."""
+        slot = self.index.slot(key)
+        if slot >= len(self._kinds):
+            self._grow()
+        return slot
+
+    def at(self, slot: int) -> Any:
+        """Return the value in a slot, or None when the field is unset."""
+        kind = self._kinds[slot]
+        if kind == _FLOAT:
+            return self._numbers[slot]
+        if kind == _INT:
+            return int(self._numbers[slot])
+        if kind == _OBJECT:
+            return self._objects[slot]
+        return None
+
+    def update(self, values: Mapping[str, Any]) -> set[str]:
+        """Write the given fields in place and return the ones that changed."""
+        changed: set[str] = set()
+        slots = self.index._slots
+        numbers = self._numbers
+        kinds = self._kinds
+        objects = self._objects
+        for key, value in values.items():
+            slot = slots.get(key)
+            if slot is None:
+                slot = self.slot(key)
+            kind = kinds[slot]
+            value_type = type(value)
+            if (value_type is float or value_type is int) and (
+                value_type is float or -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+            ):
+                new_kind = _FLOAT if value_type is float else _INT
+                if (kind == _FLOAT or kind == _INT) and numbers[slot] == value:
+                    kinds[slot] = new_kind
+                    continue
+                if kind == _OBJECT:
+                    del objects[slot]
+                numbers[slot] = value
+                kinds[slot] = new_kind
+            else:
+                if kind == _OBJECT and objects[slot] == value:
+                    continue
+                objects[slot] = value
+                kinds[slot] = _OBJECT
+            if kind == _EMPTY:
+                self._size += 1
+            changed.add(key)
+        return changed
+
+    def replace(self, values: Mapping[str, Any]) -> set[str]:
+        """Make the store equal to values, clearing absent fields, and return the changes."""
+        changed = self.update(values)
+        if self._size != len(values):
+            for key, slot in self.index._slots.items():
+                if self._kinds[slot] != _EMPTY and key not in values:
+                    self._clear(slot)
+                    changed.add(key)
+        return changed
+
+    def discard(self, key: str) -> bool:
+        """Clear a field and return whether it was set."""
+        slot = self.index.get(key)
+        if slot is None or self._kinds[slot] == _EMPTY:
+            return False
+        self._clear(slot)
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self.index.get(key)
+        if slot is None or self._kinds[slot] == _EMPTY:
+            return default
+        return self.at(slot)
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self.index.get(key)
+        if slot is None or self._kinds[slot] == _EMPTY:
+            raise KeyError(key)
+        return self.at(slot)
+
+    def __contains__(self, key: object) -> bool:
+        slot = self.index.get(key)  # type: ignore[arg-type]
+        return slot is not None and self._kinds[slot] != _EMPTY
+
+    def __iter__(self) -> Iterator[str]:
+        kinds = self._kinds
+        return (key for key, slot in self.index._slots.items() if kinds[slot] != _EMPTY)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def _clear(self, slot: int) -> None:
+        if self._kinds[slot] == _OBJECT:
+            del self._objects[slot]
+        self._kinds[slot] = _EMPTY
+        self._numbers[slot] = 0.0
+        self._size -= 1
+
+    def _grow(self) -> None:
+        missing = len(self.index) - len(self._kinds)
+        if missing > 0:
+            self._numbers.extend((0.0,) * missing)
+            self._kinds.extend(bytes(missing))
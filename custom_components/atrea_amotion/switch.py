@@ -8,7 +8,6 @@ from homeassistant.components.switch import SwitchEntity, SwitchEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -21,6 +20,7 @@ class AtreaSwitchDescription(SwitchEntityDescription):
 
     value_key: str = ""
     setter: str = ""
+    endpoint: str = ""
 
 
 ATREA_SWITCHES: tuple[AtreaSwitchDescription, ...] = (
@@ -30,6 +30,7 @@ ATREA_SWITCHES: tuple[AtreaSwitchDescription, ...] = (
         icon="mdi:transit-connection-variant",
         value_key="modbus_enabled",
         setter="async_set_modbus_enabled",
+        endpoint="modbus",
     ),
     AtreaSwitchDescription(
         key="autoupdate_enabled",
@@ -37,6 +38,7 @@ ATREA_SWITCHES: tuple[AtreaSwitchDescription, ...] = (
         icon="mdi:package-up",
         value_key="autoupdate_enabled",
         setter="async_set_autoupdate_enabled",
+        endpoint="update",
     ),
 )
 
@@ -49,7 +51,6 @@ async def async_setup_entry(hass, entry: ConfigEntry, async_add_entities: AddEnt
         [
             AtreaToggleSwitch(coordinator, entry, description, sensor_name)
             for description in ATREA_SWITCHES
-            if coordinator.value(description.value_key) is not None
         ]
     )
 
@@ -84,12 +85,12 @@ class AtreaToggleSwitch(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
-        self._unsubscribe = async_dispatcher_connect(
-            self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+        self._unsubscribe = self.coordinator.async_add_field_listener(
+            (self.entity_description.value_key,), self._handle_coordinator_update
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Disconnect dispatcher listener."""
+        """Disconnect coordinator listener."""
         if self._unsubscribe is not None:
             self._unsubscribe()
 
@@ -97,6 +98,14 @@ class AtreaToggleSwitch(SwitchEntity):
         """Update state."""
         self.schedule_update_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return whether the backing endpoint has answered with a supported value."""
+        return (
+            self.coordinator.endpoints_ready((self.entity_description.endpoint,))
+            and self.coordinator.value(self.entity_description.value_key) is not None
+        )
+
     @property
     def is_on(self) -> bool:
         """Return switch state."""
@@ -0,0 +1,145 @@
+"""In-memory telemetry history with rolling statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+import numpy as np
+
+TELEMETRY_FIELDS = (
+    "temp_oda",
+    "temp_ida",
+    "temp_sup",
+    "temp_eta",
+    "temp_eha",
+    "fan_sup_factor",
+    "fan_eta_factor",
+)
+TELEMETRY_WINDOW = 3600
+# Pushes, polls and control bursts arrive irregularly; sampling on a fixed
+# cadence keeps bursts from weighting the statistics and lets the capacity
+# cover the whole window.
+TELEMETRY_SAMPLE_INTERVAL = 10
+TELEMETRY_CAPACITY = TELEMETRY_WINDOW // TELEMETRY_SAMPLE_INTERVAL + 1
+TELEMETRY_STATISTICS = ("mean", "min", "max", "slope")
+
+
+@dataclass(frozen=True, slots=True)
+class AtreaRollingStats:
+    """Rolling statistics over a time window; slope is the least-squares trend per hour."""
+
+    samples: int
+    mean: float
+    min: float
+    max: float
+    slope: float | None
+
+
+class AtreaRingBuffer:
+    """Preallocated NumPy ring of (monotonic time, value) samples.
+
+    Statistics are cached per appended sample and number of samples in the
+    window, so the sensors reading the same field between two samples share
+    one computation.
+    """
+
+    __slots__ = ("_times", "_values", "_head", "_count", "_appended", "_cached")
+
+    def __init__(self, capacity: int = TELEMETRY_CAPACITY) -> None:
+        self._times = np.zeros(capacity, dtype=float)
+        self._values = np.zeros(capacity, dtype=float)
+        self._head = 0
+        self._count = 0
+        self._appended = 0
+        self._cached: tuple[tuple[int, int], AtreaRollingStats] | None = None
+
+    def append(self, value: float, now: float) -> None:
+        """Add a sample, overwriting the oldest once full."""
+        head = self._head
+        self._times[head] = now
+        self._values[head] = value
+        self._head = (head + 1) % self._times.size
+        self._count = min(self._count + 1, self._times.size)
+        self._appended += 1
+
+    def stats(self, window: float, now: float) -> AtreaRollingStats | None:
+        """Return statistics for samples newer than window seconds, or None if empty."""
+        start = now - window
+        samples = self._samples_since(start)
+        if not samples:
+            return None
+        key = (self._appended, samples)
+        if self._cached is not None and self._cached[0] == key:
+            return self._cached[1]
+
+        times = self._times[: self._count]
+        mask = times >= start
+        times = times[mask]
+        values = self._values[: self._count][mask]
+        slope = None
+        if values.size > 1:
+            offsets = times - times.mean()
+            spread = float(np.dot(offsets, offsets))
+            if spread:
+                slope = float(np.dot(offsets, values - values.mean()) / spread * 3600)
+        stats = AtreaRollingStats(
+            samples=int(values.size),
+            mean=float(values.mean()),
+            min=float(values.min()),
+            max=float(values.max()),
+            slope=slope,
+        )
+        self._cached = (key, stats)
+        return stats
+
+    def _samples_since(self, start: float) -> int:
+        """Count samples at or after start; each side of the head is sorted by time."""
+        if self._count < self._times.size:
+            segments = (self._times[: self._count],)
+        else:
+            segments = (self._times[self._head :], self._times[: self._head])
+        return sum(
+            segment.size - int(np.searchsorted(segment, start, side="left"))
+            for segment in segments
+        )
+
+
+class AtreaTelemetryHistory:
+    """One ring buffer per numeric unit field, sampled at most once per interval."""
+
+    def __init__(
+        self,
+        fields: Iterable[str] = TELEMETRY_FIELDS,
+        capacity: int = TELEMETRY_CAPACITY,
+        sample_interval: float = TELEMETRY_SAMPLE_INTERVAL,
+    ) -> None:
+        self._buffers = {key: AtreaRingBuffer(capacity) for key in fields}
+        self._sample_interval = sample_interval
+        self._sampled_at = float("-inf")
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self._buffers)
+
+    def record(self, values: Mapping[str, Any], now: float | None = None) -> None:
+        """Append the numeric values of tracked fields unless the last sample is too recent."""
+        now = monotonic() if now is None else now
+        if now - self._sampled_at < self._sample_interval:
+            return
+        self._sampled_at = now
+        for key, buffer in self._buffers.items():
+            value = values.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                buffer.append(value, now)
+
+    def stats(
+        self, key: str, window: float = TELEMETRY_WINDOW, now: float | None = None
+    ) -> AtreaRollingStats | None:
+        """Return rolling statistics for a tracked field, or None without samples."""
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return None
+        return buffer.stats(window, monotonic() if now is None else now)
@@ -0,0 +1,113 @@
+"""Asyncio websocket transport for Atrea aMotion units."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from .const import LOGGER
+
+WS_CONNECT_TIMEOUT = 10
+WS_HEARTBEAT = 30
+
+
+class AtreaWebsocketTransport:
+    """Run the unit websocket on the event loop with websocket-client style callbacks.
+
+    Callbacks keep the ``on_open(ws)``, ``on_message(ws, msg)``,
+    ``on_close(ws, code, msg)`` and ``on_error(ws, error)`` signatures, but are
+    invoked directly on the event loop instead of from a reader thread.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        on_open: Callable[[Any], None],
+        on_message: Callable[[Any, str | bytes], None],
+        on_close: Callable[[Any, int | None, str | None], None],
+        on_error: Callable[[Any, Exception | None], None],
+        connect_timeout: float = WS_CONNECT_TIMEOUT,
+    ) -> None:
+        self.url = url
+        self._session = session
+        self._on_open = on_open
+        self._on_message = on_message
+        self._on_close = on_close
+        self._on_error = on_error
+        self._connect_timeout = connect_timeout
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader_task: asyncio.Task | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return whether the websocket is currently open."""
+        return self._ws is not None and not self._ws.closed
+
+    async def async_connect(self) -> bool:
+        """Open the websocket and start the reader task."""
+        try:
+            self._ws = await asyncio.wait_for(
+                self._session.ws_connect(self.url, heartbeat=WS_HEARTBEAT),
+                timeout=self._connect_timeout,
+            )
+        except (aiohttp.ClientError, OSError, TimeoutError) as err:
+            self._callback(self._on_error, err)
+            return False
+
+        self._callback(self._on_open)
+        self._reader_task = asyncio.create_task(self._reader_loop(self._ws))
+        return True
+
+    async def async_send(self, message: str) -> None:
+        """Send one text frame, raising ConnectionResetError when closed."""
+        ws = self._ws
+        if ws is None or ws.closed:
+            raise ConnectionResetError("Websocket is not connected")
+        try:
+            await ws.send_str(message)
+        except aiohttp.ClientError as err:
+            raise ConnectionResetError(str(err)) from err
+
+    async def async_close(self) -> None:
+        """Close the websocket and wait for the reader task to finish."""
+        ws = self._ws
+        if ws is not None and not ws.closed:
+            await ws.close()
+        reader_task = self._reader_task
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            try:
+                await reader_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _reader_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Deliver inbound frames to the message callback until the socket closes."""
+        try:
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self._callback(self._on_message, msg.data)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    self._callback(self._on_error, ws.exception())
+                    break
+        except (aiohttp.ClientError, OSError) as err:
+            self._callback(self._on_error, err)
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            self._reader_task = None
+            self._callback(self._on_close, ws.close_code, None)
+
+    def _callback(self, callback: Callable[..., None], *args: Any) -> None:
+        """Invoke a callback without letting its errors kill the reader.
+
+        Handler errors are only logged: ``on_error`` is reserved for transport
+        failures, so a bad payload or a handler bug does not force a reconnect.
+        """
+        try:
+            callback(self, *args)
+        except Exception:  # noqa: BLE001 - a handler bug must not stop the reader
+            LOGGER.exception("Error in websocket callback %s", getattr(callback, "__name__", callback))
@@ -0,0 +1,327 @@
+"""Local aMotion unit simulator for tests and benchmarks.
+
+Serves ``ws://host:port/api/ws`` with the login/token handshake and answers
+every endpoint the coordinator uses from recorded payloads. It also answers the
+MessagePack UDP discovery request. Latency, jitter and message loss apply to
+every outbound websocket message.
+
+Run stand-alone with ``python -m tests.simulator --port 8080``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+from collections import Counter
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import random
+import secrets
+from typing import Any
+
+from aiohttp import WSMsgType, web
+import msgpack
+
+DEFAULT_PAYLOADS = Path(__file__).parent / "fixtures" / "amotion_unit.json"
+
+
+@dataclass(slots=True)
+class SimulatorConfig:
+    """Runtime knobs for the simulated unit."""
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    udp_port: int | None = 0
+    username: str = "user"
+    password: str = "pass"
+    latency: float = 0.0
+    jitter: float = 0.0
+    loss: float = 0.0
+    push_interval: float | None = None
+    seed: int | None = None
+    payloads_path: Path = DEFAULT_PAYLOADS
+
+
+@dataclass(slots=True)
+class _Session:
+    """One connected websocket client."""
+
+    ws: web.WebSocketResponse
+    authorized: bool = False
+
+
+class _DiscoveryResponder(asyncio.DatagramProtocol):
+    """Answer MessagePack discovery broadcasts with the unit discovery payload."""
+
+    def __init__(self, simulator: AMotionUnitSimulator) -> None:
+        self._simulator = simulator
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the datagram transport."""
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Reply to any well-formed discovery request."""
+        try:
+            request = msgpack.unpackb(data, raw=False)
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError, ValueError):
+            return
+        if not isinstance(request, dict) or self.transport is None:
+            return
+        self._simulator.request_counts["udp_discovery"] += 1
+        self.transport.sendto(
+            msgpack.packb(self._simulator.payloads["discovery"], use_bin_type=True), addr
+        )
+
+
+class AMotionUnitSimulator:
+    """Websocket and UDP stand-in for an aMotion unit."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self.payloads: dict[str, Any] = json.loads(
+            self.config.payloads_path.read_text(encoding="utf-8")
+        )
+        self.request_counts: Counter[str] = Counter()
+        self.dropped_messages = 0
+        self._random = random.Random(self.config.seed)
+        self._tokens: set[str] = set()
+        self._sessions: list[_Session] = []
+        self._runner: web.AppRunner | None = None
+        self._site: web.TCPSite | None = None
+        self._udp: _DiscoveryResponder | None = None
+        self._push_task: asyncio.Task | None = None
+        self.port: int | None = None
+        self.udp_port: int | None = None
+
+    @property
+    def host(self) -> str:
+        """Return the host:port string to hand to the coordinator."""
+        return f"{self.config.host}:{self.port}"
+
+    async def async_start(self) -> None:
+        """Start the websocket server, UDP responder and optional push loop."""
+        app = web.Application()
+        app.router.add_get("/api/ws", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self.config.host, self.config.port)
+        await self._site.start()
+        self.port = self._site._server.sockets[0].getsockname()[1]
+
+        if self.config.udp_port is not None:
+            loop = asyncio.get_running_loop()
+            _, protocol = await loop.create_datagram_endpoint(
+                lambda: _DiscoveryResponder(self),
+                local_addr=(self.config.host, self.config.udp_port),
+            )
+            self._udp = protocol
+            self.udp_port = protocol.transport.get_extra_info("sockname")[1]
+
+        if self.config.push_interval:
+            self._push_task = asyncio.create_task(self._push_loop(self.config.push_interval))
+
+    async def async_stop(self) -> None:
+        """Stop every server task and disconnect clients."""
+        if self._push_task is not None:
+            self._push_task.cancel()
+            await asyncio.gather(self._push_task, return_exceptions=True)
+            self._push_task = None
+        for session in list(self._sessions):
+            await session.ws.close()
+        if self._udp is not None and self._udp.transport is not None:
+            self._udp.transport.close()
+            self._udp = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def async_push_event(self, event: str, args: Any = None) -> None:
+        """Push an event to every authorized client."""
+        if args is None:
+            args = self._event_payload(event)
+        for session in list(self._sessions):
+            if session.authorized:
+                await self._send(session, {"event": event, "args": args, "type": "event"})
+
+    def set_active_states(self, active: dict[str, dict[str, Any]]) -> None:
+        """Replace the active states reported by ui_info."""
+        self.payloads["ui_info"]["states"]["active"] = active
+
+    def set_unit_values(self, **values: Any) -> None:
+        """Update measured unit values reported by ui_info."""
+        self.payloads["ui_info"]["unit"].update(values)
+
+    def _event_payload(self, event: str) -> Any:
+        """Return the default payload for a pushed event."""
+        if event == "ui_info":
+            return copy.deepcopy(self.payloads["ui_info"])
+        if event == "control_panel":
+            return copy.deepcopy(self.payloads["control_panel"]["control_panel"])
+        return {}
+
+    async def _push_loop(self, interval: float) -> None:
+        """Periodically push live telemetry like a real unit."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.async_push_event("ui_info")
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve one websocket client."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        session = _Session(ws)
+        self._sessions.append(session)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    message = json.loads(msg.data)
+                except json.JSONDecodeError:
+                    continue
+                await self._handle_request(session, message)
+        finally:
+            self._sessions.remove(session)
+        return ws
+
+    async def _handle_request(self, session: _Session, message: dict[str, Any]) -> None:
+        """Answer one websocket request."""
+        endpoint = message.get("endpoint")
+        message_id = message.get("id")
+        args = message.get("args")
+        self.request_counts[endpoint] += 1
+
+        if endpoint == "login":
+            await self._reply(session, message_id, *self._login(session, args or {}))
+            return
+        if not session.authorized:
+            await self._reply(session, message_id, "UNAUTHORIZED", None)
+            return
+
+        events: list[str] = []
+        if endpoint == "control":
+            response = self._apply_control((args or {}).get("variables", {}))
+            events = ["control_panel", "ui_info"]
+        elif endpoint == "config":
+            self.payloads["user_config_get"]["variables"].update(
+                (args or {}).get("variables", {})
+            )
+            response = "OK"
+        elif endpoint == "unit/set":
+            self.payloads["discovery"].update(args or {})
+            response = "OK"
+            events = ["unit_config"]
+        elif endpoint == "modbus/set":
+            enabled = bool((args or {}).get("enable"))
+            self.payloads["modbus"].update(
+                {"active": enabled, "enable": enabled, "port": 502 if enabled else None}
+            )
+            response = "OK"
+        elif endpoint == "update/set":
+            self.payloads["update"].update(args or {})
+            response = copy.deepcopy(self.payloads["update"])
+        elif endpoint == "control_admin/config/moments/reset/filter":
+            response = {"moments_filter_reset": "OK"}
+        elif endpoint == "reboot":
+            response = "OK"
+        elif endpoint in self.payloads:
+            response = copy.deepcopy(self.payloads[endpoint])
+        else:
+            await self._reply(session, message_id, "NOT_FOUND", None)
+            return
+
+        await self._reply(session, message_id, "OK", response)
+        for event in events:
+            await self.async_push_event(event)
+
+    def _login(self, session: _Session, args: dict[str, Any]) -> tuple[str, Any]:
+        """Issue tokens for credentials and authorize sessions presenting one."""
+        if "token" in args:
+            session.authorized = args["token"] in self._tokens
+            return ("OK", None) if session.authorized else ("UNAUTHORIZED", None)
+        if args.get("username") == self.config.username and args.get(
+            "password"
+        ) == self.config.password:
+            token = secrets.token_hex(16)
+            self._tokens.add(token)
+            return "OK", token
+        return "UNAUTHORIZED", None
+
+    def _apply_control(self, variables: dict[str, Any]) -> str:
+        """Store requested control variables."""
+        requests = self.payloads["ui_info"]["requests"]
+        panel = self.payloads["control_panel"]["control_panel"]
+        requests.update(variables)
+        panel["stored"].update(variables)
+        panel["current"].update(variables)
+        return "OK"
+
+    async def _reply(self, session: _Session, message_id: Any, code: str, response: Any) -> None:
+        """Send a response frame."""
+        await self._send(
+            session, {"id": message_id, "code": code, "response": response, "type": "response"}
+        )
+
+    async def _send(self, session: _Session, payload: dict[str, Any]) -> None:
+        """Send one frame, applying configured latency, jitter and loss."""
+        if self.config.loss and self._random.random() < self.config.loss:
+            self.dropped_messages += 1
+            return
+        delay = self.config.latency + self._random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if not session.ws.closed:
+            await session.ws.send_str(json.dumps(payload))
+
+
+def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--udp-port", type=int, default=8210)
+    parser.add_argument("--username", default="user")
+    parser.add_argument("--password", default="pass")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--push-interval", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--payloads", type=Path, default=DEFAULT_PAYLOADS)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        host=args.host,
+        port=args.port,
+        udp_port=args.udp_port,
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        loss=args.loss,
+        push_interval=args.push_interval,
+        seed=args.seed,
+        payloads_path=args.payloads,
+    )
+
+    async def _run() -> None:
+        simulator = AMotionUnitSimulator(config)
+        await simulator.async_start()
+        print(f"aMotion simulator on ws://{simulator.host}/api/ws udp={simulator.udp_port}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await simulator.async_stop()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
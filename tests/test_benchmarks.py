@@ -0,0 +1,24 @@
+"""Smoke tests for the inbound benchmark suite."""
+
+from __future__ import annotations
+
+from benchmarks.inbound import ACTIVE_STATE_COUNTS, compare, run
+
+
+def test_inbound_benchmarks_cover_every_scenario() -> None:
+    """Every payload/active-state combination should run and report numbers."""
+    results = run(iterations=2, repeats=1)
+
+    assert len(results) == 3 * len(ACTIVE_STATE_COUNTS)
+    assert all(result["ns_per_message"] > 0 for result in results.values())
+
+
+def test_compare_flags_regressions_beyond_threshold() -> None:
+    """Regressions should be reported only when slower than the threshold."""
+    baseline = {"a": {"ns_per_message": 100.0}, "b": {"ns_per_message": 100.0}}
+    results = {"a": {"ns_per_message": 110.0}, "b": {"ns_per_message": 200.0}}
+
+    regressions = compare(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b:")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from homeassistant.const import CONF_HOST, CONF_NAME
 
 from custom_components.atrea_amotion.button import async_setup_entry
-from custom_components.atrea_amotion.const import DOMAIN
+from custom_components.atrea_amotion.const import DOMAIN, MOMENTS_ENDPOINT
 
 
 class _MockCoordinator:
@@ -16,6 +16,7 @@ class _MockCoordinator:
     def __init__(self) -> None:
         self.reset_called = False
         self.reboot_called = False
+        self.ready: set[str] = set()
 
     def value(self, key: str):
         if key == "filters":
@@ -24,6 +25,9 @@ class _MockCoordinator:
             return {"day": 21, "month": 3, "year": 2026}
         return None
 
+    def endpoints_ready(self, endpoints) -> bool:
+        return set(endpoints) <= self.ready
+
     async def async_reset_filter_interval(self) -> bool:
         self.reset_called = True
         return True
@@ -58,6 +62,10 @@ async def test_buttons_are_created_and_call_actions(hass, MockConfigEntry) -> No
         entity for entity in added_entities if entity.name == "Confirm filter replacement"
     )
 
+    assert filter_button.available is False
+    coordinator.ready.add(MOMENTS_ENDPOINT)
+    assert filter_button.available is True
+
     await reboot_button.async_press()
     await filter_button.async_press()
 
@@ -0,0 +1,58 @@
+"""Tests for websocket capture and replay."""
+
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.replay import replay
+from custom_components.atrea_amotion.__init__ import AtreaAMotionCoordinator
+from custom_components.atrea_amotion.capture import REPLAY_MESSAGE_ID_BASE, read_capture
+
+from .simulator import AMotionUnitSimulator
+
+
+async def test_captured_session_replays_to_the_same_state(
+    hass, socket_enabled, tmp_path
+) -> None:
+    """A session captured against the simulator should rebuild the same state offline."""
+    simulator = AMotionUnitSimulator()
+    await simulator.async_start()
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host=simulator.host,
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="unknown",
+    )
+    path = tmp_path / "session.jsonl"
+
+    try:
+        coordinator.start_capture()
+        await coordinator.async_initialize()
+        await coordinator.async_control({"work_regime": "OFF"})
+        await asyncio.sleep(0.05)
+        frames_written = await coordinator.async_stop_capture(str(path))
+    finally:
+        await coordinator.async_shutdown()
+        await simulator.async_stop()
+
+    frames = await hass.async_add_executor_job(read_capture, path)
+    assert len(frames) == frames_written
+    assert not any("password" in item.frame for item in frames)
+    assert any('"board_number": "**REDACTED**"' in item.frame for item in frames)
+    board_number = simulator.payloads["discovery"]["board_number"]
+    assert not any(board_number in item.frame for item in frames)
+    assert [item.at for item in frames] == sorted(item.at for item in frames)
+
+    replayed, stats = await replay(frames)
+
+    assert stats.invalid == 0
+    assert stats.frames_in > 0
+    assert replayed._msg_id >= REPLAY_MESSAGE_ID_BASE
+    assert replayed.capabilities.requests == coordinator.capabilities.requests
+    assert replayed.version == coordinator.version
+    assert replayed.value("temp_oda") == coordinator.value("temp_oda")
+    assert replayed.requested_value("work_regime") == coordinator.requested_value("work_regime")
+    assert replayed.value("notification_count") == coordinator.value("notification_count")
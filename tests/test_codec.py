@@ -0,0 +1,71 @@
+"""Tests for wire codecs and typed payload decoding."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.atrea_amotion.codec import (
+    AtreaControlPanel,
+    AtreaDiagramData,
+    AtreaMoments,
+    AtreaUiInfo,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+
+
+@pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonCodec()])
+def test_codecs_round_trip_and_reject_malformed_frames(codec) -> None:
+    """Every backend should round-trip frames and raise ValueError on bad input."""
+    frame = {"endpoint": "control", "id": 7, "args": {"variables": {"temp_request": 21.5}}}
+
+    assert codec.loads(codec.dumps(frame)) == frame
+    with pytest.raises(ValueError):
+        codec.loads("{not json")
+
+
+def test_default_codec_prefers_orjson() -> None:
+    """The fast backend should be used when it is installed."""
+    assert default_codec().name == "orjson"
+
+
+def test_payload_structs_validate_once_at_decode() -> None:
+    """Malformed members should be coerced or dropped when decoding."""
+    ui_info = AtreaUiInfo.decode(
+        {
+            "requests": None,
+            "unit": {"temp_oda": 2.3},
+            "states": {"active": {"105": {"active": True}, "106": None}},
+        }
+    )
+
+    assert ui_info.requests == {}
+    assert ui_info.unit == {"temp_oda": 2.3}
+    assert ui_info.active_states == {"105": {"active": True}}
+    assert AtreaUiInfo.decode(None) == AtreaUiInfo()
+    assert AtreaMoments.decode({"get": {"m1_register": 3600}}).values == {"m1_register": 3600}
+    assert AtreaControlPanel.decode(
+        {"control_panel": {"stored": None, "visible": True}}
+    ).values == {"stored": {}, "visible": True}
+
+
+def test_known_payload_members_are_decoded_into_typed_fields() -> None:
+    """Known members should be validated into fields while unknown ones pass through."""
+    diagram = AtreaDiagramData.decode(
+        {"ui_diagram_data": {"bypass_estim": "n/a", "damper_io_state": "open", "extra": 5}}
+    )
+    assert diagram.bypass_estim is None
+    assert diagram.damper_io_state is None
+    assert diagram.values == {"bypass_estim": None, "damper_io_state": None, "extra": 5}
+
+    moments = AtreaMoments.decode(
+        {"filters": {"year": 2026, "month": 3, "day": 1}, "lastFilterReset": "x", "m2_register": 7}
+    )
+    assert moments.filters == {"year": 2026, "month": 3, "day": 1}
+    assert moments.last_filter_reset is None
+    assert (moments.m1_register, moments.m2_register) == (None, 7)
+
+    panel = AtreaControlPanel.decode({"visible": True, "remaining": True})
+    assert (panel.visible, panel.remaining, panel.stored) == (True, None, {})
+    assert panel.values == {"visible": True, "remaining": None}
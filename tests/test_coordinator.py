@@ -2,7 +2,28 @@
 
 from __future__ import annotations
 
-from custom_components.atrea_amotion.__init__ import AtreaAMotionCoordinator
+import asyncio
+from time import monotonic
+
+from custom_components.atrea_amotion.__init__ import (
+    BOOTSTRAP_ENDPOINTS,
+    CAPABILITY_ENDPOINTS,
+    CONFIG_INVALID,
+    CONFIG_NOT_CONFIRMED,
+    CONTROL_BURST_REFRESH_CYCLES,
+    POLL_INTERVAL_MIN,
+    REFRESH_POLICIES,
+    REFRESH_TIMER,
+    SETUP_ENDPOINTS,
+    AtreaAMotionCoordinator,
+    AtreaConfigWriteResult,
+)
+from custom_components.atrea_amotion.cache import (
+    CAPABILITY_STORAGE_KEY,
+    async_get_capability_cache,
+)
+from custom_components.atrea_amotion.const import ALL_FIELDS
+from custom_components.atrea_amotion.flight_recorder import AtreaFlightRecorder
 
 
 def test_ui_diagram_data_nested_payload_is_unwrapped(hass) -> None:
@@ -226,7 +247,8 @@ async def test_async_request_message_times_out_when_response_never_arrives(hass)
 
     assert response is None
     assert coordinator._response_waiters == {}
-    assert coordinator._pending_requests == {}
+    assert len(coordinator._in_flight) == 0
+    assert coordinator.in_flight_stats.timed_out == 1
 
 
 async def test_async_set_config_refreshes_readback_and_confirms_applied(hass) -> None:
@@ -273,11 +295,13 @@ def test_config_variables_for_write_groups_auto_season_settings(hass) -> None:
         version="1.0.0",
     )
 
-    coordinator.state.config = {
-        "season_request": "AUTO_TODA",
-        "season_switch_temp": 18.0,
-        "temp_oda_mean_interval": "HOURS_3",
-    }
+    coordinator.state.config.replace(
+        {
+            "season_request": "AUTO_TODA",
+            "season_switch_temp": 18.0,
+            "temp_oda_mean_interval": "HOURS_3",
+        }
+    )
 
     assert coordinator._config_variables_for_write("temp_oda_mean_interval", "HOURS_1") == {
         "season_request": "AUTO_TODA",
@@ -287,3 +311,896 @@ def test_config_variables_for_write_groups_auto_season_settings(hass) -> None:
     assert coordinator._config_variables_for_write("season_request", "HEATING") == {
         "season_request": "HEATING"
     }
+
+
+async def test_async_set_config_values_validates_and_confirms_in_one_round_trip(hass) -> None:
+    """Batch config writes should skip invalid values and share one write and one readback."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    coordinator.capabilities.config_fields = {"temp_oda_mean_interval", "bypass_temp", "zone"}
+    coordinator.capabilities.enum_values = {"temp_oda_mean_interval": ["HOURS_1", "HOURS_3"]}
+    coordinator.capabilities.range_types = {
+        "bypass_temp": {"min": 10.0, "max": 30.0, "step": 0.5},
+        "zone": {"min": 0, "max": 5, "step": 1},
+    }
+    writes: list[dict[str, object]] = []
+    config_reads = 0
+
+    async def fake_async_request(endpoint: str, args: object = None) -> bool:
+        nonlocal config_reads
+        assert endpoint == "user_config_get"
+        config_reads += 1
+        coordinator._apply_user_config(
+            {"variables": {"temp_oda_mean_interval": "HOURS_1", "bypass_temp": 21.0}}
+        )
+        return True
+
+    async def fake_async_request_message(endpoint: str, args: object = None, timeout: float = 10):
+        assert endpoint == "config"
+        writes.append(args["variables"])  # type: ignore[index]
+        return {"id": 1, "code": "OK", "response": "OK", "type": "response"}
+
+    coordinator.async_request = fake_async_request  # type: ignore[method-assign]
+    coordinator._async_request_message = fake_async_request_message  # type: ignore[method-assign]
+
+    results = await coordinator.async_set_config_values(
+        {
+            "temp_oda_mean_interval": "HOURS_1",
+            "bypass_temp": 22.5,
+            "zone": 1.5,
+            "unknown": 1,
+        }
+    )
+
+    assert writes == [{"temp_oda_mean_interval": "HOURS_1", "bypass_temp": 22.5}]
+    assert config_reads == 1
+    assert results["temp_oda_mean_interval"].ok
+    assert results["bypass_temp"].status == CONFIG_NOT_CONFIRMED
+    assert results["zone"].status == CONFIG_INVALID
+    assert results["unknown"].status == CONFIG_INVALID
+
+    assert await coordinator.async_set_config_values({"bypass_temp": 40}) == {
+        "bypass_temp": AtreaConfigWriteResult(
+            CONFIG_INVALID, "expected a value between 10.0 and 30.0"
+        )
+    }
+    assert len(writes) == 1
+
+
+def test_control_errors_follow_the_control_scheme(hass) -> None:
+    """Control values should be checked against the unit's requests, enums and ranges."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    coordinator.capabilities.requests = {"work_regime", "temp_request", "fan_power_req"}
+    coordinator.capabilities.enum_values = {"work_regime": ["AUTO", "VENTILATION"]}
+    coordinator.capabilities.range_types = {"temp_request": {"min": 10, "max": 40, "step": 0.5}}
+
+    assert coordinator.control_errors(
+        {
+            "work_regime": "DISBALANCE",
+            "temp_request": 21.5,
+            "fan_power_req": 60,
+            "fan_power_req_sup": 60,
+        }
+    ) == {
+        "work_regime": "expected one of AUTO, VENTILATION",
+        "fan_power_req_sup": "unknown control variable",
+    }
+    assert coordinator.control_errors({"temp_request": 45.0}) == {
+        "temp_request": "expected a value between 10.0 and 40.0"
+    }
+
+
+async def test_async_bootstrap_pipelines_requests_and_reports_missing(hass) -> None:
+    """Bootstrap should send every metadata request before waiting on any reply."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+
+    published: list[str] = []
+
+    async def fake_publish_wss(payload):
+        published.append(payload["endpoint"])
+        if payload["endpoint"] == "discovery":
+            coordinator._handle_message_on_loop(
+                {"id": payload["id"], "code": "OK", "response": {"board_type": "CE"}}
+            )
+        if payload["endpoint"] == "ui_info":
+            coordinator._handle_message_on_loop(
+                {
+                    "id": payload["id"],
+                    "code": "OK",
+                    "response": {"requests": {}, "unit": {}, "states": {"active": {}}},
+                }
+            )
+        return True
+
+    coordinator.publish_wss = fake_publish_wss  # type: ignore[method-assign]
+
+    missing = await coordinator.async_bootstrap(timeout=0.01)
+
+    assert published == list(BOOTSTRAP_ENDPOINTS)
+    assert missing == [
+        "ui_control_scheme",
+        "user_config_get",
+        "ui_diagram_data",
+        "control_admin/config/moments/get",
+    ]
+
+
+async def test_outbound_writer_coalesces_repeated_reads_without_reordering(hass) -> None:
+    """Queued duplicate reads should share one frame but never jump over a write."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+
+    published: list[str] = []
+
+    async def fake_publish_wss(payload):
+        published.append(payload["endpoint"])
+        return True
+
+    coordinator.publish_wss = fake_publish_wss  # type: ignore[method-assign]
+
+    queued = [
+        coordinator._enqueue_request("ui_info"),
+        coordinator._enqueue_request("ui_info"),
+        coordinator._enqueue_request("control_panel"),
+        coordinator._enqueue_request("unit/set", {"name": "Homer"}),
+        coordinator._enqueue_request("ui_info"),
+    ]
+    assert [message_id for message_id, _ in queued] == [1, 2, 3, 4, 5]
+    assert not any(future.done() for _, future in queued)
+
+    results = [await future for _, future in queued]
+
+    assert results == [True] * 5
+    assert published == ["ui_info", "control_panel", "unit/set", "ui_info"]
+    assert coordinator.outbound_stats.frames_coalesced == 1
+    assert coordinator.outbound_stats.frames_sent == 4
+    assert coordinator.outbound_stats.max_queue_depth == 5
+    assert 2 not in coordinator._in_flight
+
+
+def test_derived_state_only_rebuilds_groups_for_changed_sources(hass) -> None:
+    """Applying one bucket should skip unrelated derived groups and report changed keys."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+
+    notification_builds = 0
+    original_build = coordinator._build_active_notifications
+
+    def counting_build(active_states):
+        nonlocal notification_builds
+        notification_builds += 1
+        return original_build(active_states)
+
+    coordinator._build_active_notifications = counting_build  # type: ignore[method-assign]
+
+    coordinator._apply_modbus({"active": True, "enable": True, "port": 502, "clients": []})
+    coordinator.state.modbus = {"active": True, "enable": True, "port": 503, "clients": []}
+    changed = coordinator._refresh_derived_state("modbus")
+
+    assert notification_builds == 0
+    assert changed == {"modbus_port"}
+    assert coordinator.value("modbus_port") == 503
+
+    coordinator._apply_ui_info(
+        {
+            "requests": {},
+            "unit": {},
+            "states": {"active": {"105": {"active": True, "name": "FILTER_INTERVAL"}}},
+        }
+    )
+
+    assert notification_builds == 1
+    assert coordinator.value("notification_count") == 1
+
+
+def test_notifications_are_reused_until_their_fingerprint_changes(hass) -> None:
+    """Unchanged active states should reuse the cached payload without rebuilding it."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    notification_builds = 0
+    original_build = coordinator._build_active_notifications
+
+    def counting_build(active_states):
+        nonlocal notification_builds
+        notification_builds += 1
+        return original_build(active_states)
+
+    coordinator._build_active_notifications = counting_build  # type: ignore[method-assign]
+    ui_info = {
+        "requests": {},
+        "unit": {},
+        "states": {"active": {"105": {"active": True, "name": "FILTER_INTERVAL"}}},
+    }
+
+    coordinator._apply_ui_info(ui_info)
+    notifications = coordinator.value("notifications")
+    changed = coordinator._refresh_derived_state("active_states")
+
+    assert notification_builds == 1
+    assert "notifications" not in changed
+    assert coordinator.value("notifications") is notifications
+
+    coordinator._apply_diagram_scheme(
+        {"baseStates": [{"id": 105, "purpose": "alarm_sr", "severity": 5, "type": "FILTER_INTERVAL"}]}
+    )
+
+    assert notification_builds == 2
+    assert coordinator.value("notifications")[0]["kind"] == "fault"
+
+    hass.config.language = "cs"
+    coordinator._refresh_derived_state("active_states")
+
+    assert notification_builds == 3
+
+
+async def test_field_listeners_only_fire_for_changed_keys(hass) -> None:
+    """Entities should only be woken for the state keys they read."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    calls: list[str] = []
+    coordinator.async_add_field_listener(("temp_oda",), lambda: calls.append("temp_oda"))
+    coordinator.async_add_field_listener(
+        ("temp_request", "stored_temp_request"), lambda: calls.append("temp_request")
+    )
+    unsubscribe = coordinator.async_add_field_listener(
+        ("modbus_port",), lambda: calls.append("modbus_port")
+    )
+    coordinator.async_add_field_listener((), lambda: calls.append("none"))
+    # First responses wake every listener; this test covers the later ones.
+    for endpoint in ("ui_info", "modbus"):
+        coordinator._endpoint_ready[endpoint].set()
+
+    ui_info = {"requests": {"temp_request": 21}, "unit": {"temp_oda": 2.3}, "states": {}}
+    coordinator._apply_ui_info(ui_info)
+    coordinator._dispatch_state_changed()
+    assert sorted(calls) == ["temp_oda", "temp_request"]
+
+    calls.clear()
+    coordinator._apply_ui_info(ui_info)
+    coordinator._dispatch_state_changed()
+    assert calls == []
+
+    coordinator._apply_ui_info({**ui_info, "unit": {"temp_oda": 2.5}})
+    coordinator._apply_ui_info({**ui_info, "unit": {"temp_oda": 2.7}})
+    coordinator._dispatch_state_changed()
+    assert calls == ["temp_oda"]
+
+    calls.clear()
+    unsubscribe()
+    coordinator._apply_modbus({"active": True, "enable": True, "port": 502, "clients": []})
+    coordinator._dispatch_state_changed()
+    assert calls == []
+
+    coordinator._apply_control_scheme({"requests": [], "unit": [], "types": {}})
+    coordinator._dispatch_state_changed()
+    assert sorted(calls) == ["temp_oda", "temp_request"]
+    await hass.async_block_till_done()
+
+
+async def test_poll_scheduler_skips_pushed_endpoints_and_adapts_interval(hass) -> None:
+    """Polls covered by a recent push should be skipped and the interval should adapt."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    requested: list[str] = []
+
+    async def fake_request(endpoint: str, args=None) -> bool:
+        requested.append(endpoint)
+        return True
+
+    coordinator.async_request = fake_request  # type: ignore[method-assign]
+    coordinator._last_poll_at = monotonic()
+    coordinator._process_message(
+        {"event": "ui_info", "args": {"requests": {}, "unit": {}, "states": {}}, "type": "event"}
+    )
+    coordinator._process_message({"event": "control_panel", "args": {}, "type": "event"})
+
+    await coordinator._async_poll_cycle()
+
+    assert requested[0] == "ui_diagram_data"
+    assert "ui_info" not in requested
+    assert "control_panel" not in requested
+    assert coordinator.poll_stats.skipped == {"ui_info": 1, "control_panel": 1}
+    assert coordinator.poll_stats.skip_ratio == 2 / 9
+    assert coordinator.poll_stats.interval == 22.5
+
+    # Polls outside the periodic loop, such as async_update, keep the interval.
+    await coordinator._async_poll_stale()
+    assert coordinator.poll_stats.interval == 22.5
+
+    coordinator._last_fresh.clear()
+    await coordinator._async_poll_cycle()
+    assert coordinator.poll_stats.interval == 33.75
+
+    def push_ui_info(temp_oda: float) -> None:
+        coordinator._apply_ui_info(
+            {
+                "requests": {"work_regime": "VENTILATION"},
+                "unit": {"temp_oda": temp_oda, "fan_sup_factor": 40},
+                "states": {},
+            }
+        )
+
+    push_ui_info(5.0)
+    for step in range(1, 5):
+        await coordinator._async_poll_cycle()
+        push_ui_info(5.0 + step)
+    assert coordinator.poll_stats.interval == POLL_INTERVAL_MIN
+
+    # Identical pushes and sub-tolerance jitter no longer count as changes.
+    await coordinator._async_poll_cycle()
+    for temp_oda in (9.0, 9.1, 8.9, 9.0):
+        push_ui_info(temp_oda)
+        await coordinator._async_poll_cycle()
+    assert coordinator.poll_stats.interval > POLL_INTERVAL_MIN * 4
+    await hass.async_block_till_done()
+
+
+async def test_refresh_policies_apply_ttls_and_event_triggers(hass) -> None:
+    """Slow endpoints should wait for their TTL and events should refresh their dependents."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    requested: list[str] = []
+
+    async def fake_request(endpoint: str, args=None) -> bool:
+        requested.append(endpoint)
+        return True
+
+    coordinator.async_request = fake_request  # type: ignore[method-assign]
+    fetched_at = monotonic() - 20
+    coordinator._last_fresh = {policy.endpoint: fetched_at for policy in REFRESH_POLICIES}
+
+    await coordinator._async_poll_stale()
+
+    assert requested == ["ui_info", "control_panel", "ui_diagram_data"]
+
+    requested.clear()
+    coordinator._process_message({"event": "unit_config", "args": {}, "type": "event"})
+    await hass.async_block_till_done()
+
+    assert requested == ["discovery", "ui_diagram_scheme"]
+
+
+def test_ui_info_feeds_telemetry_history(hass, monkeypatch) -> None:
+    """Unit values from ui_info should be sampled once per interval as rolling statistics."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+
+    clock = iter((0.0, 20.0, *[25.0] * 4))
+    monkeypatch.setattr(
+        "custom_components.atrea_amotion.telemetry.monotonic", lambda: next(clock)
+    )
+    for temp_oda in (2.0, 4.0, 9.0):
+        coordinator._apply_ui_info({"requests": {}, "unit": {"temp_oda": temp_oda}, "states": {}})
+
+    stats = coordinator.telemetry_stats("temp_oda")
+    assert stats.samples == 2
+    assert stats.mean == 3.0
+    assert coordinator.telemetry_stats("temp_ida") is None
+
+
+def test_heat_recovery_and_fan_energy_update_incrementally(hass, monkeypatch) -> None:
+    """Efficiency follows each update; energy only moves on power changes or the interval."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    clock = iter((0.0, 0.0, 360.0, 4000.0, 4100.0, 4360.0))
+    monkeypatch.setattr(
+        "custom_components.atrea_amotion.__init__.monotonic", lambda: next(clock)
+    )
+    unit = {"temp_oda": 0.0, "temp_sup": 16.0, "temp_eta": 20.0, "fan_sup_factor": 100}
+    coordinator._last_fresh["ui_info"] = 360.0
+
+    coordinator._refresh_derived_state("unit")
+    for _ in range(2):
+        coordinator.state.unit.replace(unit)
+        coordinator._refresh_derived_state("unit")
+
+    assert coordinator.value("heat_recovery_efficiency") == 80.0
+    assert coordinator.value("fan_power") == 100.0
+    assert coordinator.value("fan_energy") == 0.01
+
+    coordinator.state.unit.replace({**unit, "temp_eta": 1.0})
+    coordinator._refresh_derived_state("unit")
+
+    assert coordinator.value("heat_recovery_efficiency") is None
+    assert coordinator.value("fan_energy") == 0.01
+
+    coordinator._last_fresh["ui_info"] = 4360.0
+    assert "fan_energy" not in coordinator._refresh_derived_state(REFRESH_TIMER)
+    coordinator.state.unit.replace({**unit, "fan_sup_factor": 50})
+    assert "fan_energy" in coordinator._refresh_derived_state("unit")
+    assert coordinator.value("fan_energy") == 0.02
+
+
+async def test_cached_capabilities_skip_schemes_until_firmware_changes(hass, hass_storage) -> None:
+    """Cached capabilities should replace the scheme requests until discovery reports new firmware."""
+    hass_storage[CAPABILITY_STORAGE_KEY] = {
+        "version": 1,
+        "key": CAPABILITY_STORAGE_KEY,
+        "data": {
+            "CE123": {
+                "version": "1.0.0",
+                "capabilities": {
+                    "requests": ["fan_power_req", "temp_request", "work_regime"],
+                    "unit_fields": ["temp_oda"],
+                    "enum_values": {"work_regime": ["VENTILATION", "OFF"]},
+                    "base_states": [{"id": 1, "name": "filter"}],
+                },
+            }
+        },
+    }
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="0.9.0",
+        board_number="CE123",
+        capability_cache=async_get_capability_cache(hass),
+    )
+    published: list[str] = []
+
+    async def fake_publish_wss(payload):
+        published.append(payload["endpoint"])
+        return True
+
+    coordinator.publish_wss = fake_publish_wss  # type: ignore[method-assign]
+
+    await coordinator._async_restore_capabilities()
+    await coordinator.async_bootstrap(timeout=0.01)
+
+    assert coordinator.capabilities.has_climate_control
+    assert coordinator.capabilities.enum_for("work_regime") == ["VENTILATION", "OFF"]
+    assert coordinator.capabilities.base_states[1]["name"] == "filter"
+    assert "temp_oda" in coordinator.capabilities.unit_fields
+    coordinator.capabilities.enum_values["work_regime"].append("DEBALANCE")
+    version, cached = await async_get_capability_cache(hass).async_get_latest("CE123")
+    assert version == "1.0.0"
+    assert cached["enum_values"]["work_regime"] == ["VENTILATION", "OFF"]
+    assert published == [
+        endpoint for endpoint in BOOTSTRAP_ENDPOINTS if endpoint not in CAPABILITY_ENDPOINTS
+    ]
+
+    published.clear()
+    coordinator._apply_discovery({"board_number": "CE123", "version": "1.0.0"})
+    await hass.async_block_till_done()
+    assert published == []
+
+    coordinator._apply_discovery({"version": "1.1.0"})
+    await hass.async_block_till_done()
+    assert published == list(CAPABILITY_ENDPOINTS)
+
+    coordinator._apply_control_scheme({"requests": ["fan_power_req"], "types": {}, "unit": []})
+    version, cached = await async_get_capability_cache(hass).async_get_latest("CE123")
+    assert version == "1.1.0"
+    assert cached["requests"] == ["fan_power_req"]
+
+
+async def test_restored_capabilities_are_confirmed_after_setup(
+    hass, hass_storage, monkeypatch
+) -> None:
+    """Skipped schemes should be refetched later and a changed scheme should reload the entry."""
+    hass_storage[CAPABILITY_STORAGE_KEY] = {
+        "version": 1,
+        "key": CAPABILITY_STORAGE_KEY,
+        "data": {
+            "CE123": {
+                "version": "1.0.0",
+                "capabilities": {"requests": ["work_regime"], "unit_fields": ["temp_oda"]},
+            }
+        },
+    }
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+        board_number="CE123",
+        capability_cache=async_get_capability_cache(hass),
+        entry_id="entry",
+    )
+    published: list[str] = []
+    reloads: list[str] = []
+
+    async def fake_publish_wss(payload):
+        published.append(payload["endpoint"])
+        return True
+
+    coordinator.publish_wss = fake_publish_wss  # type: ignore[method-assign]
+    monkeypatch.setattr(hass.config_entries, "async_schedule_reload", reloads.append)
+
+    await coordinator._async_restore_capabilities()
+    for endpoint in BOOTSTRAP_ENDPOINTS:
+        coordinator._endpoint_ready[endpoint].set()
+    await coordinator._async_check_restored_capabilities()
+    assert published == list(CAPABILITY_ENDPOINTS)
+
+    coordinator._initialized = True
+    coordinator._apply_control_scheme(
+        {"requests": ["work_regime"], "types": {}, "unit": ["temp_oda"]}
+    )
+    coordinator._apply_diagram_scheme({"components": {}, "baseStates": []})
+    assert reloads == []
+
+    coordinator._apply_control_scheme(
+        {"requests": ["work_regime", "fan_power_req"], "types": {}, "unit": ["temp_oda"]}
+    )
+    assert reloads == ["entry"]
+
+
+async def test_capabilities_are_cached_only_after_discovery(hass) -> None:
+    """Schemes answering before discovery should be saved under the reported firmware."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+        board_number="CE123",
+        capability_cache=async_get_capability_cache(hass),
+    )
+
+    coordinator._apply_control_scheme({"requests": ["work_regime"], "types": {}, "unit": []})
+    assert await async_get_capability_cache(hass).async_get_latest("CE123") is None
+
+    coordinator._apply_discovery({"board_number": "CE123", "version": "1.2.0"})
+    version, cached = await async_get_capability_cache(hass).async_get_latest("CE123")
+    assert version == "1.2.0"
+    assert cached["requests"] == ["work_regime"]
+
+
+async def test_setup_waits_only_for_critical_endpoints(hass) -> None:
+    """Setup should return once capabilities arrive and mark the rest ready as they answer."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+
+    async def fake_publish_wss(payload):
+        if payload["endpoint"] == "ui_control_scheme":
+            coordinator._handle_message_on_loop(
+                {
+                    "id": payload["id"],
+                    "code": "OK",
+                    "response": {"requests": ["work_regime"], "types": {}, "unit": []},
+                }
+            )
+        return True
+
+    coordinator.publish_wss = fake_publish_wss  # type: ignore[method-assign]
+
+    assert await coordinator.async_bootstrap(timeout=0.01, required=SETUP_ENDPOINTS) == []
+    assert coordinator.endpoints_ready(("ui_control_scheme",))
+    assert not coordinator.endpoints_ready(("ui_control_scheme", "ui_info"))
+
+    coordinator._process_message(
+        {"event": "ui_info", "args": {"requests": {}, "unit": {}, "states": {}}, "type": "event"}
+    )
+    coordinator._apply_modbus({"active": True})
+
+    assert coordinator.endpoints_ready(("ui_control_scheme", "ui_info", "modbus"))
+    assert await coordinator.async_wait_ready(("modbus", "update"), timeout=0.01) == ["update"]
+
+
+def test_flight_recorder_keeps_recent_frames_and_hides_login_token(hass) -> None:
+    """Inbound frames should be recorded raw, bounded, with the login reply hidden."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    coordinator._login_msg_id = 7
+    coordinator._handle_message_on_loop = lambda message: None  # type: ignore[method-assign]
+
+    coordinator.on_message(None, '{"id": 7, "code": "OK", "response": "secret-token"}')
+    coordinator.on_message(None, "{broken")
+    for message_id in range(300):
+        coordinator.on_message(None, f'{{"id": {message_id}, "code": "OK"}}')
+
+    frames = coordinator.flight_recorder.dump()
+    assert len(frames) == len(coordinator.flight_recorder) == 200
+    assert frames[-1]["id"] == 299
+    assert frames[-1]["frame"] == {"id": 299, "code": "OK"}
+
+    coordinator.flight_recorder = AtreaFlightRecorder()
+    coordinator.on_message(None, '{"id": 7, "code": "OK", "response": "secret-token"}')
+    coordinator.on_message(None, "{broken")
+    coordinator.on_message(None, b'{"id": 8, "code": "OK"}')
+
+    assert coordinator.flight_recorder._frames[-1][3] == b'{"id": 8, "code": "OK"}'
+    assert [frame["frame"] for frame in coordinator.flight_recorder.dump()] == [
+        "**REDACTED**",
+        "{broken",
+        {"id": 8, "code": "OK"},
+    ]
+
+
+async def test_concurrent_controls_share_one_message(hass) -> None:
+    """Controls issued together should be merged last-write-wins into one round trip."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    sent_controls: list[dict] = []
+    refreshes: list[str] = []
+
+    async def fake_async_request_message(endpoint: str, args: object = None, timeout: float = 10):
+        sent_controls.append(args["variables"])
+        return {"id": 1, "code": "OK", "response": "OK", "type": "response"}
+
+    async def fake_refresh(trigger: str) -> None:
+        refreshes.append(trigger)
+
+    coordinator._async_request_message = fake_async_request_message  # type: ignore[method-assign]
+    coordinator._async_refresh_triggered = fake_refresh  # type: ignore[method-assign]
+    coordinator._schedule_control_burst_refresh = lambda variables: None  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        coordinator.async_control({"work_regime": "VENTILATION", "fan_power_req": 40}),
+        coordinator.async_control({"temp_request": 22}),
+        coordinator.async_control({"fan_power_req": 60}),
+    )
+
+    assert results == [True, True, True]
+    assert sent_controls == [
+        {"work_regime": "VENTILATION", "fan_power_req": 60, "temp_request": 22}
+    ]
+    assert refreshes == ["control"]
+    assert coordinator.outbound_stats.controls_coalesced == 2
+    assert coordinator.requested_value("fan_power_req") == 60
+
+    assert await coordinator.async_control({"temp_request": 23}) is True
+    assert sent_controls[-1] == {"temp_request": 23}
+    await coordinator.async_shutdown()
+
+
+async def test_control_burst_stops_once_the_unit_echoes_targets(hass, monkeypatch) -> None:
+    """The burst should stop after the first matching echo and otherwise hit its cap."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    monkeypatch.setattr(
+        "custom_components.atrea_amotion.__init__.CONTROL_BURST_BACKOFF", (0,)
+    )
+    refreshes = 0
+    echo: dict[str, str] = {}
+
+    async def fake_refresh(trigger: str) -> None:
+        nonlocal refreshes
+        refreshes += 1
+        coordinator._apply_ui_info(
+            {"requests": echo, "unit": {"mode_current": "NORMAL"}, "states": {}}
+        )
+        coordinator._apply_control_panel({"stored": echo})
+
+    coordinator._async_refresh_triggered = fake_refresh  # type: ignore[method-assign]
+
+    coordinator._schedule_control_burst_refresh({"work_regime": "OFF"})
+    await coordinator._control_burst_task
+
+    assert refreshes == CONTROL_BURST_REFRESH_CYCLES
+
+    refreshes = 0
+    echo = {"work_regime": "OFF"}
+    coordinator._schedule_control_burst_refresh({"work_regime": "OFF"})
+    assert coordinator._pending_control_variables() == {"work_regime"}
+    await coordinator._control_burst_task
+
+    assert refreshes == 1
+    assert coordinator._control_targets == {}
+
+
+async def test_optimistic_control_masks_stale_echoes_and_rolls_back(hass, monkeypatch) -> None:
+    """A stale ui_info should not flip the sent value back until the deadline passes."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    monkeypatch.setattr("custom_components.atrea_amotion.optimistic.OPTIMISTIC_DEADLINE", 0.05)
+    coordinator._apply_ui_info({"requests": {"temp_request": 21}, "unit": {}, "states": {}})
+    changes: list[set[str]] = []
+    coordinator._notify_state_changed = changes.append  # type: ignore[method-assign]
+
+    coordinator._apply_optimistic_control({"temp_request": 23})
+    changes.clear()
+    coordinator._apply_ui_info({"requests": {"temp_request": 21}, "unit": {}, "states": {}})
+
+    assert coordinator.requested_value("temp_request") == 23
+    assert changes == [set()]
+    assert coordinator._pending_control_variables() == set()
+    coordinator._control_targets = {"temp_request": 23}
+    coordinator._control_echo_marks = dict.fromkeys(coordinator._echo_counts, -1)
+    assert coordinator._pending_control_variables() == {"temp_request"}
+
+    await asyncio.sleep(0.1)
+
+    assert coordinator.requested_value("temp_request") == 21
+    assert coordinator.value("stored_temp_request") is None
+    assert "temp_request" not in coordinator.state.control_panel["stored"]
+    assert "temp_request" not in coordinator.state.control_panel["current"]
+    assert coordinator.optimistic.stats.expired == 1
+    assert coordinator.optimistic.pending == set()
+
+
+def test_control_panel_without_a_view_does_not_confirm_it(hass) -> None:
+    """A control_panel payload lacking the current map should leave that view pending."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    coordinator.optimistic.track({"temp_request": 23}, {}, monotonic())
+    coordinator._apply_ui_info({"requests": {"temp_request": 23}, "unit": {}, "states": {}})
+    coordinator._apply_control_panel({"stored": {"temp_request": 23}})
+
+    assert coordinator.optimistic.pending == {"temp_request"}
+
+    coordinator._apply_control_panel({"stored": {"temp_request": 23}, "current": {}})
+
+    assert coordinator.optimistic.pending == set()
+
+
+def test_first_response_of_an_endpoint_reaches_every_listener(hass) -> None:
+    """Readiness gates availability, so the first response notifies even without changes."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    changes: list[set[str]] = []
+    coordinator._notify_state_changed = changes.append  # type: ignore[method-assign]
+
+    coordinator._apply_modbus({})
+    coordinator._apply_modbus({})
+
+    assert ALL_FIELDS in changes[0]
+    assert ALL_FIELDS not in changes[1]
+    assert coordinator.endpoints_ready(("modbus",))
+
+
+async def test_shutdown_cancels_background_tasks(hass) -> None:
+    """Fire-and-forget tasks such as re-authentication should be tracked and cancelled."""
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host="192.0.2.10",
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="1.0.0",
+    )
+    started = asyncio.Event()
+
+    async def fake_authenticate_with_server():
+        started.set()
+        await asyncio.Event().wait()
+
+    coordinator.authenticate_with_server = fake_authenticate_with_server  # type: ignore[method-assign]
+
+    coordinator.on_open(None)
+    await started.wait()
+    (task,) = coordinator._background_tasks
+
+    await coordinator.async_shutdown()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert task.cancelled()
+    assert not coordinator._background_tasks
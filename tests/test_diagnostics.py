@@ -4,8 +4,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from custom_components.atrea_amotion.__init__ import AtreaOutboundStats, AtreaPollStats
+from custom_components.atrea_amotion.codec import StdlibJsonCodec
+from custom_components.atrea_amotion.inflight import AtreaInFlightStats
 from custom_components.atrea_amotion.diagnostics import async_get_config_entry_diagnostics
+from custom_components.atrea_amotion.flight_recorder import (
+    FRAME_IN,
+    FRAME_OUT,
+    AtreaFlightRecorder,
+)
 from custom_components.atrea_amotion.const import CONF_DEBUG_LOGGING, DOMAIN
+from custom_components.atrea_amotion.optimistic import AtreaOptimisticLedger
 
 
 @dataclass
@@ -39,6 +48,22 @@ class _MockCoordinator:
     model = "aMotion"
     version = "1.0.0"
     board_type = "CE"
+    codec = StdlibJsonCodec()
+    outbound_stats = AtreaOutboundStats(frames_sent=3)
+    in_flight_stats = AtreaInFlightStats(orphaned_replies=2)
+    poll_stats = AtreaPollStats(polled={"ui_info": 1}, skipped={"ui_info": 3})
+
+    def __init__(self) -> None:
+        self.flight_recorder = AtreaFlightRecorder()
+        self.optimistic = AtreaOptimisticLedger()
+        self.optimistic.stats.expired = 1
+        self.flight_recorder.record(
+            FRAME_OUT,
+            '{"endpoint": "login", "id": 1, "args": {"username": "user", "password": "pass"}}',
+            1,
+        )
+        self.flight_recorder.record(FRAME_IN, '{"id": 1, "code": "OK", "response": "tok"}', 1, True)
+        self.flight_recorder.record(FRAME_IN, "not json")
 
     def async_capabilities(self):
         return _MockCapabilities()
@@ -74,3 +99,13 @@ async def test_diagnostics_redacts_sensitive_values(hass, MockConfigEntry) -> No
     assert diagnostics["entry"]["data"]["network_mac"] == "**REDACTED**"
     assert diagnostics["state"]["discovery"]["board_number"] == "**REDACTED**"
     assert diagnostics["runtime"]["authorized"] is True
+    assert diagnostics["runtime"]["codec"] == "json"
+    assert diagnostics["runtime"]["outbound"]["frames_sent"] == 3
+    assert diagnostics["runtime"]["polling"]["skip_ratio"] == 0.75
+    assert diagnostics["runtime"]["in_flight"]["orphaned_replies"] == 2
+    assert diagnostics["runtime"]["optimistic"]["expired"] == 1
+    frames = diagnostics["flight_recorder"]
+    assert [frame["direction"] for frame in frames] == ["out", "in", "in"]
+    assert frames[0]["frame"]["args"]["password"] == "**REDACTED**"
+    assert frames[1]["frame"] == "**REDACTED**"
+    assert frames[2]["frame"] == "not json"
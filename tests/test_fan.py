@@ -27,8 +27,17 @@ class _MockCoordinator:
         }
         return values.get(key)
 
-    def unit_value(self, key: str):
-        if key == "fan_sup_factor":
+    def request_slot(self, key: str) -> str:
+        return key
+
+    def requested_value_at(self, slot: str):
+        return self.value(slot)
+
+    def unit_slot(self, key: str) -> str:
+        return key
+
+    def unit_value_at(self, slot: str):
+        if slot == "fan_sup_factor":
             return 68.5
         return None
 
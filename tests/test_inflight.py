@@ -0,0 +1,50 @@
+"""Tests for the in-flight request tracker."""
+
+from __future__ import annotations
+
+from custom_components.atrea_amotion.inflight import (
+    MAX_MESSAGE_ID,
+    AtreaInFlightTracker,
+    next_message_id,
+)
+
+
+def test_tracker_evicts_expired_entries_and_matches_late_replies() -> None:
+    """Expired requests should be counted and still resolve a late reply once."""
+    tracker = AtreaInFlightTracker(ttl=10, max_size=8)
+    tracker.add(1, "ui_info", now=0)
+    tracker.add(2, "modbus", now=5)
+
+    assert tracker.evict(now=12) == 1
+    assert 1 not in tracker
+    assert tracker.pop(2) == "modbus"
+    assert tracker.pop(1) == "ui_info"
+    assert tracker.pop(1) is None
+    assert tracker.pop(99) is None
+
+    stats = tracker.stats
+    assert (stats.completed, stats.timed_out, stats.late_replies, stats.orphaned_replies) == (
+        1,
+        1,
+        1,
+        2,
+    )
+    assert stats.in_flight == 0
+
+
+def test_tracker_stays_bounded_when_replies_never_arrive() -> None:
+    """The table and its tombstones should never outgrow max_size."""
+    tracker = AtreaInFlightTracker(ttl=3600, max_size=4)
+    for message_id in range(1, 11):
+        tracker.add(message_id, "ui_info", now=message_id)
+
+    assert len(tracker) == 4
+    assert len(tracker._expired) == 4
+    assert tracker.stats.overflowed == 6
+    assert tracker.stats.max_in_flight == 4
+
+
+def test_message_ids_wrap() -> None:
+    """Message ids should wrap instead of growing without bound."""
+    assert next_message_id(41) == 42
+    assert next_message_id(MAX_MESSAGE_ID) == 1
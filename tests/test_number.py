@@ -42,8 +42,11 @@ class _MockCoordinator:
     def async_capabilities(self):
         return _MockCapabilities()
 
-    def config_value(self, key: str):
-        return self.values.get(key)
+    def config_slot(self, key: str) -> str:
+        return key
+
+    def config_value_at(self, slot: str):
+        return self.values.get(slot)
 
     async def async_set_config(self, key: str, value: float) -> bool:
         self.calls.append((key, value))
@@ -0,0 +1,65 @@
+"""Tests for the optimistic control ledger."""
+
+from __future__ import annotations
+
+from custom_components.atrea_amotion.optimistic import (
+    OPTIMISTIC_DEADLINE,
+    AtreaOptimisticLedger,
+)
+
+
+def test_stale_echoes_are_masked_until_every_view_confirms() -> None:
+    """Each view keeps reporting the sent value until it echoes it itself."""
+    ledger = AtreaOptimisticLedger()
+    ledger.track({"temp_request": 23}, {"requests": {"temp_request": 21}}, now=0)
+
+    assert ledger.mask("requests", {"temp_request": 21, "work_regime": "AUTO"}, now=1) == {
+        "temp_request": 23,
+        "work_regime": "AUTO",
+    }
+    assert ledger.mask("requests", {"temp_request": 23}, now=2) == {"temp_request": 23}
+    assert ledger.pending == {"temp_request"}
+
+    assert ledger.mask("stored", {"temp_request": 23}, now=3) == {"temp_request": 23}
+    assert ledger.mask("current", {}, now=4) == {}
+
+    assert ledger.pending == set()
+    assert ledger.stats.masked_echoes == 1
+    assert ledger.stats.confirmed == 1
+    assert ledger.stats.last_confirm_latency == 4
+
+
+def test_expired_values_roll_back_to_the_last_real_echo() -> None:
+    """Past the deadline echoes pass through and expire returns the real values."""
+    ledger = AtreaOptimisticLedger()
+    ledger.track(
+        {"temp_request": 23},
+        {"requests": {"temp_request": 21}, "stored": {"temp_request": 21}},
+        now=0,
+    )
+    ledger.mask("requests", {"temp_request": 22}, now=1)
+    ledger.mask("current", {}, now=1)
+
+    assert ledger.next_deadline == OPTIMISTIC_DEADLINE
+    assert ledger.expire(now=1) == ({}, {})
+    late = OPTIMISTIC_DEADLINE + 1
+    assert ledger.mask("stored", {"temp_request": 20}, now=late) == {"temp_request": 20}
+    assert ledger.expire(now=late) == (
+        {"requests": {"temp_request": 22}, "stored": {"temp_request": 20}},
+        {},
+    )
+    assert ledger.pending == set()
+    assert ledger.stats.expired == 1
+    assert ledger.stats.confirmed == 0
+
+
+def test_views_without_a_real_value_drop_the_variable_on_expiry() -> None:
+    """Views that never reported the variable should lose it instead of getting None."""
+    ledger = AtreaOptimisticLedger()
+    ledger.track({"fan_power_req": 60}, {"requests": {"fan_power_req": 40}}, now=0)
+    ledger.mask("requests", {"fan_power_req": 60}, now=1)
+
+    assert ledger.expire(now=OPTIMISTIC_DEADLINE) == (
+        {},
+        {"stored": {"fan_power_req"}, "current": {"fan_power_req"}},
+    )
@@ -105,8 +105,11 @@ class _MockConfigCoordinator:
     def async_capabilities(self):
         return _MockConfigCapabilities()
 
-    def config_value(self, key: str):
-        return self.values.get(key)
+    def config_slot(self, key: str) -> str:
+        return key
+
+    def config_value_at(self, slot: str):
+        return self.values.get(slot)
 
     async def async_set_config(self, key: str, value: object) -> bool:
         self.config_calls.append((key, value))
@@ -149,3 +149,40 @@ async def test_active_notifications_sensor_exposes_card_payload(hass, MockConfig
     assert attrs["fault_count"] == 0
     assert attrs["primary_message"] == "S 105 - Filter replacement interval"
     assert attrs["notifications"][0]["code"] == "FILTER_INTERVAL"
+
+
+class _MockTelemetryCoordinator(_MockFanCoordinator):
+    def __init__(self) -> None:
+        self.listened: list[tuple[str, ...]] = []
+
+    def async_add_field_listener(self, keys, listener):
+        self.listened.append(tuple(keys))
+        return lambda: None
+
+    def telemetry_stats(self, key: str):
+        return None
+
+
+async def test_rolling_statistic_sensors_refresh_on_a_timer(hass, MockConfigEntry) -> None:
+    """Statistic sensors should poll their window on a timer instead of listening to fields."""
+    coordinator = _MockTelemetryCoordinator()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Atrea",
+        data={CONF_NAME: "Atrea", CONF_HOST: "192.0.2.10"},
+    )
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = {"atrea": coordinator}
+
+    added_entities = []
+    await async_setup_entry(hass, entry, added_entities.extend)
+    sensor = next(
+        entity for entity in added_entities if entity.entity_description.key == "fan_sup_factor_mean"
+    )
+    sensor.hass = hass
+
+    await sensor.async_added_to_hass()
+
+    assert coordinator.listened == []
+    assert sensor.native_value is None
+    await sensor.async_will_remove_from_hass()
@@ -0,0 +1,171 @@
+"""Tests for Atrea aMotion services."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+
+from custom_components.atrea_amotion import (
+    CONFIG_APPLIED,
+    CONFIG_INVALID,
+    AtreaConfigWriteResult,
+)
+from custom_components.atrea_amotion.const import DOMAIN
+from custom_components.atrea_amotion.services import (
+    SERVICE_APPLY_PROFILE,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+)
+
+
+class _MockCoordinator:
+    def __init__(
+        self, name: str, control_ok: bool = True, unsupported: frozenset[str] = frozenset()
+    ) -> None:
+        self.name = name
+        self.control_ok = control_ok
+        self.unsupported = unsupported
+        self.controls: list[dict[str, object]] = []
+        self.configs: list[dict[str, object]] = []
+        self.capture: object | None = None
+        self.capture_paths: list[str] = []
+
+    def start_capture(self) -> object:
+        self.capture = object()
+        return self.capture
+
+    async def async_stop_capture(self, path: str) -> int:
+        self.capture = None
+        self.capture_paths.append(path)
+        return 12
+
+    def control_errors(self, variables: dict[str, object]) -> dict[str, str]:
+        return {key: "unknown control variable" for key in variables if key in self.unsupported}
+
+    async def async_control(self, variables: dict[str, object]) -> bool:
+        self.controls.append(variables)
+        return self.control_ok
+
+    async def async_set_config_values(
+        self, values: dict[str, object]
+    ) -> dict[str, AtreaConfigWriteResult]:
+        self.configs.append(values)
+        return {
+            key: AtreaConfigWriteResult(CONFIG_APPLIED)
+            if key != "bad"
+            else AtreaConfigWriteResult(CONFIG_INVALID, "unknown config field")
+            for key in values
+        }
+
+
+async def test_apply_profile_fans_out_and_reports_per_unit(hass) -> None:
+    """The profile should reach every unit as one control and one config write."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    office = _MockCoordinator("Office")
+    hall = _MockCoordinator("Hall", control_ok=False)
+    spare = _MockCoordinator("Spare")
+    hass.data[DOMAIN] = {
+        "office": {"atrea": office},
+        "hall": {"atrea": hall},
+        "spare": {"atrea": spare},
+    }
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        {
+            "config_entry_id": ["office", "hall"],
+            "work_regime": "VENTILATION",
+            "fan_power_req": "60",
+            "config": {"season_request": "HEATING"},
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    expected = [{"work_regime": "VENTILATION", "fan_power_req": 60}]
+    assert office.controls == hall.controls == expected
+    assert office.configs == [{"season_request": "HEATING"}]
+    assert spare.controls == []
+    units = response["units"]
+    assert units["office"]["success"] is True
+    assert units["office"]["config"] == {"season_request": {"status": "applied", "detail": None}}
+    assert units["hall"]["success"] is False
+    assert units["hall"]["control"] is False
+    assert all(unit["latency"] >= 0 for unit in units.values())
+
+
+async def test_apply_profile_targets_every_unit_and_reports_config_failures(hass) -> None:
+    """Without targets every loaded unit is used and rejected config keys fail that unit."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    office = _MockCoordinator("Office")
+    hass.data[DOMAIN] = {"office": {"atrea": office}}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        {"config": {"bad": 1}},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert office.controls == []
+    assert response["units"]["office"]["success"] is False
+    assert response["units"]["office"]["config"]["bad"]["status"] == "invalid"
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_APPLY_PROFILE, {"config_entry_id": "office"}, blocking=True
+        )
+
+
+async def test_capture_services_record_targeted_units(hass) -> None:
+    """Start and stop capture should write one file per capturing unit."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    office = _MockCoordinator("Office")
+    hall = _MockCoordinator("Hall")
+    hass.data[DOMAIN] = {"office": {"atrea": office}, "hall": {"atrea": hall}}
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_CAPTURE, {"config_entry_id": "office"}, blocking=True
+    )
+    assert office.capture is not None
+    assert hall.capture is None
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_CAPTURE, {}, blocking=True, return_response=True
+    )
+
+    path = hass.config.path(f"{DOMAIN}_capture_office.jsonl")
+    assert response == {"units": {"office": {"name": "Office", "path": path, "frames": 12}}}
+    assert office.capture_paths == [path]
+    assert hall.capture_paths == []
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, SERVICE_STOP_CAPTURE, {}, blocking=True)
+
+
+async def test_apply_profile_leaves_out_controls_a_unit_does_not_support(hass) -> None:
+    """Controls outside a unit's scheme should be reported for that unit and not sent."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    office = _MockCoordinator("Office")
+    hall = _MockCoordinator("Hall", unsupported=frozenset({"fan_power_req"}))
+    hass.data[DOMAIN] = {"office": {"atrea": office}, "hall": {"atrea": hall}}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        {"work_regime": "VENTILATION", "fan_power_req": 60},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert office.controls == [{"work_regime": "VENTILATION", "fan_power_req": 60}]
+    assert hall.controls == [{"work_regime": "VENTILATION"}]
+    units = response["units"]
+    assert units["office"]["success"] is True
+    assert "invalid" not in units["office"]
+    assert units["hall"]["success"] is False
+    assert units["hall"]["control"] is True
+    assert units["hall"]["invalid"] == {"fan_power_req": "unknown control variable"}
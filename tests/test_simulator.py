@@ -0,0 +1,66 @@
+"""End-to-end tests against the local aMotion unit simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import msgpack
+
+from custom_components.atrea_amotion.__init__ import AtreaAMotionCoordinator
+from custom_components.atrea_amotion.discovery import parse_discovery_response
+
+from .simulator import AMotionUnitSimulator
+
+
+async def test_coordinator_bootstraps_against_simulator(hass, socket_enabled) -> None:
+    """The coordinator should authenticate and load every metadata endpoint."""
+    simulator = AMotionUnitSimulator()
+    await simulator.async_start()
+    coordinator = AtreaAMotionCoordinator(
+        hass=hass,
+        name="Atrea",
+        host=simulator.host,
+        username="user",
+        password="pass",
+        model="aMotion",
+        version="unknown",
+    )
+
+    try:
+        await coordinator.async_initialize()
+        assert coordinator.capabilities.has_climate_control
+        assert coordinator.version == "aMCE-v2.4.5"
+        assert coordinator.value("temp_oda") == 2.3
+        assert coordinator.value("notification_count") == 1
+
+        assert await coordinator.async_control({"work_regime": "OFF"}) is True
+        await asyncio.sleep(0.05)
+        assert simulator.payloads["ui_info"]["requests"]["work_regime"] == "OFF"
+        assert coordinator.requested_value("work_regime") == "OFF"
+    finally:
+        await coordinator.async_shutdown()
+        await simulator.async_stop()
+
+
+async def test_simulator_answers_udp_discovery(hass, socket_enabled) -> None:
+    """The simulator should answer MessagePack discovery datagrams."""
+    simulator = AMotionUnitSimulator()
+    await simulator.async_start()
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    sock.bind(("127.0.0.1", 0))
+
+    try:
+        request = msgpack.packb({"pc": "ha", "user": "ha", "target": "lo"}, use_bin_type=True)
+        await loop.sock_sendto(sock, request, ("127.0.0.1", simulator.udp_port))
+        data, source = await asyncio.wait_for(loop.sock_recvfrom(sock, 4096), timeout=1)
+    finally:
+        sock.close()
+        await simulator.async_stop()
+
+    device = parse_discovery_response(data, source)
+    assert device is not None
+    assert device["board_number"] == "70:b8:f6:44:50:89"
+    assert simulator.request_counts["udp_discovery"] == 1
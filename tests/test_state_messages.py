@@ -0,0 +1,44 @@
+"""Tests for localized state messages."""
+
+from __future__ import annotations
+
+from custom_components.atrea_amotion import state_messages
+from custom_components.atrea_amotion.state_messages import (
+    async_prepare_state_messages,
+    state_message_index,
+    translate_state_message,
+)
+
+
+def test_index_merges_fallback_chain(monkeypatch) -> None:
+    """Regional messages should win over base language and English fallbacks."""
+    catalogs = {
+        "cs-cz": {"FILTER_INTERVAL": "Regional filter"},
+        "cs": {"FILTER_INTERVAL": "Filtr", "HEATER_FAULT_HEATER_1": "Porucha"},
+        "en": {"HEATER_FAULT_HEATER_1": "Heater fault", "FROST": "Frost"},
+    }
+    monkeypatch.setattr(
+        state_messages, "load_state_messages", lambda language: catalogs.get(language, {})
+    )
+    state_message_index.cache_clear()
+
+    try:
+        assert state_message_index("cs-CZ") == {
+            "FILTER_INTERVAL": "Regional filter",
+            "HEATER_FAULT_HEATER_1": "Porucha",
+            "FROST": "Frost",
+        }
+        assert translate_state_message("cs-CZ", "FROST") == "Frost"
+        assert translate_state_message("cs-CZ", "UNKNOWN") is None
+    finally:
+        state_message_index.cache_clear()
+
+
+async def test_prepare_builds_index_for_hass_language(hass) -> None:
+    """Setup should leave the active language's index ready for loop-side lookups."""
+    state_message_index.cache_clear()
+
+    index = await async_prepare_state_messages(hass)
+
+    assert index["FILTER_INTERVAL"] == "Filter replacement interval"
+    assert state_message_index.cache_info().currsize == 1
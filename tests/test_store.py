@@ -0,0 +1,47 @@
+"""Tests for the slot-backed field store."""
+
+from __future__ import annotations
+
+from custom_components.atrea_amotion.store import AtreaFieldStore
+
+
+def test_store_updates_slots_in_place_and_reports_changes() -> None:
+    """Writes should reuse slots, report changed fields and behave like a mapping."""
+    store = AtreaFieldStore(("temp_oda", "temp_ida"))
+    temp_oda = store.slot("temp_oda")
+
+    assert len(store) == 0
+    assert "temp_oda" not in store
+    assert store.at(temp_oda) is None
+    assert store.replace({"temp_oda": 2.3, "temp_ida": 21.0}) == {"temp_oda", "temp_ida"}
+    assert store.replace({"temp_oda": 2.3, "temp_ida": 21.0}) == set()
+    assert store.update({"temp_oda": 2.5}) == {"temp_oda"}
+    assert store.at(temp_oda) == 2.5
+    assert store == {"temp_oda": 2.5, "temp_ida": 21.0}
+
+    assert store.replace({"temp_oda": 2.5, "mode_current": "NORMAL"}) == {
+        "temp_ida",
+        "mode_current",
+    }
+    assert dict(store) == {"temp_oda": 2.5, "mode_current": "NORMAL"}
+    assert store.get("temp_ida") is None
+    assert store.slot("temp_oda") == temp_oda
+    assert len(store) == 2
+    assert store.discard("mode_current") is True
+    assert store.discard("mode_current") is False
+
+
+def test_store_keeps_value_types_across_slot_kinds() -> None:
+    """Integers, floats and objects should read back as written from the same slot."""
+    store = AtreaFieldStore()
+    slot = store.slot("fan_power_req")
+
+    store.update({"fan_power_req": 60})
+    assert store.at(slot) == 60 and type(store.at(slot)) is int
+    assert store.update({"fan_power_req": 60.0}) == set()
+    assert type(store.at(slot)) is float
+    assert store.update({"fan_power_req": True}) == {"fan_power_req"}
+    assert store.at(slot) is True
+    assert store.update({"fan_power_req": "AUTO"}) == {"fan_power_req"}
+    assert store.update({"fan_power_req": 2**60}) == {"fan_power_req"}
+    assert store.at(slot) == 2**60
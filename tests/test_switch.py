@@ -24,6 +24,9 @@ class _MockCoordinator:
     def value(self, key: str):
         return self.values.get(key)
 
+    def endpoints_ready(self, endpoints) -> bool:
+        return True
+
     async def async_set_modbus_enabled(self, enabled: bool) -> bool:
         self.modbus_calls.append(enabled)
         self.values["modbus_enabled"] = enabled
@@ -0,0 +1,70 @@
+"""Tests for telemetry ring buffers."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.atrea_amotion.telemetry import (
+    TELEMETRY_SAMPLE_INTERVAL,
+    TELEMETRY_WINDOW,
+    AtreaRingBuffer,
+    AtreaTelemetryHistory,
+)
+
+
+def test_ring_buffer_rolls_over_and_windows_by_time() -> None:
+    """Old samples should be overwritten and excluded outside the window."""
+    buffer = AtreaRingBuffer(capacity=4)
+    for second, value in enumerate((10.0, 11.0, 12.0, 13.0, 14.0, 15.0)):
+        buffer.append(value, now=second * 60)
+
+    stats = buffer.stats(window=3600, now=300)
+    assert stats.samples == 4
+    assert (stats.min, stats.max, stats.mean) == (12.0, 15.0, 13.5)
+    assert stats.slope == pytest.approx(60.0)
+
+    recent = buffer.stats(window=60, now=300)
+    assert recent.samples == 2
+    assert buffer.stats(window=10, now=10_000) is None
+
+
+def test_ring_buffer_reuses_stats_until_the_window_or_samples_change() -> None:
+    """Repeated reads between samples should return the cached statistics."""
+    buffer = AtreaRingBuffer(capacity=3)
+    for second, value in enumerate((1.0, 2.0, 3.0, 4.0)):
+        buffer.append(value, now=second * 10)
+
+    stats = buffer.stats(window=100, now=30)
+    assert buffer.stats(window=100, now=35) is stats
+    assert (stats.samples, stats.mean) == (3, 3.0)
+
+    shifted = buffer.stats(window=100, now=115)
+    assert shifted is not stats
+    assert (shifted.samples, shifted.mean) == (2, 3.5)
+
+    buffer.append(5.0, now=40)
+    assert buffer.stats(window=100, now=40).mean == 4.0
+
+
+def test_history_records_numeric_fields_only() -> None:
+    """Non-numeric and missing values should not be recorded."""
+    history = AtreaTelemetryHistory(fields=("temp_oda", "fan_sup_factor"))
+    history.record({"temp_oda": 2.5, "fan_sup_factor": None}, now=0)
+    history.record({"temp_oda": "n/a", "fan_sup_factor": True}, now=20)
+
+    stats = history.stats("temp_oda", now=20)
+    assert stats.samples == 1
+    assert stats.slope is None
+    assert history.stats("fan_sup_factor", now=20) is None
+    assert history.stats("unknown", now=20) is None
+
+
+def test_history_samples_on_a_fixed_cadence_across_the_window() -> None:
+    """Bursts inside one sample interval should count once and a full window should fit."""
+    history = AtreaTelemetryHistory(fields=("temp_oda",))
+    for second in range(TELEMETRY_WINDOW + 1):
+        history.record({"temp_oda": 20.0 if second % 10 else 30.0}, now=second)
+
+    stats = history.stats("temp_oda", now=TELEMETRY_WINDOW)
+    assert stats.samples == TELEMETRY_WINDOW // TELEMETRY_SAMPLE_INTERVAL + 1
+    assert stats.mean == 30.0
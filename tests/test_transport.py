@@ -0,0 +1,137 @@
+"""Tests for the Atrea websocket transport."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from custom_components.atrea_amotion.transport import AtreaWebsocketTransport
+
+
+class _MockMessage:
+    def __init__(self, data: str | bytes) -> None:
+        self.type = aiohttp.WSMsgType.BINARY if isinstance(data, bytes) else aiohttp.WSMsgType.TEXT
+        self.data = data
+
+
+class _MockWebSocket:
+    def __init__(self, messages: list[str | bytes]) -> None:
+        self._queue: asyncio.Queue[str | bytes | None] = asyncio.Queue()
+        for message in messages:
+            self._queue.put_nowait(message)
+        self.closed = False
+        self.close_code: int | None = None
+        self.sent: list[str] = []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> _MockMessage:
+        message = await self._queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return _MockMessage(message)
+
+    async def send_str(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def close(self) -> None:
+        self.closed = True
+        self.close_code = 1000
+        self._queue.put_nowait(None)
+
+
+class _MockSession:
+    def __init__(self, ws: _MockWebSocket) -> None:
+        self.ws = ws
+
+    async def ws_connect(self, url: str, **kwargs) -> _MockWebSocket:
+        return self.ws
+
+
+async def test_transport_dispatches_callbacks_on_the_event_loop() -> None:
+    """Frames should reach callbacks on the loop and sends should not use executors."""
+    ws = _MockWebSocket(['{"id": 1}', '{"id": 2}', b'{"id": 3}'])
+    loop = asyncio.get_running_loop()
+    events: list[tuple[str, object]] = []
+
+    def _on_open(transport) -> None:
+        events.append(("open", asyncio.get_running_loop() is loop))
+
+    def _on_message(transport, msg: str | bytes) -> None:
+        events.append(("message", msg))
+
+    def _on_close(transport, code, msg) -> None:
+        events.append(("close", code))
+
+    def _on_error(transport, error) -> None:
+        events.append(("error", error))
+
+    transport = AtreaWebsocketTransport(
+        _MockSession(ws),
+        "ws://192.0.2.10/api/ws",
+        on_open=_on_open,
+        on_message=_on_message,
+        on_close=_on_close,
+        on_error=_on_error,
+    )
+
+    assert await transport.async_connect() is True
+    await transport.async_send('{"endpoint": "ui_info"}')
+    await asyncio.sleep(0)
+    await transport.async_close()
+
+    assert ws.sent == ['{"endpoint": "ui_info"}']
+    assert events == [
+        ("open", True),
+        ("message", '{"id": 1}'),
+        ("message", '{"id": 2}'),
+        ("message", b'{"id": 3}'),
+        ("close", 1000),
+    ]
+    assert transport.connected is False
+
+
+async def test_transport_send_raises_when_disconnected() -> None:
+    """Sending on a closed transport should raise a connection error."""
+    transport = AtreaWebsocketTransport(
+        _MockSession(_MockWebSocket([])),
+        "ws://192.0.2.10/api/ws",
+        on_open=lambda ws: None,
+        on_message=lambda ws, msg: None,
+        on_close=lambda ws, code, msg: None,
+        on_error=lambda ws, error: None,
+    )
+
+    with pytest.raises(ConnectionError):
+        await transport.async_send("{}")
+
+
+async def test_transport_handler_errors_do_not_report_transport_errors() -> None:
+    """A failing message handler should be logged without calling on_error."""
+    ws = _MockWebSocket(['{"id": 1}', '{"id": 2}'])
+    received: list[str] = []
+    errors: list[object] = []
+
+    def _on_message(transport, msg: str) -> None:
+        received.append(msg)
+        if len(received) == 1:
+            raise KeyError("bad payload")
+
+    transport = AtreaWebsocketTransport(
+        _MockSession(ws),
+        "ws://192.0.2.10/api/ws",
+        on_open=lambda ws: None,
+        on_message=_on_message,
+        on_close=lambda ws, code, msg: None,
+        on_error=lambda ws, error: errors.append(error),
+    )
+
+    assert await transport.async_connect() is True
+    await asyncio.sleep(0)
+    await transport.async_close()
+
+    assert received == ['{"id": 1}', '{"id": 2}']
+    assert errors == []